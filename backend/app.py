@@ -1,27 +1,58 @@
-from contextlib import asynccontextmanager
-from typing import Any, Callable, Coroutine
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from time import perf_counter
+from typing import Dict
 
-from fastapi import FastAPI, Request, Response
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.api import health as health_router
+from src.api import metrics as metrics_router
 from src.api.v1 import calls as calls_router
+from src.api.v1 import stats as stats_router
 from src.api.v1 import tags as tags_router
 from src.api.v1 import tasks as tasks_router
 from src.api.v1 import template_tasks as template_tasks_router
-from src.core.db import init_db
+from src.core.config import settings
+from src.core.db import close_db, create_event_relay, init_db, replicas, warm_pools
+from src.core.events import call_events
+from src.core.health import readiness
 from src.constants.api import API_PREFIX, ALLOWED_ORIGINS
+from src.utils.compression import CompressionMiddleware
 from src.utils.logger import logger
+from src.utils.metrics import MetricsMiddleware, metrics
 from src.utils.rate_limit import rate_limiter
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info('Starting Centriq API...')
-    init_db()
-    logger.info('Database initialized successfully')
+    started: float = perf_counter()
+    migrated: bool = await init_db()
+    migrated_at: float = perf_counter()
+    logger.info('Database initialized successfully in %.3fs (migrations %s)', migrated_at - started, 'applied' if migrated else 'skipped')
+    warmed_connections: Dict[str, int] = await warm_pools()
+    metrics.record_startup_phase('migrations', migrated_at - started)
+    metrics.record_startup_phase('pool_warmup', perf_counter() - migrated_at)
+    logger.info('Warmed connection pools: %s', warmed_connections)
+    replica_monitor: asyncio.Task | None = asyncio.create_task(replicas.monitor()) if len(replicas) else None
+    call_events.relay = create_event_relay(call_events)
+    event_listener: asyncio.Task | None = asyncio.create_task(call_events.relay.listen()) if call_events.relay else None
+    readiness.mark_ready(warmed_connections)
+    metrics.record_startup_phase('total', perf_counter() - started)
     logger.info('Centriq API started successfully')
     yield
     logger.info('Shutting down Centriq API...')
+    readiness.mark_stopping()
+    call_events.close()
+    for task in (replica_monitor, event_listener):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    call_events.relay = None
+    await close_db()
+    logger.close()
 
 
 app = FastAPI(title='Centriq API', lifespan=lifespan)
@@ -32,20 +63,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=['*'],
     allow_headers=['*'],
+    expose_headers=['ETag'],
 )
+app.add_middleware(CompressionMiddleware, minimum_size=settings.response_compression_min_bytes)
+app.add_middleware(MetricsMiddleware)
 
-
-@app.middleware('http')
-async def rate_limit_middleware(
-    request: Request,
-    call_next: Callable[[Request], Coroutine[Any, Any, Response]],
-) -> Response:
-    await rate_limiter(request)
-    response = await call_next(request)
-    return response
-
-
-app.include_router(tags_router.router, prefix=API_PREFIX, tags=['tags'])
-app.include_router(tasks_router.router, prefix=API_PREFIX, tags=['tasks'])
-app.include_router(template_tasks_router.router, prefix=API_PREFIX, tags=['template-tasks'])
-app.include_router(calls_router.router, prefix=API_PREFIX, tags=['calls'])
+app.include_router(metrics_router.router)
+app.include_router(health_router.router)
+app.include_router(tags_router.router, prefix=API_PREFIX, dependencies=[Depends(rate_limiter)], tags=['tags'])
+app.include_router(tasks_router.router, prefix=API_PREFIX, dependencies=[Depends(rate_limiter)], tags=['tasks'])
+app.include_router(template_tasks_router.router, prefix=API_PREFIX, dependencies=[Depends(rate_limiter)], tags=['template-tasks'])
+app.include_router(calls_router.router, prefix=API_PREFIX, dependencies=[Depends(rate_limiter)], tags=['calls'])
+app.include_router(stats_router.router, prefix=API_PREFIX, dependencies=[Depends(rate_limiter)], tags=['stats'])
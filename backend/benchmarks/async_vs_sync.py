@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from src.core.config import settings
+from src.models.call import Call
+from src.models.tag import Tag  # noqa: F401
+from src.models.task import Task  # noqa: F401
+
+PATH: str = '/calls'
+
+
+def _query():
+    return select(Call).options(selectinload(Call.tags)).order_by(Call.id.desc()).limit(50)
+
+
+def build_sync_app(pool_size: int, sslmode: str) -> FastAPI:
+    engine = create_engine(settings.database_url, pool_size=pool_size, max_overflow=0, connect_args={'sslmode': sslmode})
+    session_factory: sessionmaker = sessionmaker(bind=engine, autoflush=False)
+    app: FastAPI = FastAPI()
+
+    @app.get(PATH)
+    def list_calls() -> List[int]:
+        with session_factory() as db:
+            return [c.id for c in db.scalars(_query()).all()]
+
+    app.state.engine = engine
+    return app
+
+
+def build_async_app(pool_size: int, sslmode: str) -> FastAPI:
+    engine = create_async_engine(settings.database_url, pool_size=pool_size, max_overflow=0, connect_args={'sslmode': sslmode})
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    app: FastAPI = FastAPI()
+
+    @app.get(PATH)
+    async def list_calls() -> List[int]:
+        async with session_factory() as db:
+            return [c.id for c in (await db.scalars(_query())).all()]
+
+    app.state.engine = engine
+    return app
+
+
+async def drive(app: FastAPI, total: int, concurrency: int) -> tuple[float, List[float]]:
+    latencies: List[float] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://bench') as client:
+        async def worker() -> None:
+            while not queue.empty():
+                queue.get_nowait()
+                started: float = time.perf_counter()
+                response = await client.get(PATH)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        await client.get(PATH)
+        started: float = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed: float = time.perf_counter() - started
+
+    return elapsed, latencies
+
+
+def report(mode: str, elapsed: float, latencies: List[float]) -> None:
+    latencies.sort()
+    p50: float = statistics.median(latencies) * 1000
+    p99: float = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f'{mode:<6} {len(latencies) / elapsed:>10.1f} req/s   p50={p50:>8.2f}ms   p99={p99:>8.2f}ms')
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare the sync and async DB stacks at a fixed pool size.')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--pool-size', type=int, default=20)
+    parser.add_argument('--sslmode', default='prefer')
+    args = parser.parse_args()
+
+    print(f'requests={args.requests} concurrency={args.concurrency} pool_size={args.pool_size}')
+
+    sync_app: FastAPI = build_sync_app(args.pool_size, args.sslmode)
+    elapsed, latencies = await drive(sync_app, args.requests, args.concurrency)
+    sync_app.state.engine.dispose()
+    report('sync', elapsed, latencies)
+
+    async_app: FastAPI = build_async_app(args.pool_size, args.sslmode)
+    elapsed, latencies = await drive(async_app, args.requests, args.concurrency)
+    await async_app.state.engine.dispose()
+    report('async', elapsed, latencies)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from app import app
+from src.constants.api import API_PREFIX, NDJSON_CONTENT_TYPE
+from src.core.db import close_db
+
+
+def build_items(count: int, tag_ids: List[int]) -> List[Dict[str, Any]]:
+    return [
+        {
+            'name': f'Bench call {i}',
+            'description': f'Synthetic call #{i} generated by the bulk ingestion benchmark',
+            'tag_ids': random.sample(tag_ids, k=min(len(tag_ids), random.randint(0, 3))),
+        }
+        for i in range(count)
+    ]
+
+
+async def ensure_tags(client: httpx.AsyncClient, count: int) -> List[int]:
+    tag_ids: List[int] = [tag['id'] for tag in (await client.get('/v1/tags')).json()]
+    for i in range(len(tag_ids), count):
+        response = await client.post('/v1/tags', json={'name': f'bench-tag-{i}-{time.time_ns()}'})
+        response.raise_for_status()
+        tag_ids.append(response.json()['id'])
+    return tag_ids
+
+
+async def run_single(client: httpx.AsyncClient, items: List[Dict[str, Any]]) -> float:
+    started: float = time.perf_counter()
+    for item in items:
+        response = await client.post('/v1/calls', json=item)
+        response.raise_for_status()
+    return len(items) / (time.perf_counter() - started)
+
+
+async def run_bulk(client: httpx.AsyncClient, items: List[Dict[str, Any]], batch_size: int, ndjson: bool) -> float:
+    started: float = time.perf_counter()
+    for start in range(0, len(items), batch_size):
+        batch: List[Dict[str, Any]] = items[start:start + batch_size]
+        if ndjson:
+            body: bytes = '\n'.join(json.dumps(item) for item in batch).encode('utf-8')
+            response = await client.post('/v1/calls/bulk', content=body, headers={'content-type': NDJSON_CONTENT_TYPE})
+        else:
+            response = await client.post('/v1/calls/bulk', json=batch)
+        response.raise_for_status()
+        if response.json()['failed']:
+            raise RuntimeError(f'Bulk insert reported failures: {response.json()["failed"]}')
+    return len(items) / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure call ingestion throughput for single vs bulk inserts.')
+    parser.add_argument('--calls', type=int, default=50000)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--single-calls', type=int, default=50)
+    parser.add_argument('--tags', type=int, default=20)
+    args = parser.parse_args()
+
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url=f'http://bench{API_PREFIX}') as client:
+        tag_ids: List[int] = await ensure_tags(client, args.tags)
+
+        single_rate: float = await run_single(client, build_items(args.single_calls, tag_ids))
+        print(f'single POST /v1/calls      {single_rate:>10.0f} calls/s  ({args.single_calls} calls)')
+
+        json_rate: float = await run_bulk(client, build_items(args.calls, tag_ids), args.batch_size, ndjson=False)
+        print(f'bulk JSON  /v1/calls/bulk  {json_rate:>10.0f} calls/s  ({args.calls} calls, batch={args.batch_size})')
+
+        ndjson_rate: float = await run_bulk(client, build_items(args.calls, tag_ids), args.batch_size, ndjson=True)
+        print(f'bulk NDJSON /v1/calls/bulk {ndjson_rate:>10.0f} calls/s  ({args.calls} calls, batch={args.batch_size})')
+
+    await close_db()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
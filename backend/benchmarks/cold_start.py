@@ -0,0 +1,56 @@
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import orjson
+
+DEFAULT_MODES: List[str] = ['always', 'auto']
+PHASES: List[str] = ['import', 'migrations', 'pool_warmup', 'total']
+
+
+async def measure_worker() -> Dict[str, float]:
+    started: float = time.perf_counter()
+    from app import app
+    from src.core.health import readiness
+    from src.utils.metrics import metrics
+    imported: float = time.perf_counter() - started
+
+    async with app.router.lifespan_context(app):
+        assert readiness.is_ready
+        timings: Dict[str, float] = {phase: metrics.startup_seconds.value((phase,)) for phase in PHASES[1:]}
+    return {'import': imported, **timings, 'total': imported + timings['total']}
+
+
+def run_worker(mode: str) -> Dict[str, float]:
+    output: bytes = subprocess.check_output(
+        [sys.executable, '-m', 'benchmarks.cold_start', '--worker'],
+        env={**os.environ, 'DATABASE_MIGRATE_ON_STARTUP': mode, 'LOG_LEVEL': 'WARNING'},
+    )
+    return orjson.loads(output.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Time from a fresh interpreter to a ready worker, by startup migration mode.')
+    parser.add_argument('--modes', nargs='*', default=DEFAULT_MODES, choices=['always', 'auto', 'never'])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(orjson.dumps(asyncio.run(measure_worker())).decode())
+        return
+
+    print(f'runs={args.runs} (median ms per phase)')
+    print(f'{"mode":<10}' + ''.join(f'{phase:>13}' for phase in PHASES))
+    for mode in args.modes:
+        runs: List[Dict[str, float]] = [run_worker(mode) for _ in range(args.runs)]
+        print(f'{mode:<10}' + ''.join(f'{statistics.median(run[phase] for run in runs) * 1000:>13.1f}' for phase in PHASES))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+import argparse
+import asyncio
+import json
+import math
+import platform
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+from sqlalchemy import make_url
+
+from app import app
+from src.constants.api import API_PREFIX
+from src.constants.limits import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from src.core.config import settings
+from src.core.db import close_db
+from src.utils.query_counter import QueryCounter
+from src.utils.rate_limit import rate_limiter
+
+DEFAULT_BASELINE_PATH: Path = Path(__file__).parent / 'baselines' / 'endpoints.json'
+
+SEARCH_WORDS: List[str] = ['fire', 'flood', 'medical', 'storm', 'rescue']
+SEARCH_STREETS: List[str] = ['Elm St', 'Harbor Rd', 'Market St', 'Lake Dr']
+
+EndpointRequest = Tuple[str, Dict[str, Any] | None]
+
+
+def _pick(ids: List[int], i: int) -> int:
+    return ids[i % len(ids)]
+
+
+ENDPOINTS: Dict[str, Callable[[Dict[str, List[int]], int], EndpointRequest]] = {
+    'list_calls': lambda ids, i: ('/v1/calls', {'days': 7, 'limit': DEFAULT_PAGE_LIMIT}),
+    'get_call': lambda ids, i: (f'/v1/calls/{_pick(ids["call_ids"], i)}', None),
+    'get_call_tasks': lambda ids, i: (f'/v1/calls/{_pick(ids["call_ids"], i)}/tasks', None),
+    'get_tasks_for_calls': lambda ids, i: ('/v1/calls/tasks', {'call_ids': [_pick(ids['call_ids'], i + j) for j in range(50)]}),
+    'get_suggested_tasks': lambda ids, i: (f'/v1/tags/{_pick(ids["tag_ids"], i)}/suggested-tasks', None),
+    'get_call_suggested_tasks': lambda ids, i: (f'/v1/calls/{_pick(ids["call_ids"], i)}/suggested-tasks', None),
+    'get_tags_suggested_tasks': lambda ids, i: ('/v1/tags/suggested-tasks', {'tag_ids': [_pick(ids['tag_ids'], i + j) for j in range(3)]}),
+    'list_tags': lambda ids, i: ('/v1/tags', None),
+    'list_template_tasks': lambda ids, i: ('/v1/tasks/template', None),
+    'get_stats': lambda ids, i: ('/v1/stats', None),
+    'search_calls_rare': lambda ids, i: ('/v1/calls/search', {'q': f'reference {_pick(ids["call_ids"], i)}'}),
+    'search_calls_phrase': lambda ids, i: ('/v1/calls/search', {'q': f'{SEARCH_WORDS[i % len(SEARCH_WORDS)]} {SEARCH_STREETS[i % len(SEARCH_STREETS)]}'}),
+    'search_calls_common': lambda ids, i: ('/v1/calls/search', {'q': SEARCH_WORDS[i % len(SEARCH_WORDS)]}),
+}
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    return sorted_values[max(0, math.ceil(p * len(sorted_values)) - 1)]
+
+
+async def collect_ids(client: httpx.AsyncClient) -> Dict[str, List[int]]:
+    calls: Dict[str, Any] = (await client.get('/v1/calls', params={'days': 30, 'limit': MAX_PAGE_LIMIT})).json()
+    tags: List[Dict[str, Any]] = (await client.get('/v1/tags')).json()
+    ids: Dict[str, List[int]] = {'call_ids': [c['id'] for c in calls['items']], 'tag_ids': [t['id'] for t in tags]}
+    if not ids['call_ids'] or not ids['tag_ids']:
+        raise SystemExit('No calls or tags found, seed the database first: python seed_db.py')
+    return ids
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient,
+    build: Callable[[Dict[str, List[int]], int], EndpointRequest],
+    ids: Dict[str, List[int]],
+    requests: int,
+    concurrency: int,
+    counter: QueryCounter | None,
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors: int = 0
+    next_index: int = 0
+
+    async def worker() -> None:
+        nonlocal errors, next_index
+        while next_index < requests:
+            path, params = build(ids, next_index)
+            next_index += 1
+            started: float = time.perf_counter()
+            response: httpx.Response = await client.get(path, params=params)
+            latencies.append(time.perf_counter() - started)
+            errors += response.status_code >= 400
+
+    path, params = build(ids, 0)
+    (await client.get(path, params=params)).raise_for_status()
+    queries_before: int = counter.count if counter else 0
+    started: float = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed: float = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': requests,
+        'errors': errors,
+        'throughput_rps': round(requests / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'queries_per_request': round((counter.count - queries_before) / requests, 2) if counter else None,
+    }
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    regressions: List[str] = []
+    for name, result in results.items():
+        previous: Dict[str, Any] | None = baseline['endpoints'].get(name)
+        if previous is None:
+            regressions.append(f'{name}: no baseline, rerun with --save-baseline')
+            continue
+        if result['queries_per_request'] is not None and previous['queries_per_request'] is not None and result['queries_per_request'] > previous['queries_per_request']:
+            regressions.append(f'{name}: queries/request {previous["queries_per_request"]} -> {result["queries_per_request"]}')
+        if result['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+            regressions.append(f'{name}: p95 {previous["p95_ms"]}ms -> {result["p95_ms"]}ms')
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any] | None) -> None:
+    print(f'{"endpoint":<24} {"req/s":>9} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"queries":>8} {"errors":>7}')
+    for name, r in results.items():
+        line: str = f'{name:<24} {r["throughput_rps"]:>9.1f} {r["p50_ms"]:>9.2f} {r["p95_ms"]:>9.2f} {r["p99_ms"]:>9.2f} {str(r["queries_per_request"]):>8} {r["errors"]:>7}'
+        previous: Dict[str, Any] | None = baseline['endpoints'].get(name) if baseline else None
+        if previous:
+            line += f'   (baseline p95 {previous["p95_ms"]:.2f}ms, {previous["queries_per_request"]} queries)'
+        print(line)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Throughput, latency percentiles and query counts per endpoint.')
+    parser.add_argument('--base-url', default=None, help='benchmark a running server over HTTP instead of in-process')
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--endpoints', nargs='*', default=list(ENDPOINTS), choices=list(ENDPOINTS))
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative p95 increase before flagging a regression')
+    parser.add_argument('--label', default='', help='free-form description of the dataset, stored with the baseline')
+    args = parser.parse_args()
+
+    counter: QueryCounter | None = None
+    if args.base_url:
+        client: httpx.AsyncClient = httpx.AsyncClient(base_url=f'{args.base_url.rstrip("/")}{API_PREFIX}', timeout=60)
+    else:
+        app.dependency_overrides[rate_limiter] = lambda: None
+        counter = QueryCounter()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=f'http://bench{API_PREFIX}', timeout=60)
+
+    with counter or nullcontext():
+        async with client:
+            ids: Dict[str, List[int]] = await collect_ids(client)
+            results: Dict[str, Dict[str, Any]] = {
+                name: await run_endpoint(client, ENDPOINTS[name], ids, args.requests, args.concurrency, counter)
+                for name in args.endpoints
+            }
+
+    if counter:
+        await close_db()
+
+    baseline: Dict[str, Any] | None = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({
+            'meta': {
+                'mode': 'http' if args.base_url else 'in-process',
+                'database': make_url(settings.database_url).get_backend_name(),
+                'requests': args.requests,
+                'concurrency': args.concurrency,
+                'python': platform.python_version(),
+                'label': args.label,
+            },
+            'endpoints': results,
+        }, indent=2) + '\n')
+        print(f'Baseline written to {args.baseline}')
+    elif baseline:
+        regressions: List[str] = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, TextIO
+
+from src.constants.logger import LOG_FILE_DATE_FORMAT
+from src.utils.files import append_to_file
+from src.utils.logger import Logger, LogLevel, LogWriter
+
+
+def legacy_log(log_dir: str) -> Callable[[str], None]:
+    def log(message: str) -> None:
+        log_message: str = f'[{datetime.now().isoformat()}] [INFO] [app] {message}'
+        print(log_message)
+        append_to_file(os.path.join(log_dir, f'{datetime.now().strftime(LOG_FILE_DATE_FORMAT)}.log'), log_message)
+
+    return log
+
+
+def measure(name: str, log: Callable[[str], None], drain: Callable[[], None], iterations: int, devnull: TextIO) -> None:
+    with contextlib.redirect_stdout(devnull):
+        started: float = time.perf_counter()
+        for i in range(iterations):
+            log(f'Getting call details for id: {i}')
+        elapsed: float = time.perf_counter() - started
+        drain()
+        drained: float = time.perf_counter() - started
+    print(f'{name:<18} {elapsed / iterations * 1e6:>8.2f} us/call   total_with_drain={drained:>7.3f}s')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Per-call cost of the legacy synchronous logger vs the queued writer.')
+    parser.add_argument('--iterations', type=int, default=50000)
+    args = parser.parse_args()
+
+    print(f'iterations={args.iterations}')
+    with tempfile.TemporaryDirectory() as temp_dir, open(os.devnull, 'w') as devnull:
+        queued: Logger = Logger('app', writer=LogWriter(Path(temp_dir) / 'queued', stream=devnull))
+        filtered: Logger = Logger('app', min_level=LogLevel.INFO, writer=LogWriter(Path(temp_dir) / 'filtered', stream=devnull))
+
+        measure('legacy sync', legacy_log(os.path.join(temp_dir, 'legacy')), lambda: None, args.iterations, devnull)
+        measure('queued', queued.info, queued.close, args.iterations, devnull)
+        measure('filtered debug', lambda message: filtered.debug('%s', message), filtered.close, args.iterations, devnull)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from src.utils.metrics import AppMetrics, ASGIApp, Message, MetricsMiddleware, Receive, Scope, Send
+
+QUERIES_PER_REQUEST: int = 3
+
+
+def make_endpoint(app_metrics: AppMetrics) -> ASGIApp:
+    route: SimpleNamespace = SimpleNamespace(path='/api/v1/calls/{call_id}')
+
+    async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+        scope['route'] = route
+        for _ in range(QUERIES_PER_REQUEST):
+            app_metrics.record_query(0.0005)
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'{}'})
+
+    return endpoint
+
+
+async def measure(name: str, app: ASGIApp, iterations: int) -> float:
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(message: Message) -> None:
+        pass
+
+    started: float = time.perf_counter()
+    for _ in range(iterations):
+        scope: Dict[str, Any] = {'type': 'http', 'method': 'GET', 'path': '/api/v1/calls/1'}
+        await app(scope, receive, send)
+    per_request: float = (time.perf_counter() - started) / iterations
+    print(f'{name:<20} {per_request * 1e6:>8.2f} us/request')
+    return per_request
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Per-request cost of the metrics middleware and SQL hooks.')
+    parser.add_argument('--iterations', type=int, default=200000)
+    args = parser.parse_args()
+
+    baseline_metrics: AppMetrics = AppMetrics()
+    baseline_metrics.record_query = lambda seconds: None
+    bare: float = await measure('without metrics', make_endpoint(baseline_metrics), args.iterations)
+
+    app_metrics: AppMetrics = AppMetrics()
+    instrumented: float = await measure('with metrics', MetricsMiddleware(make_endpoint(app_metrics), app_metrics), args.iterations)
+    print(f'overhead             {(instrumented - bare) * 1e6:>8.2f} us/request ({QUERIES_PER_REQUEST} queries)')
+
+    started: float = time.perf_counter()
+    body: str = app_metrics.render()
+    print(f'render               {(time.perf_counter() - started) * 1e3:>8.2f} ms ({len(body)} bytes)')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app import app
+from benchmarks.endpoints import ENDPOINTS, collect_ids, percentile
+from src.constants.api import API_PREFIX
+from src.core.config import Settings, settings
+from src.core.db import create_instrumented_async_engine, create_session_factory, get_session_factory
+from src.utils.metrics import metrics
+from src.utils.rate_limit import rate_limiter
+
+DEFAULT_CONFIGS: List[str] = ['5:10', '5:10:noping', '10:0', '20:0', '50:0', '20:0:noping:lifo']
+DEFAULT_ENDPOINTS: List[str] = ['list_calls', 'get_call', 'get_tasks_for_calls', 'list_tags']
+
+
+def parse_config(spec: str) -> Settings:
+    size, overflow, *flags = spec.split(':')
+    return settings.model_copy(update={
+        'database_pool_size': int(size),
+        'database_max_overflow': int(overflow),
+        'database_pool_pre_ping': 'noping' not in flags,
+        'database_pool_use_lifo': 'lifo' in flags,
+    })
+
+
+async def run_config(spec: str, endpoints: List[str], requests: int, concurrency: int) -> Dict[str, Any]:
+    engine: AsyncEngine = create_instrumented_async_engine(settings.database_url, parse_config(spec))
+    session_factory = create_session_factory(engine)
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    latencies: List[float] = []
+    errors: int = 0
+    next_index: int = 0
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=f'http://bench{API_PREFIX}', timeout=120) as client:
+        ids: Dict[str, List[int]] = await collect_ids(client)
+
+        async def worker() -> None:
+            nonlocal errors, next_index
+            while next_index < requests:
+                index: int = next_index
+                next_index += 1
+                path, params = ENDPOINTS[endpoints[index % len(endpoints)]](ids, index)
+                started: float = time.perf_counter()
+                response: httpx.Response = await client.get(path, params=params)
+                latencies.append(time.perf_counter() - started)
+                errors += response.status_code >= 400
+
+        waits_before: int = metrics.db_pool_checkout_wait.count()
+        wait_seconds_before: float = metrics.db_pool_checkout_wait.sum()
+        timeouts_before: float = metrics.db_pool_timeouts_total.value()
+        started: float = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed: float = time.perf_counter() - started
+
+    peak_connections: int = engine.pool.size() + max(engine.pool.overflow(), 0)
+    await engine.dispose()
+    app.dependency_overrides.pop(get_session_factory)
+
+    checkouts: int = metrics.db_pool_checkout_wait.count() - waits_before
+    latencies.sort()
+    return {
+        'throughput_rps': requests / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'mean_checkout_wait_ms': (metrics.db_pool_checkout_wait.sum() - wait_seconds_before) / max(checkouts, 1) * 1000,
+        'pool_timeouts': int(metrics.db_pool_timeouts_total.value() - timeouts_before),
+        'connections': peak_connections,
+        'errors': errors,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Throughput, latency and pool checkout wait across pool configurations.')
+    parser.add_argument('--configs', nargs='*', default=DEFAULT_CONFIGS, help='size:overflow[:noping][:lifo]')
+    parser.add_argument('--endpoints', nargs='*', default=DEFAULT_ENDPOINTS, choices=list(ENDPOINTS))
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=100)
+    args = parser.parse_args()
+
+    app.dependency_overrides[rate_limiter] = lambda: None
+    print(f'requests={args.requests} concurrency={args.concurrency} endpoints={",".join(args.endpoints)}')
+    print(f'{"pool":<20} {"req/s":>9} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"wait ms":>9} {"timeouts":>9} {"conns":>6} {"errors":>7}')
+    for spec in args.configs:
+        r: Dict[str, Any] = await run_config(spec, args.endpoints, args.requests, args.concurrency)
+        print(
+            f'{spec:<20} {r["throughput_rps"]:>9.1f} {r["p50_ms"]:>9.2f} {r["p95_ms"]:>9.2f} {r["p99_ms"]:>9.2f} '
+            f'{r["mean_checkout_wait_ms"]:>9.2f} {r["pool_timeouts"]:>9} {r["connections"]:>6} {r["errors"]:>7}'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import app
+from benchmarks.bulk_ingest import build_items, ensure_tags
+from src.constants.api import API_PREFIX
+from src.core.db import async_engine, close_db, run_migrations
+from src.utils.query_plans import find_unindexed_scans, is_explainable
+
+
+async def seed(client: httpx.AsyncClient, calls: int, tags: int, templates: int) -> Dict[str, List[int]]:
+    tag_ids: List[int] = await ensure_tags(client, tags)
+    items = build_items(calls, tag_ids)
+    call_ids: List[int] = []
+    for start in range(0, len(items), 1000):
+        response = await client.post('/v1/calls/bulk', json=items[start:start + 1000])
+        response.raise_for_status()
+        call_ids.extend(item['id'] for item in response.json()['items'] if item['id'] is not None)
+
+    task_ids: List[int] = []
+    for i in range(templates):
+        response = await client.post('/v1/tasks/template', json={'name': f'plan-template-{i}', 'type': 'template', 'tag_ids': tag_ids[i % len(tag_ids):][:2]})
+        response.raise_for_status()
+        task_ids.append(response.json()['id'])
+        (await client.post(f'/v1/tasks/template/{task_ids[-1]}/link', params={'call_id': call_ids[i]})).raise_for_status()
+        response = await client.post('/v1/tasks', json={'name': f'plan-ad-hoc-{i}', 'type': 'ad_hoc', 'call_id': call_ids[i], 'status': 'open'})
+        response.raise_for_status()
+
+    return {'call_ids': call_ids, 'tag_ids': tag_ids, 'task_ids': task_ids}
+
+
+async def exercise(client: httpx.AsyncClient, ids: Dict[str, List[int]]) -> None:
+    call_id: int = ids['call_ids'][0]
+    page = (await client.get('/v1/calls', params={'days': 30, 'limit': 50})).json()
+    requests: List[tuple] = [
+        ('GET', '/v1/calls', {'days': 30, 'limit': 50, 'cursor': page['next_cursor']}),
+        ('GET', f'/v1/calls/{call_id}', None),
+        ('GET', f'/v1/calls/{call_id}/tasks', None),
+        ('GET', '/v1/calls/tasks', {'call_ids': ids['call_ids'][:20]}),
+        ('GET', '/v1/calls/export', {'start': (datetime.now() - timedelta(days=1)).isoformat()}),
+        ('GET', '/v1/tasks', None),
+        ('GET', '/v1/tasks/template', None),
+        ('GET', '/v1/tags', None),
+        ('GET', f'/v1/tags/{ids["tag_ids"][0]}/suggested-tasks', None),
+        ('PATCH', f'/v1/calls/{call_id}', {'name': 'plan-check', 'tag_ids': ids['tag_ids'][:2]}),
+        ('DELETE', f'/v1/tasks/{ids["task_ids"][-1]}', None),
+    ]
+    for method, path, params in requests:
+        if method == 'PATCH':
+            response = await client.patch(path, json=params)
+        else:
+            response = await client.request(method, path, params=params)
+        response.raise_for_status()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Seed the database, run the API read/write paths and EXPLAIN every statement they issue.')
+    parser.add_argument('--calls', type=int, default=5000)
+    parser.add_argument('--tags', type=int, default=20)
+    parser.add_argument('--templates', type=int, default=20)
+    args = parser.parse_args()
+
+    async with async_engine.begin() as connection:
+        await connection.run_sync(run_migrations)
+
+    statements: Dict[str, Any] = {}
+
+    def record(conn, cursor, statement: str, parameters: Any, context, executemany: bool) -> None:
+        if not executemany and is_explainable(statement):
+            statements.setdefault(statement, parameters)
+
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url=f'http://bench{API_PREFIX}') as client:
+        ids: Dict[str, List[int]] = await seed(client, args.calls, args.tags, args.templates)
+        event.listen(Engine, 'before_cursor_execute', record)
+        try:
+            await exercise(client, ids)
+        finally:
+            event.remove(Engine, 'before_cursor_execute', record)
+
+    unindexed: int = 0
+    async with async_engine.begin() as connection:
+        for statement, parameters in statements.items():
+            scans: List[str] = await connection.run_sync(find_unindexed_scans, statement, parameters)
+            unindexed += bool(scans)
+            print(f'{"SCAN" if scans else "ok  "}  {" ".join(statement.split())[:140]}')
+            for scan in scans:
+                print(f'        {scan}')
+
+    await close_db()
+    print(f'{len(statements)} statements, {unindexed} with unindexed filters')
+    if unindexed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from typing import Callable, Deque, Dict, List
+
+from src.constants.api import RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW_SECONDS
+from src.utils.rate_limit import InMemoryRateLimitStore, RateLimit, RateLimitStore, SQLiteRateLimitStore
+
+
+def legacy_sliding_window() -> Callable[[str, float], bool]:
+    requests_log: Dict[str, Deque[float]] = {}
+
+    def acquire(key: str, now: float) -> bool:
+        bucket: Deque[float] = requests_log.setdefault(key, deque())
+        while bucket and now - bucket[0] > RATE_LIMIT_WINDOW_SECONDS:
+            bucket.popleft()
+        if len(bucket) >= RATE_LIMIT_MAX_REQUESTS:
+            return False
+        bucket.append(now)
+        return True
+
+    return acquire
+
+
+def gcra(store: RateLimitStore) -> Callable[[str, float], bool]:
+    limit: RateLimit = RateLimit(RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW_SECONDS)
+
+    def acquire(key: str, now: float) -> bool:
+        return store.acquire(key, limit, now) == 0
+
+    return acquire
+
+
+def measure(name: str, factory: Callable[[], Callable[[str, float], bool]], keys: List[str], iterations: int) -> None:
+    acquire: Callable[[str, float], bool] = factory()
+    started: float = time.perf_counter()
+    for i in range(iterations):
+        acquire(keys[i % len(keys)], time.time())
+    elapsed: float = time.perf_counter() - started
+
+    tracemalloc.start()
+    acquire = factory()
+    for i in range(iterations):
+        acquire(keys[i % len(keys)], time.time())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{name:<16} {elapsed / iterations * 1e6:>8.2f} us/request   peak={peak / 1024:>10.1f} KiB')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Per-request overhead of the rate limiter backends.')
+    parser.add_argument('--iterations', type=int, default=200000)
+    parser.add_argument('--keys', type=int, default=10000)
+    args = parser.parse_args()
+
+    keys: List[str] = [f'10.0.{i // 256 % 256}.{i % 256}:GET /api/v1/calls/{i}' for i in range(args.keys)]
+    print(f'iterations={args.iterations} distinct_keys={args.keys}')
+
+    measure('legacy deque', legacy_sliding_window, keys, args.iterations)
+    measure('gcra memory', lambda: gcra(InMemoryRateLimitStore()), keys, args.iterations)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path: str = os.path.join(temp_dir, 'rate_limits.sqlite3')
+        measure('gcra sqlite', lambda: gcra(SQLiteRateLimitStore(path)), keys, args.iterations // 10)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import gzip
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+import brotli
+import httpx
+import msgpack
+import orjson
+from fastapi import Depends, FastAPI, Response
+
+from benchmarks.serialization import make_calls, trusted_page
+from src.constants.api import ListLayout
+from src.schemas.call import NormalizedCallListPage
+from src.utils.compression import CompressionMiddleware
+from src.utils.responses import negotiate_response_class
+
+FORMATS: Dict[str, Tuple[str, Callable[[bytes], Any]]] = {
+    'json': ('application/json', orjson.loads),
+    'msgpack': ('application/msgpack', lambda body: msgpack.unpackb(body, timestamp=3)),
+}
+ENCODINGS: Dict[str, Callable[[bytes], bytes]] = {
+    'identity': lambda body: body,
+    'gzip': gzip.decompress,
+    'br': brotli.decompress,
+}
+
+
+def build_app(calls: List[SimpleNamespace], minimum_size: int) -> FastAPI:
+    app: FastAPI = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+
+    @app.get('/calls')
+    async def list_calls(layout: ListLayout = ListLayout.NESTED, response_type: Type[Response] = Depends(negotiate_response_class)) -> Response:
+        page = trusted_page(calls)
+        return response_type(NormalizedCallListPage.from_page(page) if layout == ListLayout.NORMALIZED else page)
+
+    return app
+
+
+async def fetch(client: httpx.AsyncClient, layout: str, accept: str, encoding: str) -> bytes:
+    async with client.stream('GET', '/calls', params={'layout': layout}, headers={'Accept': accept, 'Accept-Encoding': encoding}) as response:
+        return b''.join([chunk async for chunk in response.aiter_raw()])
+
+
+async def run(calls: int, tags_per_call: int, requests: int, minimum_size: int) -> None:
+    rows: List[SimpleNamespace] = make_calls(calls, tags_per_call)
+    print(f'calls={calls} tags_per_call={tags_per_call} requests={requests}')
+    print(f'{"format":<10} {"layout":<11} {"encoding":<9} {"KiB":>9} {"request ms":>11} {"client parse ms":>16}')
+
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=build_app(rows, minimum_size))
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        for format_name, (accept, parse) in FORMATS.items():
+            for layout in ListLayout:
+                for encoding, decompress in ENCODINGS.items():
+                    body: bytes = await fetch(client, layout.value, accept, encoding)
+                    started: float = time.perf_counter()
+                    for _ in range(requests):
+                        await fetch(client, layout.value, accept, encoding)
+                    request_ms: float = (time.perf_counter() - started) / requests * 1000
+
+                    started = time.perf_counter()
+                    for _ in range(requests):
+                        parse(decompress(body))
+                    parse_ms: float = (time.perf_counter() - started) / requests * 1000
+                    print(f'{format_name:<10} {layout.value:<11} {encoding:<9} {len(body) / 1024:>9.1f} {request_ms:>11.2f} {parse_ms:>16.2f}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Bytes on the wire, request time and client decode time per response format, list layout and encoding.')
+    parser.add_argument('--calls', type=int, default=500)
+    parser.add_argument('--tags-per-call', type=int, default=3)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--minimum-size', type=int, default=1024)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.tags_per_call, args.requests, args.minimum_size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, List
+
+import httpx
+from fastapi import FastAPI
+
+from src.schemas.call import CallListItem, CallListPage
+from src.schemas.tag import TagRead
+from src.utils.responses import FastJSONResponse
+
+
+def make_calls(count: int, tags_per_call: int) -> List[SimpleNamespace]:
+    now: datetime = datetime.now()
+    tags: List[SimpleNamespace] = [
+        SimpleNamespace(id=i, name=f'tag {i}', created_at=now, updated_at=now, is_active=True, color_id=i % 8)
+        for i in range(50)
+    ]
+    return [
+        SimpleNamespace(
+            id=i,
+            name=f'call {i}',
+            description=f'description for call {i}',
+            created_at=now - timedelta(seconds=i),
+            updated_at=now - timedelta(seconds=i),
+            tags=[tags[(i + j) % len(tags)] for j in range(tags_per_call)],
+        )
+        for i in range(count)
+    ]
+
+
+def validated_page(calls: List[SimpleNamespace]) -> CallListPage:
+    return CallListPage(
+        items=[
+            CallListItem(
+                id=call.id,
+                name=call.name,
+                created_at=call.created_at,
+                updated_at=call.updated_at,
+                description=call.description,
+                tags=[
+                    TagRead(id=t.id, name=t.name, created_at=t.created_at, updated_at=t.updated_at, is_active=t.is_active, color_id=t.color_id)
+                    for t in call.tags
+                ],
+            )
+            for call in calls
+        ],
+        next_cursor=None,
+    )
+
+
+def trusted_page(calls: List[SimpleNamespace]) -> CallListPage:
+    return CallListPage(items=[CallListItem.from_model(call) for call in calls], next_cursor=None)
+
+
+def build_app(calls: List[SimpleNamespace]) -> FastAPI:
+    app: FastAPI = FastAPI()
+
+    @app.get('/validated', response_model=CallListPage)
+    async def validated() -> CallListPage:
+        return validated_page(calls)
+
+    @app.get('/fast', response_model=CallListPage, response_class=FastJSONResponse)
+    async def fast() -> FastJSONResponse:
+        return FastJSONResponse(trusted_page(calls))
+
+    return app
+
+
+async def measure(name: str, client: httpx.AsyncClient, path: str, requests: int) -> None:
+    await client.get(path)
+    started: float = time.process_time()
+    size: int = 0
+    for _ in range(requests):
+        response: httpx.Response = await client.get(path)
+        size = len(response.content)
+    elapsed: float = time.process_time() - started
+    print(f'{name:<22} {elapsed / requests * 1000:>8.1f} ms CPU/response   body={size / 1024:>8.1f} KiB')
+
+
+def measure_step(name: str, step: Callable[[], object], requests: int) -> None:
+    started: float = time.process_time()
+    for _ in range(requests):
+        step()
+    print(f'  {name:<20} {(time.process_time() - started) / requests * 1000:>8.1f} ms CPU')
+
+
+async def run(calls: int, tags_per_call: int, requests: int) -> None:
+    rows: List[SimpleNamespace] = make_calls(calls, tags_per_call)
+    print(f'calls={calls} tags_per_call={tags_per_call} requests={requests}')
+
+    measure_step('validated build', lambda: validated_page(rows), requests)
+    measure_step('trusted build', lambda: trusted_page(rows), requests)
+
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=build_app(rows))
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        await measure('validated + JSON', client, '/validated', requests)
+        await measure('trusted + orjson', client, '/fast', requests)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='CPU time per list response for validated vs trusted serialization.')
+    parser.add_argument('--calls', type=int, default=10000)
+    parser.add_argument('--tags-per-call', type=int, default=3)
+    parser.add_argument('--requests', type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.tags_per_call, args.requests))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import app
+from benchmarks.endpoints import _pick, collect_ids, percentile
+from src.constants.api import API_PREFIX
+from src.core.db import close_db
+from src.utils.query_counter import QueryCounter
+from src.utils.rate_limit import rate_limiter
+
+WriteRequest = Tuple[str, str, Dict[str, Any]]
+
+STATUSES: List[str] = ['in_progress', 'completed', 'open']
+
+WRITE_ENDPOINTS: Dict[str, Callable[[Dict[str, List[int]], int, str], WriteRequest]] = {
+    'create_call': lambda ids, i, run: ('POST', '/v1/calls', {'json': {'name': f'bench call {run}-{i}', 'tag_ids': ids['tag_ids'][:2]}}),
+    'update_call': lambda ids, i, run: ('PATCH', f'/v1/calls/{_pick(ids["call_ids"], i)}', {'json': {'name': f'bench call {run}-{i}', 'tag_ids': [_pick(ids['tag_ids'], i)]}}),
+    'create_tag': lambda ids, i, run: ('POST', '/v1/tags', {'json': {'name': f'bench tag {run}-{i}', 'color_id': i % 8}}),
+    'update_tag': lambda ids, i, run: ('PATCH', f'/v1/tags/{_pick(ids["tag_ids"], i)}', {'json': {'name': f'bench renamed tag {run}-{i}', 'color_id': i % 8}}),
+    'create_ad_hoc_task': lambda ids, i, run: ('POST', '/v1/tasks', {'json': {'name': f'bench task {run}-{i}', 'type': 'ad_hoc', 'call_id': ids['call_ids'][0], 'status': 'open'}}),
+    'update_task_status': lambda ids, i, run: ('PATCH', f'/v1/tasks/{ids["ad_hoc_ids"][0]}', {'json': {'call_id': ids['call_ids'][0], 'status': STATUSES[i % len(STATUSES)]}}),
+    'create_template_task': lambda ids, i, run: ('POST', '/v1/tasks/template', {'json': {'name': f'bench template {run}-{i}', 'type': 'template', 'tag_ids': ids['tag_ids'][:2]}}),
+    'update_template_task': lambda ids, i, run: ('PATCH', f'/v1/tasks/template/{ids["template_ids"][0]}', {'json': {'name': f'bench template {run}-{i}', 'tag_ids': [_pick(ids['tag_ids'], i)]}}),
+    'link_template_task': lambda ids, i, run: ('POST', f'/v1/tasks/template/{ids["template_ids"][0]}/link', {'params': {'call_id': _pick(ids['call_ids'], i)}}),
+}
+
+
+class TransactionCounter:
+    def __init__(self):
+        self.begins: int = 0
+
+    def _begin(self, conn) -> None:
+        self.begins += 1
+
+    def __enter__(self) -> 'TransactionCounter':
+        event.listen(Engine, 'begin', self._begin)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(Engine, 'begin', self._begin)
+
+
+async def setup_ids(client: httpx.AsyncClient, run: str) -> Dict[str, List[int]]:
+    ids: Dict[str, List[int]] = await collect_ids(client)
+    templates: List[Dict[str, Any]] = (await client.get('/v1/tasks/template')).json()
+    if not templates:
+        templates = [(await client.post('/v1/tasks/template', json={'name': f'bench template {run}', 'type': 'template', 'tag_ids': ids['tag_ids'][:1]})).json()]
+    ids['template_ids'] = [template['id'] for template in templates]
+    task: Dict[str, Any] = (await client.post('/v1/tasks', json={'name': f'bench task {run}', 'type': 'ad_hoc', 'call_id': ids['call_ids'][0], 'status': 'open'})).json()
+    ids['ad_hoc_ids'] = [task['id']]
+    return ids
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient,
+    build: Callable[[Dict[str, List[int]], int, str], WriteRequest],
+    ids: Dict[str, List[int]],
+    requests: int,
+    run: str,
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors: int = 0
+    with QueryCounter() as queries, TransactionCounter() as transactions:
+        for i in range(requests):
+            method, path, kwargs = build(ids, i, run)
+            started: float = time.perf_counter()
+            response: httpx.Response = await client.request(method, path, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            errors += response.status_code >= 400
+
+    latencies.sort()
+    return {
+        'queries_per_request': queries.count / requests,
+        'transactions_per_request': transactions.begins / requests,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'errors': errors,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='SQL statements, transactions and latency per write endpoint. Writes to the configured database.')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--endpoints', nargs='*', default=list(WRITE_ENDPOINTS), choices=list(WRITE_ENDPOINTS))
+    args = parser.parse_args()
+
+    app.dependency_overrides[rate_limiter] = lambda: None
+    run: str = str(int(time.time()))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=f'http://bench{API_PREFIX}', timeout=60) as client:
+        ids: Dict[str, List[int]] = await setup_ids(client, run)
+        print(f'requests={args.requests}')
+        print(f'{"endpoint":<22} {"queries":>8} {"txns":>6} {"p50 ms":>9} {"p95 ms":>9} {"errors":>7}')
+        for name in args.endpoints:
+            r: Dict[str, Any] = await run_endpoint(client, WRITE_ENDPOINTS[name], ids, args.requests, run)
+            print(f'{name:<22} {r["queries_per_request"]:>8.2f} {r["transactions_per_request"]:>6.2f} {r["p50_ms"]:>9.2f} {r["p95_ms"]:>9.2f} {r["errors"]:>7}')
+    await close_db()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -1,4 +1,12 @@
-from src.core.db import init_db
+import asyncio
+
+from src.core.db import close_db, init_db
+
+
+async def main() -> None:
+    await init_db(mode='always')
+    await close_db()
+
 
 if __name__ == '__main__':
-    init_db()
+    asyncio.run(main())
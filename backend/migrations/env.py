@@ -0,0 +1,57 @@
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+
+from src.core.db import async_engine, include_in_autogenerate
+from src.models import call, catalog_version, rollups, tag, task  # noqa: F401
+from src.models.base import Base
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=async_engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        include_name=include_in_autogenerate,
+        literal_binds=True,
+        dialect_opts={'paramstyle': 'named'},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata, include_name=include_in_autogenerate)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    async with async_engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await async_engine.dispose()
+
+
+def run_migrations_online() -> None:
+    connection: Connection | None = config.attributes.get('connection')
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
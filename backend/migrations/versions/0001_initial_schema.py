@@ -0,0 +1,100 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+task_type: sa.Enum = sa.Enum('TEMPLATE', 'AD_HOC', name='tasktype')
+task_status: sa.Enum = sa.Enum('OPEN', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED', name='taskstatus')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'calls',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_calls_id'), 'calls', ['id'], unique=False)
+
+    op.create_table(
+        'tags',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('color_id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name'),
+    )
+    op.create_index(op.f('ix_tags_id'), 'tags', ['id'], unique=False)
+
+    op.create_table(
+        'tasks',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('type', task_type, nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_tasks_id'), 'tasks', ['id'], unique=False)
+
+    op.create_table(
+        'calls_tags',
+        sa.Column('call_id', sa.Integer(), nullable=False),
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['call_id'], ['calls.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('call_id', 'tag_id'),
+    )
+
+    op.create_table(
+        'calls_tasks',
+        sa.Column('call_id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('status', task_status, nullable=True),
+        sa.ForeignKeyConstraint(['call_id'], ['calls.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('call_id', 'task_id'),
+    )
+
+    op.create_table(
+        'tasks_tags',
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('task_id', 'tag_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('tasks_tags')
+    op.drop_table('calls_tasks')
+    op.drop_table('calls_tags')
+    op.drop_index(op.f('ix_tasks_id'), table_name='tasks')
+    op.drop_table('tasks')
+    op.drop_index(op.f('ix_tags_id'), table_name='tags')
+    op.drop_table('tags')
+    op.drop_index(op.f('ix_calls_id'), table_name='calls')
+    op.drop_table('calls')
+    task_status.drop(op.get_bind(), checkfirst=True)
+    task_type.drop(op.get_bind(), checkfirst=True)
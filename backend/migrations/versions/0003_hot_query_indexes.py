@@ -0,0 +1,49 @@
+"""hot query indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_calls_created_at_id', 'calls', ['created_at', 'id'], unique=False, if_not_exists=True)
+    op.create_index('ix_calls_tags_tag_id', 'calls_tags', ['tag_id'], unique=False)
+    op.create_index('ix_tasks_tags_tag_id', 'tasks_tags', ['tag_id'], unique=False)
+    op.create_index('ix_calls_tasks_task_id', 'calls_tasks', ['task_id'], unique=False)
+    op.create_index(
+        'ix_tasks_active',
+        'tasks',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('is_active IS true'),
+        sqlite_where=sa.text('is_active IS 1'),
+    )
+    op.create_index(
+        'ix_tasks_active_templates',
+        'tasks',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text("is_active IS true AND type = 'TEMPLATE'"),
+        sqlite_where=sa.text("is_active IS 1 AND type = 'TEMPLATE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_active_templates', table_name='tasks')
+    op.drop_index('ix_tasks_active', table_name='tasks')
+    op.drop_index('ix_calls_tasks_task_id', table_name='calls_tasks')
+    op.drop_index('ix_tasks_tags_tag_id', table_name='tasks_tags')
+    op.drop_index('ix_calls_tags_tag_id', table_name='calls_tags')
+    op.drop_index('ix_calls_created_at_id', table_name='calls')
@@ -0,0 +1,62 @@
+"""call search
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect: str = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute(
+            "ALTER TABLE calls ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+            ") STORED"
+        )
+        op.create_index('ix_calls_search_vector', 'calls', ['search_vector'], unique=False, postgresql_using='gin')
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE calls_fts USING fts5("
+            "name, description, content='calls', content_rowid='id', tokenize='porter unicode61')"
+        )
+        op.execute(
+            'CREATE TRIGGER calls_fts_insert AFTER INSERT ON calls BEGIN '
+            'INSERT INTO calls_fts (rowid, name, description) VALUES (new.id, new.name, new.description); '
+            'END'
+        )
+        op.execute(
+            'CREATE TRIGGER calls_fts_delete AFTER DELETE ON calls BEGIN '
+            "INSERT INTO calls_fts (calls_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description); "
+            'END'
+        )
+        op.execute(
+            'CREATE TRIGGER calls_fts_update AFTER UPDATE OF name, description ON calls BEGIN '
+            "INSERT INTO calls_fts (calls_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description); "
+            'INSERT INTO calls_fts (rowid, name, description) VALUES (new.id, new.name, new.description); '
+            'END'
+        )
+        op.execute("INSERT INTO calls_fts (calls_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect: str = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_calls_search_vector', table_name='calls')
+        op.drop_column('calls', 'search_vector')
+    elif dialect == 'sqlite':
+        op.execute('DROP TRIGGER calls_fts_update')
+        op.execute('DROP TRIGGER calls_fts_delete')
+        op.execute('DROP TRIGGER calls_fts_insert')
+        op.execute('DROP TABLE calls_fts')
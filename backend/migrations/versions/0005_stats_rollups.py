@@ -0,0 +1,56 @@
+"""stats rollups
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+task_status: sa.Enum = postgresql.ENUM('OPEN', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED', name='taskstatus', create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tag_call_daily_counts',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.Column('call_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('day', 'tag_id'),
+    )
+    op.create_table(
+        'task_status_daily_counts',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('status', task_status, nullable=False),
+        sa.Column('task_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'status'),
+    )
+    op.execute(
+        'INSERT INTO tag_call_daily_counts (day, tag_id, call_count) '
+        'SELECT date(calls.created_at), calls_tags.tag_id, count(*) '
+        'FROM calls_tags JOIN calls ON calls.id = calls_tags.call_id '
+        'GROUP BY date(calls.created_at), calls_tags.tag_id'
+    )
+    op.execute(
+        'INSERT INTO task_status_daily_counts (day, status, task_count) '
+        'SELECT date(calls.created_at), calls_tasks.status, count(*) '
+        'FROM calls_tasks JOIN calls ON calls.id = calls_tasks.call_id '
+        'WHERE calls_tasks.status IS NOT NULL '
+        'GROUP BY date(calls.created_at), calls_tasks.status'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('task_status_daily_counts')
+    op.drop_table('tag_call_daily_counts')
@@ -0,0 +1,20 @@
+import asyncio
+import time
+from typing import Dict
+
+from src.core.db import async_engine, close_db, init_db
+from src.core.rollups import rebuild_rollups
+
+
+async def main() -> None:
+    await init_db()
+    started: float = time.perf_counter()
+    async with async_engine.begin() as connection:
+        counts: Dict[str, int] = await connection.run_sync(rebuild_rollups)
+    await close_db()
+
+    print(f'✅ Rebuilt stats rollups in {time.perf_counter() - started:.1f}s: ' + ', '.join(f'{name}={count}' for name, count in counts.items()))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+import argparse
+import asyncio
+import time
+from typing import Dict
+
+from src.core.db import async_engine, close_db, init_db
+from src.core.seed import seed_database
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Bulk-generate synthetic calls, tags, tasks and their association rows.')
+    parser.add_argument('--calls', type=int, default=1000000)
+    parser.add_argument('--tags', type=int, default=500)
+    parser.add_argument('--template-tasks', type=int, default=5000)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--batch-size', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    await init_db()
+    started: float = time.perf_counter()
+    async with async_engine.begin() as connection:
+        counts: Dict[str, int] = await connection.run_sync(
+            seed_database,
+            calls=args.calls,
+            tags=args.tags,
+            template_tasks=args.template_tasks,
+            days=args.days,
+            batch_size=args.batch_size,
+            seed=args.seed,
+        )
+    await close_db()
+
+    print(f'✅ Done in {time.perf_counter() - started:.1f}s: ' + ', '.join(f'{name}={count}' for name, count in counts.items()))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
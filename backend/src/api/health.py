@@ -0,0 +1,21 @@
+from fastapi import APIRouter, status
+
+from src.constants.health import LIVENESS_PATH, READINESS_PATH
+from src.core.db import replicas
+from src.core.health import readiness
+from src.utils.responses import FastJSONResponse
+
+router = APIRouter()
+
+
+@router.get(LIVENESS_PATH, include_in_schema=False)
+async def get_liveness() -> FastJSONResponse:
+    return FastJSONResponse({'status': 'alive'})
+
+
+@router.get(READINESS_PATH, include_in_schema=False)
+async def get_readiness() -> FastJSONResponse:
+    return FastJSONResponse(
+        {'status': readiness.status.value, 'pools': readiness.warmed_connections, 'replicas': replicas.status()},
+        status_code=status.HTTP_200_OK if readiness.is_ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
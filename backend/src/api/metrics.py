@@ -0,0 +1,21 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+
+from src.constants.metrics import METRICS_CONTENT_TYPE, METRICS_PATH
+from src.core.config import settings
+from src.utils.metrics import metrics
+
+router = APIRouter()
+
+
+def require_metrics_access(authorization: str | None = Header(None)) -> None:
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if settings.metrics_token is not None and not secrets.compare_digest((authorization or '').encode(), f'Bearer {settings.metrics_token}'.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, headers={'WWW-Authenticate': 'Bearer'})
+
+
+@router.get(METRICS_PATH, include_in_schema=False, dependencies=[Depends(require_metrics_access)])
+async def get_metrics() -> Response:
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
@@ -1,89 +1,297 @@
-from typing import List
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Type
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 
-from src.core.exceptions import InvalidDaysLimitError, ItemNotFoundError
-from src.dal.dependencies import get_call_dal, get_task_dal
+from src.constants.api import CSV_CONTENT_TYPE, EVENT_STREAM_CONTENT_TYPE, NDJSON_CONTENT_TYPE, VARY_ACCEPT_HEADERS, ExportFormat, ListLayout
+from src.constants.events import EVENT_KEEPALIVE_SECONDS, EVENT_RECONNECT_MILLISECONDS
+from src.constants.limits import DEFAULT_PAGE_LIMIT, DEFAULT_SEARCH_LIMIT
+from src.core.exceptions import BulkLimitExceededError, InvalidBulkPayloadError, InvalidCallIdsError, InvalidCursorError, InvalidDateRangeError, InvalidDaysLimitError, InvalidPageLimitError, InvalidSearchQueryError, ItemNotFoundError
+from src.core.events import Subscription, call_events
+from src.dal.dependencies import get_call_dal, get_suggestion_dal, get_task_dal
 from src.dal.call_dal import CallDAL
+from src.dal.suggestion_dal import SuggestionDAL
 from src.dal.task_dal import TaskDAL
-from src.schemas.call import CallCreate, CallListItem, CallRead, CallUpdate
-from src.schemas.task import CallTaskRead
+from src.schemas.call import CallBulkCreateResult, CallBulkItemResult, CallCreate, CallListPage, CallRead, CallSearchPage, CallUpdate, NormalizedCallListPage
+from src.schemas.task import CallTaskLinkResult, CallTaskRead, CallTasksLink, SuggestedTaskRead
+from src.utils.bulk import parse_bulk_items, read_bulk_body
+from src.utils.export import to_csv, to_ndjson
 from src.utils.logger import logger
+from src.utils.responses import FastJSONResponse, negotiate_response_class
+from src.utils.sse import stream_events
 
 router: APIRouter = APIRouter(prefix='/v1/calls')
 
 
-@router.get('', response_model=List[CallListItem])
-def list_calls(
+@router.get('', response_model=CallListPage | NormalizedCallListPage, response_class=FastJSONResponse)
+async def list_calls(
     days: int = 7,
-    call_dal: CallDAL = Depends(get_call_dal)
-) -> List[CallListItem]:
+    limit: int = DEFAULT_PAGE_LIMIT,
+    cursor: str | None = None,
+    layout: ListLayout = ListLayout.NESTED,
+    call_dal: CallDAL = Depends(get_call_dal),
+    response_type: Type[Response] = Depends(negotiate_response_class)
+) -> Response:
     try:
-        logger.info(f'Listing calls with days filter: {days}')
-        result = call_dal.list_all_calls_with_tags(days=days)
-        logger.info(f'Successfully retrieved {len(result)} calls')
-        return result
+        logger.info('Listing calls with days filter: %s, limit: %s, cursor: %s, layout: %s', days, limit, cursor, layout.value)
+        result = await call_dal.list_all_calls_with_tags(days=days, limit=limit, cursor=cursor)
+        logger.info('Successfully retrieved %s calls', len(result.items))
+        if layout == ListLayout.NORMALIZED:
+            return response_type(NormalizedCallListPage.from_page(result), headers=VARY_ACCEPT_HEADERS)
+        return response_type(result, headers=VARY_ACCEPT_HEADERS)
     except InvalidDaysLimitError as e:
-        logger.error(f'Invalid days limit: {days}', exception=e)
+        logger.error('Invalid days limit: %s', days, exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except InvalidPageLimitError as e:
+        logger.error('Invalid page limit: %s', limit, exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except InvalidCursorError as e:
+        logger.error('Invalid cursor: %s', cursor, exception=e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post('', response_model=CallRead, status_code=status.HTTP_201_CREATED)
-def create_call(
+async def create_call(
     payload: CallCreate,
     call_dal: CallDAL = Depends(get_call_dal)
 ) -> CallRead:
     try:
-        logger.info(f'Creating call: name={payload.name}, tag_ids={payload.tag_ids}, description={payload.description}')
-        result = call_dal.create_call(payload.name, payload.tag_ids, payload.description)
-        logger.info(f'Successfully created call with id: {result.id}')
+        logger.info('Creating call: name=%s, tag_ids=%s, description=%s', payload.name, payload.tag_ids, payload.description)
+        result = await call_dal.create_call(payload.name, payload.tag_ids, payload.description)
+        logger.info('Successfully created call with id: %s', result.id)
         return result
     except ItemNotFoundError as e:
-        logger.error(f'Failed to create call: {payload.name}', exception=e)
+        logger.error('Failed to create call: %s', payload.name, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.post(
+    '/bulk',
+    response_model=CallBulkCreateResult,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/json': {'schema': {'type': 'array', 'items': {'$ref': '#/components/schemas/CallCreate'}}},
+                NDJSON_CONTENT_TYPE: {'schema': {'type': 'string'}},
+            },
+        },
+    },
+)
+async def bulk_create_calls(
+    request: Request,
+    call_dal: CallDAL = Depends(get_call_dal)
+) -> CallBulkCreateResult:
+    try:
+        items, errors = parse_bulk_items(await read_bulk_body(request), request.headers.get('content-type', ''), CallCreate)
+        logger.info('Bulk creating calls: valid=%s, invalid=%s', len(items), len(errors))
+        results: List[CallBulkItemResult] = await call_dal.bulk_create_calls(items)
+        results.extend(CallBulkItemResult(index=index, error=error) for index, error in errors)
+        results.sort(key=lambda r: r.index)
+        created: int = sum(1 for r in results if r.id is not None)
+        logger.info('Successfully bulk created %s calls, %s failed', created, len(results) - created)
+        return CallBulkCreateResult(created=created, failed=len(results) - created, items=results)
+    except InvalidBulkPayloadError as e:
+        logger.error('Invalid bulk calls payload', exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except BulkLimitExceededError as e:
+        logger.error('Bulk calls payload too large', exception=e)
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(e))
+
+
+@router.get('/export', response_class=StreamingResponse)
+async def export_calls(
+    format: ExportFormat = ExportFormat.NDJSON,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    call_dal: CallDAL = Depends(get_call_dal)
+) -> StreamingResponse:
+    try:
+        logger.info('Exporting calls: format=%s, start=%s, end=%s', format.value, start, end)
+        batches = call_dal.export_calls(start=start, end=end)
+    except InvalidDateRangeError as e:
+        logger.error('Invalid export date range: start=%s, end=%s', start, end, exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if format == ExportFormat.CSV:
+        content: AsyncIterator[str] | AsyncIterator[bytes] = to_csv(batches)
+        media_type: str = CSV_CONTENT_TYPE
+    else:
+        content = to_ndjson(batches)
+        media_type = NDJSON_CONTENT_TYPE
+
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={'Content-Disposition': f'attachment; filename="calls-export.{format.value}"'},
+    )
+
 
-@router.get('/{call_id}', response_model=CallRead)
-def get_call(
+@router.get('/search', response_model=CallSearchPage, response_class=FastJSONResponse)
+async def search_calls(
+    q: str,
+    tag_ids: List[int] | None = Query(None),
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    cursor: str | None = None,
+    call_dal: CallDAL = Depends(get_call_dal),
+    response_type: Type[Response] = Depends(negotiate_response_class)
+) -> Response:
+    try:
+        logger.info('Searching calls: q=%s, tag_ids=%s, start=%s, end=%s, limit=%s, cursor=%s', q, tag_ids, start, end, limit, cursor)
+        result = await call_dal.search_calls(q, tag_ids=tag_ids, start=start, end=end, limit=limit, cursor=cursor)
+        logger.info('Successfully found %s calls', len(result.items))
+        return response_type(result, headers=VARY_ACCEPT_HEADERS)
+    except InvalidSearchQueryError as e:
+        logger.error('Invalid search query: %s', q, exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except InvalidPageLimitError as e:
+        logger.error('Invalid page limit: %s', limit, exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except InvalidCursorError as e:
+        logger.error('Invalid cursor: %s', cursor, exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except InvalidDateRangeError as e:
+        logger.error('Invalid search date range: start=%s, end=%s', start, end, exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get('/tasks', response_model=Dict[int, List[CallTaskRead]], response_class=FastJSONResponse)
+async def get_tasks_for_calls(
+    call_ids: List[int] = Query(...),
+    task_dal: TaskDAL = Depends(get_task_dal)
+) -> FastJSONResponse:
+    try:
+        logger.info('Getting tasks for calls: count=%s', len(call_ids))
+        result = await task_dal.get_tasks_by_call_ids(call_ids)
+        logger.info('Successfully retrieved %s tasks for %s calls', sum(len(tasks) for tasks in result.values()), len(result))
+        return FastJSONResponse(result)
+    except InvalidCallIdsError as e:
+        logger.error('Invalid call ids: count=%s', len(call_ids), exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get('/stream', response_class=StreamingResponse)
+async def stream_call_events() -> StreamingResponse:
+    subscription: Subscription = call_events.subscribe()
+    logger.info('Opened call event stream, %s clients connected', len(call_events))
+    return StreamingResponse(
+        stream_events(call_events, subscription, EVENT_KEEPALIVE_SECONDS, EVENT_RECONNECT_MILLISECONDS),
+        media_type=EVENT_STREAM_CONTENT_TYPE,
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@router.get('/{call_id}', response_model=CallRead, response_class=FastJSONResponse)
+async def get_call(
     call_id: int,
     call_dal: CallDAL = Depends(get_call_dal)
-) -> CallRead:
+) -> FastJSONResponse:
     try:
-        logger.info(f'Getting call details for id: {call_id}')
-        result = call_dal.get_call_details(call_id)
-        logger.info(f'Successfully retrieved call: {result.name}')
-        return result
+        logger.info('Getting call details for id: %s', call_id)
+        result = await call_dal.get_call_details(call_id)
+        logger.info('Successfully retrieved call: %s', result.name)
+        return FastJSONResponse(result)
     except ItemNotFoundError as e:
-        logger.error(f'Call not found: id={call_id}', exception=e)
+        logger.error('Call not found: id=%s', call_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.patch('/{call_id}', response_model=CallRead)
-def update_call(
+async def update_call(
     call_id: int,
     payload: CallUpdate,
     call_dal: CallDAL = Depends(get_call_dal)
 ) -> CallRead:
     try:
-        logger.info(f'Updating call: id={call_id}, name={payload.name}, tag_ids={payload.tag_ids}, description={payload.description}')
-        result = call_dal.update_call_and_tags(call_id, payload.name, payload.description, payload.tag_ids)
-        logger.info(f'Successfully updated call: {result.name}')
+        logger.info('Updating call: id=%s, name=%s, tag_ids=%s, description=%s', call_id, payload.name, payload.tag_ids, payload.description)
+        result = await call_dal.update_call_and_tags(call_id, payload.name, payload.description, payload.tag_ids)
+        logger.info('Successfully updated call: %s', result.name)
+        return result
+    except ItemNotFoundError as e:
+        logger.error('Call not found for update: id=%s', call_id, exception=e)
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get('/{call_id}/tasks', response_model=List[CallTaskRead], response_class=FastJSONResponse)
+async def get_call_tasks(
+    call_id: int,
+    task_dal: TaskDAL = Depends(get_task_dal)
+) -> FastJSONResponse:
+    try:
+        logger.info('Getting tasks for call: id=%s', call_id)
+        result = await task_dal.get_all_tasks_by_call_id(call_id)
+        logger.info('Successfully retrieved %s tasks for call: %s', len(result), call_id)
+        return FastJSONResponse(result)
+    except ItemNotFoundError as e:
+        logger.error('Call not found when getting tasks: id=%s', call_id, exception=e)
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get('/{call_id}/suggested-tasks', response_model=List[SuggestedTaskRead], response_class=FastJSONResponse)
+async def get_call_suggested_tasks(
+    call_id: int,
+    suggestion_dal: SuggestionDAL = Depends(get_suggestion_dal)
+) -> FastJSONResponse:
+    try:
+        logger.info('Getting suggested tasks for call: id=%s', call_id)
+        result = await suggestion_dal.suggest_for_call(call_id)
+        logger.info('Successfully retrieved %s suggested tasks for call: %s', len(result), call_id)
+        return FastJSONResponse(result)
+    except ItemNotFoundError as e:
+        logger.error('Call not found when getting suggested tasks: id=%s', call_id, exception=e)
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post('/{call_id}/tasks/link', response_model=CallTaskLinkResult)
+async def link_template_tasks_to_call(
+    call_id: int,
+    payload: CallTasksLink,
+    task_dal: TaskDAL = Depends(get_task_dal)
+) -> CallTaskLinkResult:
+    try:
+        logger.info('Linking template tasks to call: call_id=%s, task_ids=%s', call_id, payload.task_ids)
+        result = await task_dal.link_template_tasks_to_call(call_id, payload.task_ids)
+        logger.info('Successfully linked %s template tasks to call %s', len(result.links), call_id)
+        return result
+    except ItemNotFoundError as e:
+        logger.error('Call not found when linking template tasks: id=%s', call_id, exception=e)
+        raise HTTPException(status_code=404, detail=str(e))
+    except BulkLimitExceededError as e:
+        logger.error('Too many template tasks to link to call: id=%s', call_id, exception=e)
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(e))
+
+
+@router.post('/{call_id}/tasks/unlink', response_model=CallTaskLinkResult)
+async def unlink_template_tasks_from_call(
+    call_id: int,
+    payload: CallTasksLink,
+    task_dal: TaskDAL = Depends(get_task_dal)
+) -> CallTaskLinkResult:
+    try:
+        logger.info('Unlinking template tasks from call: call_id=%s, task_ids=%s', call_id, payload.task_ids)
+        result = await task_dal.unlink_template_tasks_from_call(call_id, payload.task_ids)
+        logger.info('Successfully unlinked %s template tasks from call %s', len(result.links), call_id)
         return result
     except ItemNotFoundError as e:
-        logger.error(f'Call not found for update: id={call_id}', exception=e)
+        logger.error('Call not found when unlinking template tasks: id=%s', call_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
+    except BulkLimitExceededError as e:
+        logger.error('Too many template tasks to unlink from call: id=%s', call_id, exception=e)
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(e))
 
 
-@router.get('/{call_id}/tasks', response_model=List[CallTaskRead])
-def get_call_tasks(
+@router.post('/{call_id}/suggested-tasks/apply', response_model=CallTaskLinkResult)
+async def apply_call_suggested_tasks(
     call_id: int,
     task_dal: TaskDAL = Depends(get_task_dal)
-) -> List[CallTaskRead]:
+) -> CallTaskLinkResult:
     try:
-        logger.info(f'Getting tasks for call: id={call_id}')
-        result = task_dal.get_all_tasks_by_call_id(call_id)
-        logger.info(f'Successfully retrieved {len(result)} tasks for call: {call_id}')
+        logger.info('Applying suggested tasks to call: id=%s', call_id)
+        result = await task_dal.link_suggested_tasks_to_call(call_id)
+        logger.info('Successfully linked %s suggested tasks to call %s', len(result.links), call_id)
         return result
     except ItemNotFoundError as e:
-        logger.error(f'Call not found when getting tasks: id={call_id}', exception=e)
+        logger.error('Call not found when applying suggested tasks: id=%s', call_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,30 @@
+from datetime import date
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.core.exceptions import InvalidDateRangeError
+from src.dal.dependencies import get_stats_dal
+from src.dal.stats_dal import StatsDAL
+from src.schemas.stats import StatsRead
+from src.utils.logger import logger
+from src.utils.responses import FastJSONResponse
+
+router: APIRouter = APIRouter(prefix='/v1/stats')
+
+
+@router.get('', response_model=StatsRead, response_class=FastJSONResponse)
+async def get_stats(
+    start: date | None = None,
+    end: date | None = None,
+    tag_ids: List[int] | None = Query(None),
+    stats_dal: StatsDAL = Depends(get_stats_dal)
+) -> FastJSONResponse:
+    try:
+        logger.info('Getting stats: start=%s, end=%s, tag_ids=%s', start, end, tag_ids)
+        result = await stats_dal.get_stats(start=start, end=end, tag_ids=tag_ids)
+        logger.info('Successfully retrieved stats: %s tag rows, %s status rows', len(result.tag_calls), len(result.task_statuses))
+        return FastJSONResponse(result)
+    except InvalidDateRangeError as e:
+        logger.error('Invalid stats date range: start=%s, end=%s', start, end, exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1,83 +1,134 @@
-from typing import List
+from typing import Dict, List, Type
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
-from src.dal.dependencies import get_tag_dal
+from src.constants.db import TAGS_CATALOG_NAME, TEMPLATE_TASKS_CATALOG_NAME
+from src.dal.catalog_version_dal import CatalogVersionDAL
+from src.dal.dependencies import get_catalog_version_dal, get_suggestion_dal, get_tag_dal
+from src.dal.suggestion_dal import SuggestionDAL
 from src.dal.tag_dal import TagDAL
 from src.models.tag import Tag
 from src.schemas.associations import TagWithSuggestedTasks
 from src.schemas.tag import TagCreate, TagRead, TagUpdate
-from src.core.exceptions import ItemNotFoundError
+from src.schemas.task import SuggestedTaskRead
+from src.core.exceptions import InvalidTagIdsError, ItemAlreadyExistsError, ItemNotFoundError
+from src.utils.http_cache import catalog_cache_headers, etag_matches, make_etag, not_modified
 from src.utils.logger import logger
+from src.utils.responses import FastJSONResponse, negotiate_response_class
 
 router: APIRouter = APIRouter(prefix='/v1/tags')
 
 
-@router.get('', response_model=List[TagRead])
-def list_tags(tag_dal: TagDAL = Depends(get_tag_dal)) -> List[Tag]:
+@router.get('', response_model=List[TagRead], response_class=FastJSONResponse)
+async def list_tags(
+    if_none_match: str | None = Header(None),
+    tag_dal: TagDAL = Depends(get_tag_dal),
+    response_type: Type[Response] = Depends(negotiate_response_class)
+) -> Response:
+    etag: str = make_etag('tags', await tag_dal.get_catalog_version(), media_type=response_type.media_type)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, vary_accept=True)
+
     logger.info('Listing all tags')
-    result = tag_dal.list_all_tags()
-    logger.info(f'Successfully retrieved {len(result)} tags')
-    return result
+    result = await tag_dal.list_all_tags()
+    logger.info('Successfully retrieved %s tags', len(result))
+    headers: Dict[str, str] = catalog_cache_headers(etag, vary_accept=True)
+    return response_type([TagRead.from_model(tag) for tag in result], headers=headers)
 
 
 @router.post('', response_model=TagRead, status_code=status.HTTP_201_CREATED)
-def create_tag(payload: TagCreate, tag_dal: TagDAL = Depends(get_tag_dal)) -> Tag:
-    logger.info(f'Creating tag: name={payload.name}, color_id={payload.color_id}')
-    result = tag_dal.create_tag(name=payload.name, color_id=payload.color_id)
-    logger.info(f'Successfully created tag with id: {result.id}')
-    return result
+async def create_tag(payload: TagCreate, tag_dal: TagDAL = Depends(get_tag_dal)) -> Tag:
+    try:
+        logger.info('Creating tag: name=%s, color_id=%s', payload.name, payload.color_id)
+        result = await tag_dal.create_tag(name=payload.name, color_id=payload.color_id)
+        logger.info('Successfully created tag with id: %s', result.id)
+        return result
+    except ItemAlreadyExistsError as e:
+        logger.error('Failed to create tag: %s', payload.name, exception=e)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
-@router.get('/{tag_id}', response_model=TagRead)
-def get_tag(tag_id: int, tag_dal: TagDAL = Depends(get_tag_dal)) -> Tag:
+@router.get('/suggested-tasks', response_model=List[SuggestedTaskRead], response_class=FastJSONResponse)
+async def get_suggested_tasks_for_tags(
+    tag_ids: List[int] = Query(...),
+    if_none_match: str | None = Header(None),
+    suggestion_dal: SuggestionDAL = Depends(get_suggestion_dal),
+    catalog_version_dal: CatalogVersionDAL = Depends(get_catalog_version_dal)
+) -> Response:
+    versions = await catalog_version_dal.get_versions([TAGS_CATALOG_NAME, TEMPLATE_TASKS_CATALOG_NAME])
+    etag: str = make_etag(f'suggested-tasks-{".".join(map(str, tag_ids))}', versions[TAGS_CATALOG_NAME], versions[TEMPLATE_TASKS_CATALOG_NAME])
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     try:
-        logger.info(f'Getting tag: id={tag_id}')
-        result = tag_dal.get_tag_by_id(tag_id)
-        logger.info(f'Successfully retrieved tag: {result.name}')
-        return result
+        logger.info('Getting suggested tasks for tags: ids=%s', tag_ids)
+        result = await suggestion_dal.suggest_for_tags(tag_ids, version=versions[TEMPLATE_TASKS_CATALOG_NAME])
+        logger.info('Successfully retrieved %s suggested tasks for tags: %s', len(result), tag_ids)
+        return FastJSONResponse(result, headers=catalog_cache_headers(etag))
+    except InvalidTagIdsError as e:
+        logger.error('Invalid tag ids: %s', tag_ids, exception=e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get('/{tag_id}', response_model=TagRead, response_class=FastJSONResponse)
+async def get_tag(tag_id: int, tag_dal: TagDAL = Depends(get_tag_dal)) -> FastJSONResponse:
+    try:
+        logger.info('Getting tag: id=%s', tag_id)
+        result = await tag_dal.get_tag_by_id(tag_id)
+        logger.info('Successfully retrieved tag: %s', result.name)
+        return FastJSONResponse(TagRead.from_model(result))
     except ItemNotFoundError as e:
-        logger.error(f'Tag not found: id={tag_id}', exception=e)
+        logger.error('Tag not found: id=%s', tag_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.patch('/{tag_id}', response_model=TagRead)
-def update_tag(
+async def update_tag(
     tag_id: int,
     payload: TagUpdate,
     tag_dal: TagDAL = Depends(get_tag_dal)
 ) -> Tag:
     try:       
-        logger.info(f'Updating tag: id={tag_id}, name={payload.name}, color_id={payload.color_id}')
-        result = tag_dal.update_tag(tag_id, payload.name, payload.color_id)
-        logger.info(f'Successfully updated tag: {result.name}')
+        logger.info('Updating tag: id=%s, name=%s, color_id=%s', tag_id, payload.name, payload.color_id)
+        result = await tag_dal.update_tag(tag_id, name=payload.name, color_id=payload.color_id)
+        logger.info('Successfully updated tag: %s', result.name)
         return result
     except ItemNotFoundError as e:
-        logger.error(f'Tag not found for update: id={tag_id}', exception=e)
+        logger.error('Tag not found for update: id=%s', tag_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
+    except ItemAlreadyExistsError as e:
+        logger.error('Tag name already in use: id=%s, name=%s', tag_id, payload.name, exception=e)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
 @router.delete('/{tag_id}', status_code=status.HTTP_204_NO_CONTENT)
-def delete_tag(tag_id: int, tag_dal: TagDAL = Depends(get_tag_dal)) -> None:
+async def delete_tag(tag_id: int, tag_dal: TagDAL = Depends(get_tag_dal)) -> None:
     try:
-        logger.info(f'Deleting tag: id={tag_id}')
-        tag_dal.deactivate(tag_id)
-        logger.info(f'Successfully deleted tag: id={tag_id}')
+        logger.info('Deleting tag: id=%s', tag_id)
+        await tag_dal.deactivate(tag_id)
+        logger.info('Successfully deleted tag: id=%s', tag_id)
     except ItemNotFoundError as e:
-        logger.error(f'Tag not found for deletion: id={tag_id}', exception=e)
+        logger.error('Tag not found for deletion: id=%s', tag_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.get('/{tag_id}/suggested-tasks', response_model=TagWithSuggestedTasks)
-def get_suggested_tasks(
+@router.get('/{tag_id}/suggested-tasks', response_model=TagWithSuggestedTasks, response_class=FastJSONResponse)
+async def get_suggested_tasks(
     tag_id: int,
-    tag_dal: TagDAL = Depends(get_tag_dal)
-) -> TagWithSuggestedTasks:
+    if_none_match: str | None = Header(None),
+    suggestion_dal: SuggestionDAL = Depends(get_suggestion_dal),
+    catalog_version_dal: CatalogVersionDAL = Depends(get_catalog_version_dal)
+) -> Response:
+    versions = await catalog_version_dal.get_versions([TAGS_CATALOG_NAME, TEMPLATE_TASKS_CATALOG_NAME])
+    etag: str = make_etag(f'suggested-tasks-{tag_id}', versions[TAGS_CATALOG_NAME], versions[TEMPLATE_TASKS_CATALOG_NAME])
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     try:
-        logger.info(f'Getting suggested tasks for tag: id={tag_id}')
-        result = tag_dal.get_tag_with_suggested_tasks(tag_id)
-        logger.info(f'Successfully retrieved {len(result.suggested_tasks)} suggested tasks for tag: {tag_id}')
-        return result
+        logger.info('Getting suggested tasks for tag: id=%s', tag_id)
+        result = await suggestion_dal.get_tag_with_suggested_tasks(tag_id, version=versions[TEMPLATE_TASKS_CATALOG_NAME])
+        logger.info('Successfully retrieved %s suggested tasks for tag: %s', len(result.suggested_tasks), tag_id)
+        return FastJSONResponse(result, headers=catalog_cache_headers(etag))
     except ItemNotFoundError as e:
-        logger.error(f'Tag not found when getting suggested tasks: id={tag_id}', exception=e)
+        logger.error('Tag not found when getting suggested tasks: id=%s', tag_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
@@ -9,58 +9,59 @@ from src.models.task import Task
 from src.schemas.task import AdHocTaskCreate, TaskRead, TaskAndStatusUpdate
 from src.core.exceptions import ItemNotFoundError
 from src.utils.logger import logger
+from src.utils.responses import FastJSONResponse
 
 router: APIRouter = APIRouter(prefix='/v1/tasks')
 
 
-@router.get('', response_model=List[TaskRead])
-def list_tasks(task_dal: TaskDAL = Depends(get_task_dal)) -> List[Task]:
+@router.get('', response_model=List[TaskRead], response_class=FastJSONResponse)
+async def list_tasks(task_dal: TaskDAL = Depends(get_task_dal)) -> FastJSONResponse:
     logger.info('Listing all tasks')
-    result = task_dal.list_all_tasks()
-    logger.info(f'Successfully retrieved {len(result)} tasks')
-    return result
+    result = await task_dal.list_all_tasks()
+    logger.info('Successfully retrieved %s tasks', len(result))
+    return FastJSONResponse([TaskRead.from_model(task) for task in result])
 
 
 @router.post('', response_model=TaskRead, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     payload: AdHocTaskCreate,
     task_dal: TaskDAL = Depends(get_task_dal)
 ) -> Task:
     try:
-        logger.info(f'Creating ad-hoc task: name={payload.name}, call_id={payload.call_id}, status={payload.status}')
-        result = task_dal.create_ad_hoc_task(payload.name, payload.call_id, payload.status)
-        logger.info(f'Successfully created task with id: {result.id}')
+        logger.info('Creating ad-hoc task: name=%s, call_id=%s, status=%s', payload.name, payload.call_id, payload.status)
+        result = await task_dal.create_ad_hoc_task(payload.name, payload.call_id, payload.status)
+        logger.info('Successfully created task with id: %s', result.id)
         return result
     except ItemNotFoundError as e:
-        logger.error(f'Failed to create ad-hoc task: {payload.name}', exception=e)
+        logger.error('Failed to create ad-hoc task: %s', payload.name, exception=e)
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.patch('/{task_id}', response_model=TaskRead)
-def update_task(
+async def update_task(
     task_id: int,
     payload: TaskAndStatusUpdate,
     task_dal: TaskDAL = Depends(get_task_dal)
 ) -> Task:
     try:
-        logger.info(f'Updating task: id={task_id}, name={payload.name}, status={payload.status}, call_id={payload.call_id}')
-        result = task_dal.update_task_and_status(task_id, payload.call_id, payload.status, payload.name)
-        logger.info(f'Successfully updated task: {result.name}')
+        logger.info('Updating task: id=%s, name=%s, status=%s, call_id=%s', task_id, payload.name, payload.status, payload.call_id)
+        result = await task_dal.update_task_and_status(task_id, payload.call_id, payload.status, payload.name)
+        logger.info('Successfully updated task: %s', result.name)
         return result
     except ItemNotFoundError as e:
-        logger.error(f'Task not found for update: id={task_id}', exception=e)
+        logger.error('Task not found for update: id=%s', task_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.delete('/{task_id}', status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+async def delete_task(
     task_id: int,
     task_dal: TaskDAL = Depends(get_task_dal)
 ) -> None:
     try:
-        logger.info(f'Deleting task: id={task_id}')
-        task_dal.deactivate(task_id)
-        logger.info(f'Successfully deleted task: id={task_id}')
+        logger.info('Deleting task: id=%s', task_id)
+        await task_dal.deactivate(task_id)
+        logger.info('Successfully deleted task: id=%s', task_id)
     except ItemNotFoundError as e:
-        logger.error(f'Task not found for deletion: id={task_id}', exception=e)
+        logger.error('Task not found for deletion: id=%s', task_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
@@ -1,83 +1,138 @@
-from typing import List
+from typing import Dict, List, Type
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 
-from src.dal.dependencies import get_task_dal
+from src.constants.api import ListLayout
+from src.constants.db import TAGS_CATALOG_NAME, TEMPLATE_TASKS_CATALOG_NAME
+from src.dal.catalog_version_dal import CatalogVersionDAL
+from src.dal.dependencies import get_catalog_version_dal, get_task_dal
 from src.dal.task_dal import TaskDAL
-from src.schemas.task import TemplateTaskCreate, TemplateTaskUpdate, TemplateTaskRead, CallTaskRead
-from src.core.exceptions import ItemNotFoundError, InvalidTaskTypeError
+from src.schemas.task import NormalizedTemplateTaskList, TemplateTaskCreate, TemplateTaskUpdate, TemplateTaskRead, CallTaskLinkResult, CallTaskRead, TaskCallsLink
+from src.core.exceptions import BulkLimitExceededError, ItemNotFoundError, InvalidTaskTypeError
+from src.utils.http_cache import catalog_cache_headers, etag_matches, make_etag, not_modified
 from src.utils.logger import logger
+from src.utils.responses import FastJSONResponse, negotiate_response_class
 
 router: APIRouter = APIRouter(prefix='/v1/tasks/template')
 
 
-@router.get('', response_model=List[TemplateTaskRead])
-def list_template_tasks(task_dal: TaskDAL = Depends(get_task_dal)) -> List[TemplateTaskRead]:
+@router.get('', response_model=List[TemplateTaskRead] | NormalizedTemplateTaskList, response_class=FastJSONResponse)
+async def list_template_tasks(
+    layout: ListLayout = ListLayout.NESTED,
+    if_none_match: str | None = Header(None),
+    task_dal: TaskDAL = Depends(get_task_dal),
+    catalog_version_dal: CatalogVersionDAL = Depends(get_catalog_version_dal),
+    response_type: Type[Response] = Depends(negotiate_response_class)
+) -> Response:
+    versions = await catalog_version_dal.get_versions([TAGS_CATALOG_NAME, TEMPLATE_TASKS_CATALOG_NAME])
+    etag: str = make_etag('template-tasks', versions[TEMPLATE_TASKS_CATALOG_NAME], versions[TAGS_CATALOG_NAME], media_type=response_type.media_type)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, vary_accept=True)
+
     try:
         logger.info('Listing all template tasks')
-        result = task_dal.list_all_template_tasks()
-        logger.info(f'Successfully retrieved {len(result)} template tasks')
-        return result
+        result = await task_dal.list_all_template_tasks()
+        logger.info('Successfully retrieved %s template tasks', len(result))
+        headers: Dict[str, str] = catalog_cache_headers(etag, vary_accept=True)
+        if layout == ListLayout.NORMALIZED:
+            return response_type(NormalizedTemplateTaskList.from_reads(result), headers=headers)
+        return response_type(result, headers=headers)
     except ItemNotFoundError as e:
         logger.error('Failed to list template tasks', exception=e)
         raise HTTPException(status_code=404, detail=str(e))
 
 @router.post('', response_model=TemplateTaskRead, status_code=status.HTTP_201_CREATED)
-def create_template_task(payload: TemplateTaskCreate, task_dal: TaskDAL = Depends(get_task_dal)) -> TemplateTaskRead:
+async def create_template_task(payload: TemplateTaskCreate, task_dal: TaskDAL = Depends(get_task_dal)) -> TemplateTaskRead:
     try:
-        logger.info(f'Creating template task: name={payload.name}, tag_ids={payload.tag_ids}')
-        result = task_dal.create_template_task(payload.name, payload.tag_ids)
-        logger.info(f'Successfully created template task with id: {result.id}')
+        logger.info('Creating template task: name=%s, tag_ids=%s', payload.name, payload.tag_ids)
+        result = await task_dal.create_template_task(payload.name, payload.tag_ids)
+        logger.info('Successfully created template task with id: %s', result.id)
         return result
     except ItemNotFoundError as e:
-        logger.error(f'Failed to create template task: {payload.name}', exception=e)
+        logger.error('Failed to create template task: %s', payload.name, exception=e)
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.patch('/{task_id}', response_model=TemplateTaskRead)
-def update_template_task(task_id: int, payload: TemplateTaskUpdate, task_dal: TaskDAL = Depends(get_task_dal)) -> TemplateTaskRead:
+async def update_template_task(task_id: int, payload: TemplateTaskUpdate, task_dal: TaskDAL = Depends(get_task_dal)) -> TemplateTaskRead:
     try:
-        logger.info(f'Updating template task: id={task_id}, name={payload.name}, tag_ids={payload.tag_ids}')
-        result = task_dal.update_template_task_and_tags(task_id, payload.name, payload.tag_ids)
-        logger.info(f'Successfully updated template task: {result.name}')
+        logger.info('Updating template task: id=%s, name=%s, tag_ids=%s', task_id, payload.name, payload.tag_ids)
+        result = await task_dal.update_template_task_and_tags(task_id, payload.name, payload.tag_ids)
+        logger.info('Successfully updated template task: %s', result.name)
         return result
     except ItemNotFoundError as e:
-        logger.error(f'Template task not found for update: id={task_id}', exception=e)
+        logger.error('Template task not found for update: id=%s', task_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidTaskTypeError as e:
-        logger.error(f'Invalid task type for update: id={task_id}', exception=e)
+        logger.error('Invalid task type for update: id=%s', task_id, exception=e)
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post('/{task_id}/link', response_model=CallTaskRead)
-def link_template_task_to_call(task_id: int, call_id: int, task_dal: TaskDAL = Depends(get_task_dal)) -> CallTaskRead:
+async def link_template_task_to_call(task_id: int, call_id: int, task_dal: TaskDAL = Depends(get_task_dal)) -> CallTaskRead:
     try:
-        logger.info(f'Linking template task to call: task_id={task_id}, call_id={call_id}')
-        result = task_dal.link_template_task_to_call(task_id, call_id)
-        logger.info(f'Successfully linked template task {task_id} to call {call_id}')
+        logger.info('Linking template task to call: task_id=%s, call_id=%s', task_id, call_id)
+        result = await task_dal.link_template_task_to_call(task_id, call_id)
+        logger.info('Successfully linked template task %s to call %s', task_id, call_id)
         return result
     except ItemNotFoundError as e:
-        logger.error(f'Failed to link template task to call: task_id={task_id}, call_id={call_id}', exception=e)
+        logger.error('Failed to link template task to call: task_id=%s, call_id=%s', task_id, call_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.post('/{task_id}/unlink', response_model=None)
-def unlink_template_task_from_call(task_id: int, call_id: int, task_dal: TaskDAL = Depends(get_task_dal)) -> None:
+async def unlink_template_task_from_call(task_id: int, call_id: int, task_dal: TaskDAL = Depends(get_task_dal)) -> None:
+    try:
+        logger.info('Unlinking template task from call: task_id=%s, call_id=%s', task_id, call_id)
+        await task_dal.unlink_template_task_from_call(task_id, call_id)
+        logger.info('Successfully unlinked template task %s from call %s', task_id, call_id)
+    except ItemNotFoundError as e:
+        logger.error('Failed to unlink template task from call: task_id=%s, call_id=%s', task_id, call_id, exception=e)
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post('/{task_id}/calls/link', response_model=CallTaskLinkResult)
+async def link_template_task_to_calls(task_id: int, payload: TaskCallsLink, task_dal: TaskDAL = Depends(get_task_dal)) -> CallTaskLinkResult:
+    try:
+        logger.info('Linking template task to calls: task_id=%s, call_ids=%s', task_id, payload.call_ids)
+        result = await task_dal.link_template_task_to_calls(task_id, payload.call_ids)
+        logger.info('Successfully linked template task %s to %s calls', task_id, len(result.links))
+        return result
+    except ItemNotFoundError as e:
+        logger.error('Template task not found when linking calls: id=%s', task_id, exception=e)
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidTaskTypeError as e:
+        logger.error('Invalid task type when linking calls: id=%s', task_id, exception=e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except BulkLimitExceededError as e:
+        logger.error('Too many calls to link to template task: id=%s', task_id, exception=e)
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(e))
+
+
+@router.post('/{task_id}/calls/unlink', response_model=CallTaskLinkResult)
+async def unlink_template_task_from_calls(task_id: int, payload: TaskCallsLink, task_dal: TaskDAL = Depends(get_task_dal)) -> CallTaskLinkResult:
     try:
-        logger.info(f'Unlinking template task from call: task_id={task_id}, call_id={call_id}')
-        task_dal.unlink_template_task_from_call(task_id, call_id)
-        logger.info(f'Successfully unlinked template task {task_id} from call {call_id}')
+        logger.info('Unlinking template task from calls: task_id=%s, call_ids=%s', task_id, payload.call_ids)
+        result = await task_dal.unlink_template_task_from_calls(task_id, payload.call_ids)
+        logger.info('Successfully unlinked template task %s from %s calls', task_id, len(result.links))
+        return result
     except ItemNotFoundError as e:
-        logger.error(f'Failed to unlink template task from call: task_id={task_id}, call_id={call_id}', exception=e)
+        logger.error('Template task not found when unlinking calls: id=%s', task_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
+    except InvalidTaskTypeError as e:
+        logger.error('Invalid task type when unlinking calls: id=%s', task_id, exception=e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except BulkLimitExceededError as e:
+        logger.error('Too many calls to unlink from template task: id=%s', task_id, exception=e)
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(e))
 
 
 @router.delete('/{task_id}', status_code=status.HTTP_204_NO_CONTENT)
-def delete_template_task(task_id: int, task_dal: TaskDAL = Depends(get_task_dal)) -> None:
+async def delete_template_task(task_id: int, task_dal: TaskDAL = Depends(get_task_dal)) -> None:
     try:
-        logger.info(f'Deleting template task: id={task_id}')
-        task_dal.deactivate(task_id)
-        logger.info(f'Successfully deleted template task: id={task_id}')
+        logger.info('Deleting template task: id=%s', task_id)
+        await task_dal.deactivate(task_id)
+        logger.info('Successfully deleted template task: id=%s', task_id)
     except ItemNotFoundError as e:
-        logger.error(f'Template task not found for deletion: id={task_id}', exception=e)
+        logger.error('Template task not found for deletion: id=%s', task_id, exception=e)
         raise HTTPException(status_code=404, detail=str(e))
@@ -1,7 +1,38 @@
-from typing import Final, List
+from enum import Enum
+from typing import Dict, Final, List, Tuple
 
 API_PREFIX: Final[str] = '/api'
 ALLOWED_ORIGINS: Final[List[str]] = ['http://localhost:5173', 'https://cytactic-project.pages.dev', 'https://centriq.tomerchermesh.com']
 
 RATE_LIMIT_MAX_REQUESTS: Final[int] = 100
-RATE_LIMIT_WINDOW_SECONDS: Final[int] = 60
\ No newline at end of file
+RATE_LIMIT_WINDOW_SECONDS: Final[int] = 60
+RATE_LIMIT_ROUTE_LIMITS: Final[Dict[str, Tuple[int, int]]] = {
+    'POST /api/v1/calls/bulk': (10, 60),
+    'GET /api/v1/calls/export': (5, 60),
+}
+RATE_LIMIT_MAX_KEYS: Final[int] = 100000
+RATE_LIMIT_SWEEP_INTERVAL_SECONDS: Final[int] = 60
+
+CATALOG_CACHE_CONTROL: Final[str] = 'private, no-cache'
+
+NDJSON_CONTENT_TYPE: Final[str] = 'application/x-ndjson'
+CSV_CONTENT_TYPE: Final[str] = 'text/csv'
+EVENT_STREAM_CONTENT_TYPE: Final[str] = 'text/event-stream'
+JSON_CONTENT_TYPE: Final[str] = 'application/json'
+MSGPACK_CONTENT_TYPE: Final[str] = 'application/msgpack'
+VARY_ACCEPT_HEADERS: Final[Dict[str, str]] = {'Vary': 'Accept'}
+
+GZIP_ENCODING: Final[str] = 'gzip'
+BROTLI_ENCODING: Final[str] = 'br'
+GZIP_COMPRESS_LEVEL: Final[int] = 6
+BROTLI_QUALITY: Final[int] = 4
+
+
+class ExportFormat(str, Enum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
+class ListLayout(str, Enum):
+    NESTED = 'nested'
+    NORMALIZED = 'normalized'
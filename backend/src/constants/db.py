@@ -0,0 +1,28 @@
+from pathlib import Path
+from typing import Dict, Final, Tuple
+
+ALEMBIC_CONFIG_PATH: Final[str] = str(Path(__file__).resolve().parents[2] / 'alembic.ini')
+MIGRATIONS_BASELINE_REVISION: Final[str] = '0001'
+MIGRATIONS_HEAD_REVISION: Final[str] = '0005'
+N_PLUS_ONE_THRESHOLD: Final[int] = 3
+SYNC_DRIVERS: Final[Dict[str, str]] = {'sqlite': 'pysqlite', 'postgresql': 'psycopg'}
+ASYNC_DRIVERS: Final[Dict[str, str]] = {'sqlite': 'aiosqlite', 'postgresql': 'psycopg'}
+
+TAGS_CATALOG_NAME: Final[str] = 'tags'
+TEMPLATE_TASKS_CATALOG_NAME: Final[str] = 'template_tasks'
+
+CALLS_SEARCH_TS_CONFIG: Final[str] = 'english'
+CALLS_SEARCH_VECTOR_COLUMN: Final[str] = 'search_vector'
+CALLS_SEARCH_VECTOR_INDEX: Final[str] = 'ix_calls_search_vector'
+CALLS_FTS_TABLE: Final[str] = 'calls_fts'
+CALLS_FTS_COLUMN_WEIGHTS: Final[Tuple[float, float]] = (10.0, 5.0)
+
+PRIMARY_ENGINE_NAME: Final[str] = 'primary'
+REPLICA_ENGINE_NAME_PREFIX: Final[str] = 'replica'
+REPLICA_READ_METHODS: Final[frozenset] = frozenset({'GET', 'HEAD'})
+READ_ONLY_SESSION_KEY: Final[str] = 'read_only'
+PRIMARY_PINNED_SESSION_KEY: Final[str] = 'primary_pinned'
+REPLICA_SESSION_KEY: Final[str] = 'replica'
+UNIT_OF_WORK_DEPTH_SESSION_KEY: Final[str] = 'unit_of_work_depth'
+ON_COMMIT_SESSION_KEY: Final[str] = 'on_commit'
+REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS: Final[float] = 2.0
@@ -0,0 +1,21 @@
+from enum import Enum
+from typing import Final
+
+CALL_EVENTS_CHANNEL: Final[str] = 'call_events'
+PENDING_EVENTS_SESSION_KEY: Final[str] = 'pending_events'
+
+EVENT_QUEUE_SIZE: Final[int] = 256
+EVENT_KEEPALIVE_SECONDS: Final[float] = 15.0
+EVENT_RECONNECT_MILLISECONDS: Final[int] = 3000
+EVENT_NOTIFY_PAYLOAD_LIMIT: Final[int] = 7900
+EVENT_RELAY_RETRY_SECONDS: Final[float] = 5.0
+
+
+class CallEventType(str, Enum):
+    CALL_CREATED = 'call.created'
+    CALL_UPDATED = 'call.updated'
+    CALL_TAGS_CHANGED = 'call.tags_changed'
+    TASK_LINKED = 'task.linked'
+    TASK_UNLINKED = 'task.unlinked'
+    TASK_STATUS_CHANGED = 'task.status_changed'
+    STREAM_OVERFLOW = 'stream.overflow'
@@ -0,0 +1,11 @@
+from enum import Enum
+from typing import Final
+
+LIVENESS_PATH: Final[str] = '/health/live'
+READINESS_PATH: Final[str] = '/health/ready'
+
+
+class ServiceStatus(str, Enum):
+    STARTING = 'starting'
+    READY = 'ready'
+    STOPPING = 'stopping'
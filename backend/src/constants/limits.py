@@ -1,4 +1,23 @@
 from typing import Final
 
 MAX_DAYS_LIMIT: Final[int] = 30
-MIN_DAYS_LIMIT: Final[int] = 1
\ No newline at end of file
+MIN_DAYS_LIMIT: Final[int] = 1
+
+DEFAULT_PAGE_LIMIT: Final[int] = 100
+MIN_PAGE_LIMIT: Final[int] = 1
+MAX_PAGE_LIMIT: Final[int] = 500
+
+MAX_BULK_ITEMS: Final[int] = 10000
+MAX_BULK_BODY_BYTES: Final[int] = 10 * 1024 * 1024
+MAX_CALL_IDS_PER_REQUEST: Final[int] = 500
+MAX_BULK_LINK_IDS: Final[int] = 1000
+
+EXPORT_BATCH_SIZE: Final[int] = 1000
+
+DEFAULT_SEARCH_LIMIT: Final[int] = 20
+MAX_SEARCH_QUERY_LENGTH: Final[int] = 200
+
+DEFAULT_STATS_DAYS: Final[int] = 30
+MAX_STATS_DAYS: Final[int] = 366
+
+MAX_SUGGESTION_TAG_IDS: Final[int] = 100
@@ -2,4 +2,6 @@ from typing import Final
 
 
 LOG_DIR_PATH: Final[str] = 'logs'
-LOG_FILE_DATE_FORMAT: Final[str] = '%Y-%m-%d'
\ No newline at end of file
+LOG_FILE_DATE_FORMAT: Final[str] = '%Y-%m-%d'
+LOG_FLUSH_INTERVAL_SECONDS: Final[float] = 1.0
+LOG_FLUSH_BATCH_SIZE: Final[int] = 500
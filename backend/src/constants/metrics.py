@@ -0,0 +1,8 @@
+from typing import Final, Tuple
+
+METRICS_PATH: Final[str] = '/metrics'
+METRICS_CONTENT_TYPE: Final[str] = 'text/plain; version=0.0.4; charset=utf-8'
+METRICS_UNMATCHED_ROUTE: Final[str] = '<unmatched>'
+
+LATENCY_BUCKETS_SECONDS: Final[Tuple[float, ...]] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS: Final[Tuple[float, ...]] = (0, 1, 2, 3, 5, 10, 20, 50, 100)
@@ -1,11 +1,33 @@
+from typing import List
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     database_url: str
+    database_sslmode: str = 'require'
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout_seconds: float = 30.0
+    database_pool_recycle_seconds: int | None = None
+    database_pool_pre_ping: bool = True
+    database_pool_use_lifo: bool = False
+    database_statement_timeout_ms: int | None = None
+    database_prepare_threshold: int | None = 5
+    database_replica_urls: List[str] = []
+    database_replica_retry_seconds: float = 10.0
+    database_migrate_on_startup: str = 'auto'
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = 'memory'
+    rate_limit_sqlite_path: str = 'rate_limits.sqlite3'
+    response_compression_min_bytes: int = 1024
+    metrics_enabled: bool = False
+    metrics_token: str | None = None
+    log_level: str = 'INFO'
 
     class Config:
         env_file = '.env'
+        env_parse_none_str = 'none'
 
 
 settings: Settings = Settings()
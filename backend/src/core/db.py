@@ -1,22 +1,191 @@
-from typing import Generator
-
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker
-
-from src.core.config import settings
-from src.models.base import Base
-
-engine: Engine = create_engine(
-    settings.database_url,
-    echo=False,
-    future=True,
-    pool_pre_ping=True,
-    connect_args={
-        'sslmode': 'require',
-    }
+import asyncio
+from contextlib import AsyncExitStack
+from time import perf_counter
+from typing import Any, AsyncGenerator, Dict, Generator, List, Type
+
+from fastapi import Depends, Request
+from sqlalchemy import Select, create_engine, event, inspect, make_url, text
+from sqlalchemy.engine import URL, Connection, Engine, ExceptionContext
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from src.constants.db import (
+    ALEMBIC_CONFIG_PATH,
+    ASYNC_DRIVERS,
+    CALLS_FTS_TABLE,
+    CALLS_SEARCH_VECTOR_COLUMN,
+    CALLS_SEARCH_VECTOR_INDEX,
+    MIGRATIONS_BASELINE_REVISION,
+    MIGRATIONS_HEAD_REVISION,
+    PRIMARY_ENGINE_NAME,
+    PRIMARY_PINNED_SESSION_KEY,
+    READ_ONLY_SESSION_KEY,
+    REPLICA_READ_METHODS,
+    REPLICA_SESSION_KEY,
+    SYNC_DRIVERS,
 )
+from src.core.config import Settings, settings
+from src.core.events import EventHub, PostgresEventRelay
+from src.core.replicas import ReplicaSet
+from src.utils.metrics import metrics
+
+QUERY_STARTED_AT_KEY: str = 'query_started_at'
+
+
+def _connect_args(database_url: str, config: Settings) -> Dict[str, Any]:
+    url: URL = make_url(database_url)
+    if url.get_backend_name() != 'postgresql':
+        return {}
+    connect_args: Dict[str, Any] = {'sslmode': config.database_sslmode}
+    if config.database_statement_timeout_ms is not None:
+        connect_args['options'] = f'-c statement_timeout={config.database_statement_timeout_ms}'
+    if url.get_driver_name() == 'psycopg':
+        connect_args['prepare_threshold'] = config.database_prepare_threshold
+    return connect_args
+
+
+class TimedCheckoutMixin:
+    def _do_get(self):
+        started: float = perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            metrics.record_pool_timeout()
+            raise
+        finally:
+            metrics.record_pool_checkout(perf_counter() - started)
+
+
+class TimedQueuePool(TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def driver_url(database_url: str, is_async: bool) -> str:
+    url: URL = make_url(database_url)
+    drivers: Dict[str, str] = ASYNC_DRIVERS if is_async else SYNC_DRIVERS
+    backend: str = url.get_backend_name()
+    if url.get_dialect().is_async == is_async or backend not in drivers:
+        return database_url
+    return url.set(drivername=f'{backend}+{drivers[backend]}').render_as_string(hide_password=False)
+
+
+def _pool_class(database_url: str, is_async: bool) -> Type[Pool] | None:
+    url: URL = make_url(database_url)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return None
+    return TimedAsyncAdaptedQueuePool if is_async or url.get_dialect().is_async else TimedQueuePool
+
+
+def engine_options(database_url: str, is_async: bool, config: Settings = settings) -> Dict[str, Any]:
+    poolclass: Type[Pool] | None = _pool_class(database_url, is_async)
+    options: Dict[str, Any] = {
+        'echo': False,
+        'pool_pre_ping': config.database_pool_pre_ping,
+        'pool_recycle': config.database_pool_recycle_seconds if config.database_pool_recycle_seconds is not None else -1,
+        'poolclass': poolclass,
+        'connect_args': _connect_args(database_url, config),
+    }
+    if poolclass is not None:
+        options.update(
+            pool_size=config.database_pool_size,
+            max_overflow=config.database_max_overflow,
+            pool_timeout=config.database_pool_timeout_seconds,
+            pool_use_lifo=config.database_pool_use_lifo,
+        )
+    return options
+
+
+def _before_cursor_execute(conn: Connection, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(QUERY_STARTED_AT_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(conn: Connection, cursor, statement, parameters, context, executemany) -> None:
+    metrics.record_query(perf_counter() - conn.info[QUERY_STARTED_AT_KEY].pop())
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    started_at: List[float] = context.connection.info.get(QUERY_STARTED_AT_KEY, []) if context.connection is not None else []
+    if started_at:
+        metrics.record_query(perf_counter() - started_at.pop())
+
+
+def _instrument(sync_engine: Engine) -> None:
+    event.listen(sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(sync_engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(sync_engine, 'handle_error', _handle_error)
+
+
+def create_instrumented_async_engine(url: str, config: Settings = settings) -> AsyncEngine:
+    url = driver_url(url, is_async=True)
+    async_engine: AsyncEngine = create_async_engine(url, **engine_options(url, is_async=True, config=config))
+    _instrument(async_engine.sync_engine)
+    return async_engine
+
+
+class RoutingSession(Session):
+    def __init__(self, *args: Any, replicas: ReplicaSet | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replicas: ReplicaSet | None = replicas
+
+    def get_bind(self, mapper=None, clause=None, **kwargs: Any) -> Engine | Connection:
+        if self.replicas and self.info.get(READ_ONLY_SESSION_KEY) and not self.info.get(PRIMARY_PINNED_SESSION_KEY):
+            if isinstance(clause, Select) and clause._for_update_arg is None and not self._flushing:
+                replica: Engine | None = self.info.get(REPLICA_SESSION_KEY) or self.replicas.choose()
+                if replica is not None:
+                    self.info[REPLICA_SESSION_KEY] = replica
+                    return replica
+            self.info[PRIMARY_PINNED_SESSION_KEY] = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def _execute_internal(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return super()._execute_internal(*args, **kwargs)
+        except DBAPIError:
+            replica: Engine | None = self.info.get(REPLICA_SESSION_KEY)
+            if replica is None or self.info.get(PRIMARY_PINNED_SESSION_KEY) or self.replicas.is_available(replica):
+                raise
+            self.info[PRIMARY_PINNED_SESSION_KEY] = True
+            return super()._execute_internal(*args, **kwargs)
+
+
+def create_session_factory(primary: AsyncEngine, replicas: ReplicaSet | None = None) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=primary,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+def _collect_engine_metrics() -> None:
+    engines: Dict[str, AsyncEngine] = {PRIMARY_ENGINE_NAME: async_engine, **{replica.name: replica.engine for replica in replicas}}
+    available: Dict[str, bool] = replicas.status()
+    for name, pooled_engine in engines.items():
+        metrics.db_engine_up.set(int(available.get(name, True)), (name,))
+        if isinstance(pooled_engine.pool, QueuePool):
+            metrics.record_pool_status(name, pooled_engine.pool.size(), pooled_engine.pool.checkedout(), pooled_engine.pool.checkedin(), max(pooled_engine.pool.overflow(), 0))
+
+
+sync_database_url: str = driver_url(settings.database_url, is_async=False)
+engine: Engine = create_engine(sync_database_url, future=True, **engine_options(sync_database_url, is_async=False))
 SessionLocal: sessionmaker = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+_instrument(engine)
+
+async_engine: AsyncEngine = create_instrumented_async_engine(settings.database_url)
+replicas: ReplicaSet = ReplicaSet(
+    [create_instrumented_async_engine(url) for url in settings.database_replica_urls],
+    retry_seconds=settings.database_replica_retry_seconds,
+)
+metrics.add_collector(_collect_engine_metrics)
+
+AsyncSessionLocal: async_sessionmaker[AsyncSession] = create_session_factory(async_engine, replicas)
 
 
 def get_db() -> Generator:
@@ -27,7 +196,86 @@ def get_db() -> Generator:
         db.close()
 
 
-def init_db() -> None:
-    print('🔧 Creating all tables in the database...')
-    Base.metadata.create_all(bind=engine)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    return AsyncSessionLocal
+
+
+async def get_async_db(
+    request: Request,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory)
+) -> AsyncGenerator[AsyncSession, None]:
+    async with session_factory(info={READ_ONLY_SESSION_KEY: request.method in REPLICA_READ_METHODS}) as db:
+        yield db
+
+
+def include_in_autogenerate(name: str | None, type_: str, parent_names: Dict[str, str | None]) -> bool:
+    if type_ == 'table':
+        return not (name or '').startswith(CALLS_FTS_TABLE)
+    return name not in (CALLS_SEARCH_VECTOR_COLUMN, CALLS_SEARCH_VECTOR_INDEX)
+
+
+def run_migrations(connection: Connection) -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    config: Config = Config(ALEMBIC_CONFIG_PATH)
+    config.attributes['connection'] = connection
+    config.attributes['configure_logger'] = False
+
+    tables: List[str] = inspect(connection).get_table_names()
+    if 'calls' in tables and 'alembic_version' not in tables:
+        command.stamp(config, MIGRATIONS_BASELINE_REVISION)
+    command.upgrade(config, 'head')
+
+
+def create_event_relay(hub: EventHub) -> PostgresEventRelay | None:
+    if make_url(settings.database_url).get_backend_name() != 'postgresql':
+        return None
+    return PostgresEventRelay(settings.database_url, _connect_args(settings.database_url, settings), hub)
+
+
+async def get_schema_revision(connection: AsyncConnection) -> str | None:
+    try:
+        return await connection.scalar(text('SELECT version_num FROM alembic_version'))
+    except DBAPIError:
+        return None
+
+
+async def init_db(pooled_engine: AsyncEngine = async_engine, mode: str = settings.database_migrate_on_startup) -> bool:
+    if mode == 'never':
+        return False
+    if mode == 'auto':
+        async with pooled_engine.connect() as connection:
+            revision: str | None = await get_schema_revision(connection)
+        if revision == MIGRATIONS_HEAD_REVISION:
+            print(f'✅ Database schema is current ({revision}), skipping migrations')
+            return False
+
+    print('🔧 Applying database migrations...')
+    async with pooled_engine.begin() as connection:
+        await connection.run_sync(run_migrations)
     print('✅ Done!')
+    return True
+
+
+async def warm_pool(pooled_engine: AsyncEngine) -> int:
+    size: int = pooled_engine.pool.size() if isinstance(pooled_engine.pool, QueuePool) else 1
+    async with AsyncExitStack() as stack:
+        for _ in range(size):
+            connection: AsyncConnection = await stack.enter_async_context(pooled_engine.connect())
+            await connection.execute(text('SELECT 1'))
+    return size
+
+
+async def warm_pools() -> Dict[str, int]:
+    available: Dict[str, bool] = await replicas.check()
+    engines: Dict[str, AsyncEngine] = {
+        PRIMARY_ENGINE_NAME: async_engine,
+        **{replica.name: replica.engine for replica in replicas if available[replica.name]},
+    }
+    return dict(zip(engines, await asyncio.gather(*(warm_pool(pooled_engine) for pooled_engine in engines.values()))))
+
+
+async def close_db() -> None:
+    await async_engine.dispose()
+    await replicas.dispose()
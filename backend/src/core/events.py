@@ -0,0 +1,153 @@
+import asyncio
+from typing import Any, Dict, List, Sequence, Set
+
+import orjson
+from sqlalchemy import event, func, make_url, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.constants.events import (
+    CALL_EVENTS_CHANNEL,
+    EVENT_NOTIFY_PAYLOAD_LIMIT,
+    EVENT_QUEUE_SIZE,
+    EVENT_RELAY_RETRY_SECONDS,
+    PENDING_EVENTS_SESSION_KEY,
+    CallEventType,
+)
+from src.utils.logger import logger
+from src.utils.metrics import metrics
+
+CallEvent = Dict[str, Any]
+
+
+def call_event(event_type: CallEventType, call_id: int, **fields: Any) -> CallEvent:
+    return {'type': event_type.value, 'call_id': call_id, **fields}
+
+
+class Subscription:
+    __slots__ = ('queue', 'dropped')
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue[CallEvent | None] = asyncio.Queue(queue_size)
+        self.dropped: bool = False
+
+
+class EventHub:
+    def __init__(self, queue_size: int = EVENT_QUEUE_SIZE):
+        self.queue_size: int = queue_size
+        self.relay: 'PostgresEventRelay | None' = None
+        self._subscriptions: Set[Subscription] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self) -> Subscription:
+        subscription: Subscription = Subscription(self.queue_size)
+        self._subscriptions.add(subscription)
+        metrics.record_event_stream_clients(len(self._subscriptions))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+        metrics.record_event_stream_clients(len(self._subscriptions))
+
+    def _close(self, subscription: Subscription) -> None:
+        self.unsubscribe(subscription)
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+    def _drop(self, subscription: Subscription) -> None:
+        logger.warning('Dropping slow call event stream client after %s queued events', self.queue_size)
+        subscription.dropped = True
+        metrics.record_event_stream_drop()
+        self._close(subscription)
+
+    def dispatch(self, events: Sequence[CallEvent]) -> None:
+        for subscription in list(self._subscriptions):
+            for call_event in events:
+                try:
+                    subscription.queue.put_nowait(call_event)
+                except asyncio.QueueFull:
+                    self._drop(subscription)
+                    break
+        metrics.record_event_stream_dispatch(len(events))
+
+    def publish(self, events: Sequence[CallEvent]) -> None:
+        if self.relay is None:
+            self.dispatch(events)
+
+    def close(self) -> None:
+        for subscription in list(self._subscriptions):
+            self._close(subscription)
+
+
+def _notify_payloads(events: Sequence[CallEvent]) -> List[str]:
+    payloads: List[str] = []
+    chunk: List[bytes] = []
+    size: int = 2
+    for call_event in events:
+        encoded: bytes = orjson.dumps(call_event)
+        if chunk and size + len(encoded) + 1 > EVENT_NOTIFY_PAYLOAD_LIMIT:
+            payloads.append((b'[' + b','.join(chunk) + b']').decode())
+            chunk, size = [], 2
+        chunk.append(encoded)
+        size += len(encoded) + 1
+    if chunk:
+        payloads.append((b'[' + b','.join(chunk) + b']').decode())
+    return payloads
+
+
+class PostgresEventRelay:
+    def __init__(self, database_url: str, connect_args: Dict[str, Any], hub: EventHub):
+        self._conninfo: str = make_url(database_url).set(drivername='postgresql').render_as_string(hide_password=False)
+        self._connect_args: Dict[str, Any] = connect_args
+        self._hub: EventHub = hub
+
+    def notify(self, session: Session, events: Sequence[CallEvent]) -> None:
+        connection: Connection = session.connection()
+        for payload in _notify_payloads(events):
+            connection.execute(select(func.pg_notify(CALL_EVENTS_CHANNEL, payload)))
+
+    async def listen(self) -> None:
+        import psycopg
+
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(self._conninfo, autocommit=True, **self._connect_args) as connection:
+                    await connection.execute(f'LISTEN {CALL_EVENTS_CHANNEL}')
+                    logger.info('Listening for call events on channel %s', CALL_EVENTS_CHANNEL)
+                    async for notify in connection.notifies():
+                        self._hub.dispatch(orjson.loads(notify.payload))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error('Call event listener disconnected, reconnecting in %ss', EVENT_RELAY_RETRY_SECONDS, exception=e)
+                await asyncio.sleep(EVENT_RELAY_RETRY_SECONDS)
+
+
+call_events: EventHub = EventHub()
+
+
+def stage_events(db: AsyncSession, *events: CallEvent) -> None:
+    db.info.setdefault(PENDING_EVENTS_SESSION_KEY, []).extend(events)
+
+
+@event.listens_for(Session, 'before_commit')
+def _notify_staged_events(session: Session) -> None:
+    events: List[CallEvent] | None = session.info.get(PENDING_EVENTS_SESSION_KEY)
+    if events and call_events.relay is not None:
+        call_events.relay.notify(session, events)
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_staged_events(session: Session) -> None:
+    events: List[CallEvent] | None = session.info.pop(PENDING_EVENTS_SESSION_KEY, None)
+    if events:
+        call_events.publish(events)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_staged_events(session: Session, previous_transaction: SessionTransaction) -> None:
+    session.info.pop(PENDING_EVENTS_SESSION_KEY, None)
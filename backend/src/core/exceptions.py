@@ -12,3 +12,27 @@ class InvalidTaskTypeError(Exception):
 
 class InvalidDaysLimitError(Exception):
     pass
+
+class InvalidPageLimitError(Exception):
+    pass
+
+class InvalidCursorError(Exception):
+    pass
+
+class BulkLimitExceededError(Exception):
+    pass
+
+class InvalidBulkPayloadError(Exception):
+    pass
+
+class InvalidDateRangeError(Exception):
+    pass
+
+class InvalidCallIdsError(Exception):
+    pass
+
+class InvalidSearchQueryError(Exception):
+    pass
+
+class InvalidTagIdsError(Exception):
+    pass
@@ -0,0 +1,27 @@
+from typing import Dict
+
+from src.constants.health import ServiceStatus
+
+
+class Readiness:
+    def __init__(self):
+        self.status: ServiceStatus = ServiceStatus.STARTING
+        self.warmed_connections: Dict[str, int] = {}
+
+    @property
+    def is_ready(self) -> bool:
+        return self.status == ServiceStatus.READY
+
+    def mark_ready(self, warmed_connections: Dict[str, int]) -> None:
+        self.warmed_connections = warmed_connections
+        self.status = ServiceStatus.READY
+
+    def mark_stopping(self) -> None:
+        self.status = ServiceStatus.STOPPING
+
+    def reset(self) -> None:
+        self.status = ServiceStatus.STARTING
+        self.warmed_connections = {}
+
+
+readiness: Readiness = Readiness()
@@ -0,0 +1,91 @@
+import asyncio
+from itertools import count
+from time import monotonic
+from typing import Dict, Iterator, List, Sequence
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.constants.db import REPLICA_ENGINE_NAME_PREFIX, REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS
+from src.utils.logger import logger
+
+
+class Replica:
+    __slots__ = ('name', 'engine', 'unavailable_until')
+
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name: str = name
+        self.engine: AsyncEngine = engine
+        self.unavailable_until: float = 0.0
+
+    def is_available(self, now: float) -> bool:
+        return self.unavailable_until <= now
+
+
+class ReplicaSet:
+    def __init__(self, engines: Sequence[AsyncEngine], retry_seconds: float):
+        self.retry_seconds: float = retry_seconds
+        self._replicas: List[Replica] = [Replica(f'{REPLICA_ENGINE_NAME_PREFIX}-{i}', engine) for i, engine in enumerate(engines)]
+        self._by_engine: Dict[Engine, Replica] = {replica.engine.sync_engine: replica for replica in self._replicas}
+        self._round_robin: Iterator[int] = count()
+        for replica in self._replicas:
+            event.listen(replica.engine.sync_engine, 'handle_error', self._on_error(replica))
+
+    def __len__(self) -> int:
+        return len(self._replicas)
+
+    def __iter__(self) -> Iterator[Replica]:
+        return iter(self._replicas)
+
+    def _on_error(self, replica: Replica):
+        def handle_error(context: ExceptionContext) -> None:
+            if context.connection is None or context.is_disconnect:
+                self.mark_unavailable(replica, context.original_exception)
+        return handle_error
+
+    def choose(self) -> Engine | None:
+        now: float = monotonic()
+        available: List[Replica] = [replica for replica in self._replicas if replica.is_available(now)]
+        if not available:
+            return None
+        return available[next(self._round_robin) % len(available)].engine.sync_engine
+
+    def is_available(self, engine: Engine) -> bool:
+        return self._by_engine[engine].is_available(monotonic())
+
+    def mark_unavailable(self, replica: Replica, error: BaseException | None = None) -> None:
+        if replica.is_available(monotonic()):
+            logger.warning('Database %s unavailable, routing reads to the primary for %ss', replica.name, self.retry_seconds, exception=error)
+        replica.unavailable_until = monotonic() + self.retry_seconds
+
+    def mark_available(self, replica: Replica) -> None:
+        if not replica.is_available(monotonic()):
+            logger.info('Database %s available again', replica.name)
+        replica.unavailable_until = 0.0
+
+    def status(self) -> Dict[str, bool]:
+        now: float = monotonic()
+        return {replica.name: replica.is_available(now) for replica in self._replicas}
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            async with replica.engine.connect() as connection:
+                await asyncio.wait_for(connection.execute(text('SELECT 1')), REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS)
+        except Exception as e:
+            self.mark_unavailable(replica, e)
+        else:
+            self.mark_available(replica)
+
+    async def check(self) -> Dict[str, bool]:
+        await asyncio.gather(*(self._check(replica) for replica in self._replicas))
+        return self.status()
+
+    async def monitor(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.retry_seconds)
+
+    async def dispose(self) -> None:
+        for replica in self._replicas:
+            await replica.engine.dispose()
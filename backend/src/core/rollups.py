@@ -0,0 +1,52 @@
+from datetime import date
+from typing import Dict
+
+from sqlalchemy import ColumnElement, Date, Insert, Select, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.schema import Table
+
+from src.models.associations import calls_tags, calls_tasks
+from src.models.call import Call
+from src.models.rollups import tag_call_daily_counts, task_status_daily_counts
+
+
+def call_day() -> ColumnElement[date]:
+    return func.date(Call.created_at, type_=Date)
+
+
+def tag_call_counts(*criteria: ColumnElement[bool], sign: int = 1) -> Select:
+    return (
+        select(call_day(), calls_tags.c.tag_id, func.count() * sign)
+        .join(Call, Call.id == calls_tags.c.call_id)
+        .where(*criteria)
+        .group_by(call_day(), calls_tags.c.tag_id)
+    )
+
+
+def task_status_counts(*criteria: ColumnElement[bool], sign: int = 1) -> Select:
+    return (
+        select(call_day(), calls_tasks.c.status, func.count() * sign)
+        .join(Call, Call.id == calls_tasks.c.call_id)
+        .where(calls_tasks.c.status.is_not(None), *criteria)
+        .group_by(call_day(), calls_tasks.c.status)
+    )
+
+
+def add_counts(dialect_name: str, table: Table, counts: Select) -> Insert:
+    dialect_insert = postgresql.insert if dialect_name == 'postgresql' else sqlite.insert
+    key_columns, count_column = list(table.primary_key.columns), [c for c in table.columns if not c.primary_key][0]
+    statement = dialect_insert(table).from_select([*key_columns, count_column], counts)
+    return statement.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={count_column.name: count_column + statement.excluded[count_column.name]},
+    )
+
+
+def rebuild_rollups(connection: Connection) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for table, rollup in ((tag_call_daily_counts, tag_call_counts()), (task_status_daily_counts, task_status_counts())):
+        connection.execute(delete(table))
+        connection.execute(insert(table).from_select(list(table.columns), rollup))
+        counts[table.name] = connection.scalar(select(func.count()).select_from(table))
+    return counts
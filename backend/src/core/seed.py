@@ -0,0 +1,189 @@
+import random
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.schema import Table
+
+from src.constants.db import TAGS_CATALOG_NAME, TEMPLATE_TASKS_CATALOG_NAME
+from src.core.rollups import rebuild_rollups
+from src.models.associations import calls_tags, calls_tasks, tasks_tags
+from src.models.call import Call
+from src.models.catalog_version import CatalogVersion
+from src.models.custom_types import TaskStatus, TaskType
+from src.models.tag import Tag
+from src.models.task import Task
+from src.utils.logger import logger
+
+TAG_WORDS: List[str] = [
+    'fire', 'flood', 'medical', 'traffic', 'power outage', 'gas leak', 'storm', 'earthquake', 'hazmat', 'rescue',
+    'noise', 'water main', 'missing person', 'animal', 'structural', 'wildfire', 'evacuation', 'cyber', 'transit', 'public health',
+]
+TASK_VERBS: List[str] = ['Dispatch', 'Notify', 'Evacuate', 'Assess', 'Close', 'Inspect', 'Secure', 'Report', 'Escalate', 'Coordinate']
+TASK_OBJECTS: List[str] = ['ambulance', 'fire unit', 'police patrol', 'utility company', 'nearby residents', 'road', 'site', 'hospital', 'media desk', 'city hall']
+STREETS: List[str] = ['Main St', 'Oak Ave', 'Harbor Rd', 'Pine St', 'Elm St', 'Market St', 'Hill Rd', 'Park Ave', 'Lake Dr', 'Station Rd']
+TASK_STATUS_WEIGHTS: Dict[TaskStatus, int] = {TaskStatus.OPEN: 5, TaskStatus.IN_PROGRESS: 3, TaskStatus.COMPLETED: 10, TaskStatus.CANCELLED: 1}
+
+
+def _next_id(connection: Connection, table: Table) -> int:
+    return (connection.scalar(select(func.max(table.c.id))) or 0) + 1
+
+
+def _insert(connection: Connection, table: Table, rows: List[Dict[str, Any]]) -> None:
+    if rows:
+        connection.execute(insert(table), rows)
+
+
+def _skewed_sample(rng: random.Random, population: Sequence[int], cum_weights: List[float], k: int) -> List[int]:
+    return list(dict.fromkeys(rng.choices(population, cum_weights=cum_weights, k=k)))
+
+
+def _seed_tags(connection: Connection, rng: random.Random, count: int, now: datetime) -> List[int]:
+    first_id: int = _next_id(connection, Tag.__table__)
+    rows: List[Dict[str, Any]] = [
+        {
+            'id': tag_id,
+            'name': f'{TAG_WORDS[tag_id % len(TAG_WORDS)]} #{tag_id}',
+            'is_active': rng.random() < 0.95,
+            'color_id': rng.randrange(8),
+            'created_at': now,
+            'updated_at': now,
+        }
+        for tag_id in range(first_id, first_id + count)
+    ]
+    _insert(connection, Tag.__table__, rows)
+    return [row['id'] for row in rows if row['is_active']]
+
+
+def _seed_template_tasks(connection: Connection, rng: random.Random, count: int, tag_ids: List[int], now: datetime) -> List[int]:
+    first_id: int = _next_id(connection, Task.__table__)
+    tasks: List[Dict[str, Any]] = []
+    links: List[Dict[str, Any]] = []
+    for task_id in range(first_id, first_id + count):
+        tasks.append({
+            'id': task_id,
+            'name': f'{rng.choice(TASK_VERBS)} {rng.choice(TASK_OBJECTS)} #{task_id}',
+            'type': TaskType.TEMPLATE,
+            'is_active': rng.random() < 0.97,
+            'created_at': now,
+            'updated_at': now,
+        })
+        links.extend({'task_id': task_id, 'tag_id': tag_id} for tag_id in rng.sample(tag_ids, k=min(len(tag_ids), rng.randint(1, 3))))
+    _insert(connection, Task.__table__, tasks)
+    _insert(connection, tasks_tags, links)
+    return [task['id'] for task in tasks if task['is_active']]
+
+
+def _seed_calls(
+    connection: Connection,
+    rng: random.Random,
+    count: int,
+    tag_ids: List[int],
+    template_task_ids: List[int],
+    days: int,
+    batch_size: int,
+    now: datetime,
+) -> Dict[str, int]:
+    counts: Dict[str, int] = {'calls': 0, 'calls_tags': 0, 'ad_hoc_tasks': 0, 'calls_tasks': 0}
+    tag_weights: List[float] = list(accumulate(1 / (rank + 1) for rank in range(len(tag_ids))))
+    statuses: List[TaskStatus] = list(TASK_STATUS_WEIGHTS)
+    status_weights: List[int] = list(TASK_STATUS_WEIGHTS.values())
+    next_call_id: int = _next_id(connection, Call.__table__)
+    next_task_id: int = _next_id(connection, Task.__table__)
+
+    for batch_start in range(0, count, batch_size):
+        calls: List[Dict[str, Any]] = []
+        call_tags: List[Dict[str, Any]] = []
+        ad_hoc_tasks: List[Dict[str, Any]] = []
+        call_tasks: List[Dict[str, Any]] = []
+
+        for _ in range(min(batch_size, count - batch_start)):
+            call_id: int = next_call_id
+            next_call_id += 1
+            created_at: datetime = now - timedelta(seconds=rng.uniform(0, days * 86400))
+            calls.append({
+                'id': call_id,
+                'name': f'{rng.choice(TAG_WORDS).capitalize()} reported at {rng.randint(1, 999)} {rng.choice(STREETS)}',
+                'description': f'Caller reported an incident, reference {call_id}' if rng.random() < 0.7 else None,
+                'created_at': created_at,
+                'updated_at': created_at,
+            })
+
+            if tag_ids:
+                call_tags.extend({'call_id': call_id, 'tag_id': tag_id} for tag_id in _skewed_sample(rng, tag_ids, tag_weights, rng.randint(0, 3)))
+            if template_task_ids:
+                call_tasks.extend(
+                    {'call_id': call_id, 'task_id': task_id, 'status': rng.choices(statuses, status_weights)[0]}
+                    for task_id in rng.sample(template_task_ids, k=min(len(template_task_ids), rng.randint(0, 3)))
+                )
+            if rng.random() < 0.2:
+                ad_hoc_tasks.append({
+                    'id': next_task_id,
+                    'name': f'Follow up with caller #{call_id}',
+                    'type': TaskType.AD_HOC,
+                    'is_active': True,
+                    'created_at': created_at,
+                    'updated_at': created_at,
+                })
+                call_tasks.append({'call_id': call_id, 'task_id': next_task_id, 'status': rng.choices(statuses, status_weights)[0]})
+                next_task_id += 1
+
+        _insert(connection, Call.__table__, calls)
+        _insert(connection, Task.__table__, ad_hoc_tasks)
+        _insert(connection, calls_tags, call_tags)
+        _insert(connection, calls_tasks, call_tasks)
+        counts['calls'] += len(calls)
+        counts['calls_tags'] += len(call_tags)
+        counts['ad_hoc_tasks'] += len(ad_hoc_tasks)
+        counts['calls_tasks'] += len(call_tasks)
+        logger.info('Seeded %s/%s calls', counts['calls'], count)
+
+    return counts
+
+
+def _reset_sequences(connection: Connection) -> None:
+    if connection.dialect.name != 'postgresql':
+        return
+    for table in ('tags', 'tasks', 'calls'):
+        connection.exec_driver_sql(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT max(id) FROM {table}))")
+
+
+def _bump_catalog_version(connection: Connection, name: str) -> None:
+    result = connection.execute(
+        update(CatalogVersion)
+        .where(CatalogVersion.name == name)
+        .values(version=CatalogVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        now: datetime = datetime.now(timezone.utc)
+        connection.execute(insert(CatalogVersion).values(name=name, version=1, created_at=now, updated_at=now))
+
+
+def seed_database(
+    connection: Connection,
+    calls: int,
+    tags: int,
+    template_tasks: int,
+    days: int = 30,
+    batch_size: int = 10000,
+    seed: int | None = None,
+) -> Dict[str, int]:
+    rng: random.Random = random.Random(seed)
+    now: datetime = datetime.now(timezone.utc)
+
+    logger.info('Seeding %s tags and %s template tasks', tags, template_tasks)
+    tag_ids: List[int] = _seed_tags(connection, rng, tags, now)
+    template_task_ids: List[int] = _seed_template_tasks(connection, rng, template_tasks, tag_ids, now)
+
+    logger.info('Seeding %s calls over the last %s days', calls, days)
+    counts: Dict[str, int] = _seed_calls(connection, rng, calls, tag_ids, template_task_ids, days, batch_size, now)
+
+    _reset_sequences(connection)
+    _bump_catalog_version(connection, TAGS_CATALOG_NAME)
+    _bump_catalog_version(connection, TEMPLATE_TASKS_CATALOG_NAME)
+
+    logger.info('Rebuilding stats rollups')
+    rebuild_rollups(connection)
+    return {'tags': tags, 'template_tasks': template_tasks, **counts}
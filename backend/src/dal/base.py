@@ -1,48 +1,81 @@
-from typing import Generic, TypeVar, Type
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Generic, List, Tuple, TypeVar, Type
 
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import inspect
+from sqlalchemy import ColumnElement, Select, Update, inspect, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants.db import ON_COMMIT_SESSION_KEY, UNIT_OF_WORK_DEPTH_SESSION_KEY
 
 ModelType: Type[BaseModel] = TypeVar('ModelType')
 
 class BaseDAL(Generic[ModelType]):
-    def __init__(self, db: Session, model: Type[ModelType]):
-        self.db: Session = db
+    def __init__(self, db: AsyncSession, model: Type[ModelType]):
+        self.db: AsyncSession = db
         self.model: Type[ModelType] = model
 
     def _has_is_active_field(self) -> bool:
         mapper = inspect(self.model)
         return 'is_active' in mapper.columns
 
-    def commit_and_refresh(self, instance: ModelType) -> ModelType:
-        self.db.commit()
-        self.db.refresh(instance)
-        return instance
-
-    def get_by_id(self, id: int) -> ModelType | None:
-        query = self.db.query(self.model).filter(self.model.id == id)
+    def _active_query(self) -> Select:
+        query: Select = select(self.model)
         if self._has_is_active_field():
-            query = query.filter(self.model.is_active.is_(True))
-        return query.first()
+            query = query.where(self.model.is_active.is_(True))
+        return query
 
-    def get_all(self) -> list[ModelType]:
-        query = self.db.query(self.model)
-        if self._has_is_active_field():
-            query = query.filter(self.model.is_active.is_(True))
-        return query.all()
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        depth: int = self.db.info.get(UNIT_OF_WORK_DEPTH_SESSION_KEY, 0)
+        self.db.info[UNIT_OF_WORK_DEPTH_SESSION_KEY] = depth + 1
+        try:
+            yield
+        except BaseException:
+            if depth == 0:
+                self.db.info.pop(ON_COMMIT_SESSION_KEY, None)
+                await self.db.rollback()
+            raise
+        finally:
+            self.db.info[UNIT_OF_WORK_DEPTH_SESSION_KEY] = depth
+
+        if depth == 0:
+            await self.db.commit()
+            callbacks: List[Tuple[Callable[..., Any], Tuple[Any, ...]]] = self.db.info.pop(ON_COMMIT_SESSION_KEY, [])
+            for callback, args in callbacks:
+                callback(*args)
+
+    def on_commit(self, callback: Callable[..., Any], *args: Any) -> None:
+        self.db.info.setdefault(ON_COMMIT_SESSION_KEY, []).append((callback, args))
+
+    async def get_by_id(self, id: int) -> ModelType | None:
+        query: Select = self._active_query().where(self.model.id == id)
+        return (await self.db.scalars(query)).first()
 
-    def get_all_active(self) -> list[ModelType]:
-        if not self._has_is_active_field():
-            return self.get_all()
-        return self.db.query(self.model).filter(self.model.is_active.is_(True)).all()
+    async def get_all(self) -> list[ModelType]:
+        return list((await self.db.scalars(self._active_query())).all())
 
-    def create(self, instance: ModelType) -> ModelType:
+    async def get_all_active(self) -> list[ModelType]:
+        return await self.get_all()
+
+    async def create(self, instance: ModelType) -> ModelType:
         self.db.add(instance)
-        return self.commit_and_refresh(instance)
+        await self.db.flush()
+        return instance
+
+    async def update(self, instance: ModelType) -> ModelType:
+        await self.db.flush()
+        return instance
+
+    async def insert_returning(self, **values: Any) -> ModelType:
+        return await self.db.scalar(insert(self.model).values(**values).returning(self.model))
 
-    def update(self, instance: ModelType) -> ModelType:
-        return self.commit_and_refresh(instance)
+    async def update_returning(self, id: int, *criteria: ColumnElement[bool], **values: Any) -> ModelType | None:
+        query: Update = update(self.model).where(self.model.id == id, *criteria)
+        if self._has_is_active_field():
+            query = query.where(self.model.is_active.is_(True))
+        return await self.db.scalar(
+            query.values(**values).returning(self.model).execution_options(populate_existing=True, synchronize_session=False)
+        )
 
-    def delete(self, instance: ModelType) -> None:
-        self.delete(instance)
+    async def delete(self, instance: ModelType) -> None:
+        await self.db.delete(instance)
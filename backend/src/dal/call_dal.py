@@ -1,70 +1,246 @@
-from typing import List, TYPE_CHECKING
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import ColumnElement, Float, Select, cast, column, exists, func, insert, literal_column, select, table, tuple_
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from src.constants.db import CALLS_FTS_COLUMN_WEIGHTS, CALLS_FTS_TABLE, CALLS_SEARCH_TS_CONFIG, CALLS_SEARCH_VECTOR_COLUMN
+from src.constants.events import CallEventType
+from src.constants.limits import DEFAULT_PAGE_LIMIT, DEFAULT_SEARCH_LIMIT, EXPORT_BATCH_SIZE
 from src.dal.base import BaseDAL
+from src.dal.stats_dal import StatsDAL
+from src.models.associations import calls_tags, calls_tasks
+from src.models.base import to_naive_utc
 from src.models.call import Call
 from src.models.tag import Tag
-from src.schemas.call import CallListItem, CallRead
+from src.models.task import Task
+from src.schemas.call import CallBulkItemResult, CallCreate, CallListItem, CallListPage, CallRead, CallSearchItem, CallSearchPage
 from src.schemas.tag import TagRead
+from src.core.events import call_event, stage_events
 from src.core.exceptions import ItemNotFoundError
-from src.utils.validations import validate_days_limit
+from src.utils.pagination import decode_cursor, decode_score_cursor, encode_cursor, encode_score_cursor
+from src.utils.search import to_fts5_match_query
+from src.utils.validations import validate_date_range, validate_days_limit, validate_page_limit, validate_search_query
 
 if TYPE_CHECKING:
     from src.dal.tag_dal import TagDAL
 
 
 class CallDAL(BaseDAL[Call]):
-    def __init__(self, db: Session, tag_dal: 'TagDAL'):
+    def __init__(self, db: AsyncSession, tag_dal: 'TagDAL'):
         super().__init__(db, Call)
         self._tag_dal = tag_dal
+        self._stats: StatsDAL = StatsDAL(db)
 
-    def list_all_calls(self) -> List[Call]:
-        return self.get_all()
+    async def list_all_calls(self) -> List[Call]:
+        return await self.get_all()
 
-    def list_all_calls_with_tags(self, days: int = 7) -> List[CallListItem]:
+    async def list_all_calls_with_tags(self, days: int = 7, limit: int = DEFAULT_PAGE_LIMIT, cursor: str | None = None) -> CallListPage:
         validate_days_limit(days)
+        validate_page_limit(limit)
         threshold_date: datetime = datetime.now(timezone.utc) - timedelta(days=days)
-        
-        calls: List[Call] = (
-            self.db.query(Call)
-            .options(joinedload(Call.tags))
-            .filter(Call.created_at >= threshold_date)
-            .all()
+
+        query: Select = (
+            select(Call)
+            .where(Call.created_at >= threshold_date)
+            .order_by(Call.created_at.desc(), Call.id.desc())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            query = query.where(tuple_(Call.created_at, Call.id) < tuple_(cursor_created_at, cursor_id))
+
+        calls: List[Call] = list((await self.db.scalars(query)).all())
+        has_more: bool = len(calls) > limit
+        calls = calls[:limit]
+
+        tags_by_call_id: Dict[int, List[TagRead]] = await self._get_active_tags_by_call_ids([c.id for c in calls])
+        next_cursor: str | None = encode_cursor(calls[-1].created_at, calls[-1].id) if has_more else None
+
+        return CallListPage(
+            items=[CallListItem.from_model(c, tags=tags_by_call_id.get(c.id, [])) for c in calls],
+            next_cursor=next_cursor,
+        )
+
+    def _ranked_matches(self, query: str) -> Tuple[Select, ColumnElement[int], ColumnElement[float]]:
+        if self.db.bind.dialect.name == 'postgresql':
+            search_vector: ColumnElement = literal_column(f'{Call.__tablename__}.{CALLS_SEARCH_VECTOR_COLUMN}')
+            ts_query: ColumnElement = func.websearch_to_tsquery(CALLS_SEARCH_TS_CONFIG, query)
+            score: ColumnElement[float] = cast(func.ts_rank_cd(search_vector, ts_query), DOUBLE_PRECISION)
+            return select(Call.id, score.label('score')).where(search_vector.bool_op('@@')(ts_query)), Call.id, score
+
+        fts_table = table(CALLS_FTS_TABLE, column('rowid'))
+        fts_ref: ColumnElement = literal_column(CALLS_FTS_TABLE)
+        score = -func.bm25(fts_ref, *CALLS_FTS_COLUMN_WEIGHTS, type_=Float)
+        return (
+            select(fts_table.c.rowid.label('id'), score.label('score'))
+            .where(fts_ref.op('MATCH')(to_fts5_match_query(query)))
+        ), fts_table.c.rowid, score
+
+    async def search_calls(
+        self,
+        query: str,
+        tag_ids: List[int] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        cursor: str | None = None,
+    ) -> CallSearchPage:
+        validate_search_query(query)
+        validate_page_limit(limit)
+        start, end = to_naive_utc(start), to_naive_utc(end)
+        validate_date_range(start, end)
+
+        ranked, ranked_id, ranked_score = self._ranked_matches(query)
+        if cursor is not None:
+            cursor_score, cursor_id = decode_score_cursor(cursor)
+            ranked = ranked.where(tuple_(ranked_score, ranked_id) < tuple_(cursor_score, cursor_id))
+
+        filters: List[ColumnElement[bool]] = []
+        if tag_ids:
+            filters.append(exists().where(calls_tags.c.call_id == Call.id, calls_tags.c.tag_id.in_(tag_ids)))
+        if start is not None:
+            filters.append(Call.created_at >= start)
+        if end is not None:
+            filters.append(Call.created_at < end)
+        if not filters:
+            ranked = ranked.order_by(ranked_score.desc(), ranked_id.desc()).limit(limit + 1)
+
+        matches = ranked.subquery()
+        search_query: Select = (
+            select(Call, matches.c.score)
+            .join(matches, matches.c.id == Call.id)
+            .where(*filters)
+            .order_by(matches.c.score.desc(), Call.id.desc())
+            .limit(limit + 1)
+        )
+        rows: List[Tuple[Call, float]] = list((await self.db.execute(search_query)).all())
+        has_more: bool = len(rows) > limit
+        rows = rows[:limit]
+
+        tags_by_call_id: Dict[int, List[TagRead]] = await self._get_active_tags_by_call_ids([call.id for call, _ in rows])
+        next_cursor: str | None = encode_score_cursor(rows[-1][1], rows[-1][0].id) if has_more else None
+
+        return CallSearchPage(
+            items=[CallSearchItem.from_model(call, score=call_score, tags=tags_by_call_id.get(call.id, [])) for call, call_score in rows],
+            next_cursor=next_cursor,
+        )
+
+    async def _get_active_tags_by_call_ids(self, call_ids: List[int]) -> Dict[int, List[TagRead]]:
+        tags_by_call_id: Dict[int, List[TagRead]] = defaultdict(list)
+        if not call_ids:
+            return tags_by_call_id
+
+        rows: List[Tuple[int, Tag]] = (
+            await self.db.execute(
+                select(calls_tags.c.call_id, Tag)
+                .join(Tag, Tag.id == calls_tags.c.tag_id)
+                .where(calls_tags.c.call_id.in_(call_ids), Tag.is_active.is_(True))
+            )
+        ).all()
+
+        for call_id, tag in rows:
+            tags_by_call_id[call_id].append(TagRead.from_model(tag))
+        return tags_by_call_id
+
+    def export_calls(self, start: datetime | None = None, end: datetime | None = None, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[List[Dict[str, Any]]]:
+        start, end = to_naive_utc(start), to_naive_utc(end)
+        validate_date_range(start, end)
+        return self._iter_export_batches(start, end, batch_size)
+
+    async def _iter_export_batches(self, start: datetime | None, end: datetime | None, batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        query: Select = (
+            select(Call.id, Call.name, Call.description, Call.created_at, Call.updated_at)
+            .order_by(Call.created_at, Call.id)
+            .execution_options(yield_per=batch_size)
         )
-        
-        return [CallListItem.from_model(c) for c in calls]
+        if start is not None:
+            query = query.where(Call.created_at >= start)
+        if end is not None:
+            query = query.where(Call.created_at < end)
 
-    def get_call_by_id(self, call_id: int) -> Call:
-        call: Call | None = self.get_by_id(call_id)
+        result = await self.db.stream(query)
+        async for rows in result.partitions():
+            call_ids: List[int] = [row.id for row in rows]
+            tags_by_call_id: Dict[int, List[Dict[str, Any]]] = await self._get_export_tags(call_ids)
+            tasks_by_call_id: Dict[int, List[Dict[str, Any]]] = await self._get_export_tasks(call_ids)
+            yield [
+                {
+                    'id': row.id,
+                    'name': row.name,
+                    'description': row.description,
+                    'created_at': row.created_at,
+                    'updated_at': row.updated_at,
+                    'tags': tags_by_call_id.get(row.id, []),
+                    'tasks': tasks_by_call_id.get(row.id, []),
+                }
+                for row in rows
+            ]
+
+    async def _get_export_tags(self, call_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        tags_by_call_id: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        rows = await self.db.execute(
+            select(calls_tags.c.call_id, Tag.id, Tag.name)
+            .join(Tag, Tag.id == calls_tags.c.tag_id)
+            .where(calls_tags.c.call_id.in_(call_ids), Tag.is_active.is_(True))
+        )
+        for call_id, tag_id, tag_name in rows:
+            tags_by_call_id[call_id].append({'id': tag_id, 'name': tag_name})
+        return tags_by_call_id
+
+    async def _get_export_tasks(self, call_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        tasks_by_call_id: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        rows = await self.db.execute(
+            select(calls_tasks.c.call_id, Task.id, Task.name, calls_tasks.c.status)
+            .join(Task, Task.id == calls_tasks.c.task_id)
+            .where(calls_tasks.c.call_id.in_(call_ids), Task.is_active.is_(True))
+        )
+        for call_id, task_id, task_name, task_status in rows:
+            tasks_by_call_id[call_id].append({'id': task_id, 'name': task_name, 'status': task_status.value})
+        return tasks_by_call_id
+
+    async def get_call_by_id(self, call_id: int) -> Call:
+        call: Call | None = await self.get_by_id(call_id)
         if call is None:
             raise ItemNotFoundError(f'Call with id {call_id} not found')
         return call
 
-    def get_call_details(self, call_id: int) -> CallRead:
+    async def _get_call_with_tags_and_tasks(self, call_id: int) -> Call:
         call: Call | None = (
-            self.db.query(Call)
-            .options(joinedload(Call.tags), joinedload(Call.tasks))
-            .filter(Call.id == call_id)
-            .first()
-        )
+            await self.db.scalars(
+                select(Call)
+                .options(selectinload(Call.tags), selectinload(Call.tasks))
+                .where(Call.id == call_id)
+                .execution_options(populate_existing=True)
+            )
+        ).first()
 
         if call is None:
             raise ItemNotFoundError(f'Call with id {call_id} not found')
 
+        return call
+
+    async def get_call_details(self, call_id: int) -> CallRead:
+        call: Call = await self._get_call_with_tags_and_tasks(call_id)
         return CallRead.from_model(call)
 
-    def create_call(self, name: str, tag_ids: List[int], description: str | None = None) -> CallRead:
-        call: Call = Call(name=name, description=description)
-        tags: List[Tag] = []
+    async def create_call(self, name: str, tag_ids: List[int], description: str | None = None) -> CallRead:
+        async with self.unit_of_work():
+            call: Call = Call(name=name, description=description)
+            tags: List[Tag] = []
 
-        if tag_ids and self._tag_dal:
-            all_active_tags = self._tag_dal.get_all_active()
-            tags = [tag for tag in all_active_tags if tag.id in tag_ids]
-            call.tags = tags
+            if tag_ids and self._tag_dal:
+                tags = await self._tag_dal.get_active_tags_by_ids(tag_ids)
+                call.tags = tags
 
-        call = self.create(call)
+            self.db.add(call)
+            await self.db.flush()
+            if tags:
+                await self._stats.add_call_tags([call.id])
+            stage_events(self.db, call_event(CallEventType.CALL_CREATED, call.id, tag_ids=[tag.id for tag in tags]))
 
         return CallRead(
             id=call.id,
@@ -76,34 +252,80 @@ class CallDAL(BaseDAL[Call]):
             tasks=[],
         )
 
-    def update_call(self, call_id: int, name: str | None = None, description: str | None = None) -> Call:
-        call: Call = self.get_call_by_id(call_id)
+    def _apply_call_changes(self, call: Call, name: str | None, description: str | None) -> None:
         if name is not None:
             call.name = name
         if description is not None:
             call.description = description if description else None
 
-        return self.update(call)
-
-    def update_call_and_tags(self, call_id: int, name: str | None = None, description: str | None = None, tag_ids: List[int] | None = None) -> CallRead:
-        call: Call = self.get_call_by_id(call_id)
-        tags: List[Tag] = []
-        if tag_ids is not None and self._tag_dal:
-            all_active_tags = self._tag_dal.get_all_active()
-            tags = [tag for tag in all_active_tags if tag.id in tag_ids]
-            call.tags = tags
-            self.commit_and_refresh(call)
-
-        call = self.update_call(call_id, name=name, description=description)
-        
-        call_with_tasks: Call | None = (
-            self.db.query(Call)
-            .options(joinedload(Call.tags), joinedload(Call.tasks))
-            .filter(Call.id == call_id)
-            .first()
+    async def update_call(self, call_id: int, name: str | None = None, description: str | None = None) -> Call:
+        async with self.unit_of_work():
+            changes: Dict[str, Any] = {'name': name} if name is not None else {}
+            if description is not None:
+                changes['description'] = description if description else None
+            call: Call | None = await self.update_returning(call_id, **changes) if changes else await self.get_by_id(call_id)
+            if call is None:
+                raise ItemNotFoundError(f'Call with id {call_id} not found')
+            stage_events(self.db, call_event(CallEventType.CALL_UPDATED, call.id))
+        return call
+
+    async def update_call_and_tags(self, call_id: int, name: str | None = None, description: str | None = None, tag_ids: List[int] | None = None) -> CallRead:
+        async with self.unit_of_work():
+            call: Call = await self._get_call_with_tags_and_tasks(call_id)
+            if tag_ids is not None and self._tag_dal:
+                tags: List[Tag] = await self._tag_dal.get_active_tags_by_ids(tag_ids)
+                if {tag.id for tag in tags} != {tag.id for tag in call.tags}:
+                    await self._stats.add_call_tags([call.id], sign=-1)
+                    call.tags = tags
+                    await self.db.flush()
+                    await self._stats.add_call_tags([call.id])
+                    stage_events(self.db, call_event(CallEventType.CALL_TAGS_CHANGED, call.id, tag_ids=[tag.id for tag in tags]))
+            if name is not None or description is not None:
+                stage_events(self.db, call_event(CallEventType.CALL_UPDATED, call.id))
+            self._apply_call_changes(call, name, description)
+            await self.db.flush()
+
+        return CallRead.from_model(call)
+
+    async def bulk_create_calls(self, items: List[Tuple[int, CallCreate]]) -> List[CallBulkItemResult]:
+        results: List[CallBulkItemResult] = []
+        valid_items: List[Tuple[int, CallCreate]] = []
+        active_tag_ids: Set[int] = await self._tag_dal.get_active_tag_ids() if self._tag_dal else set()
+
+        for index, item in items:
+            unknown_tag_ids: List[int] = [tag_id for tag_id in item.tag_ids if tag_id not in active_tag_ids]
+            if unknown_tag_ids:
+                results.append(CallBulkItemResult(index=index, error=f'Tags with ids {unknown_tag_ids} not found'))
+            else:
+                valid_items.append((index, item))
+
+        if not valid_items:
+            return results
+
+        async with self.unit_of_work():
+            call_ids: List[int] = list(
+                await self.db.scalars(
+                    insert(Call.__table__).returning(Call.__table__.c.id, sort_by_parameter_order=True),
+                    [{'name': item.name, 'description': item.description} for _, item in valid_items],
+                )
+            )
+
+            call_tag_rows: List[Dict[str, Any]] = [
+                {'call_id': call_id, 'tag_id': tag_id}
+                for call_id, (_, item) in zip(call_ids, valid_items)
+                for tag_id in dict.fromkeys(item.tag_ids)
+            ]
+            if call_tag_rows:
+                await self.db.execute(calls_tags.insert(), call_tag_rows)
+                await self._stats.add_call_tags(call_ids)
+
+            stage_events(self.db, *(
+                call_event(CallEventType.CALL_CREATED, call_id, tag_ids=list(dict.fromkeys(item.tag_ids)))
+                for call_id, (_, item) in zip(call_ids, valid_items)
+            ))
+
+        results.extend(
+            CallBulkItemResult(index=index, id=call_id)
+            for call_id, (index, _) in zip(call_ids, valid_items)
         )
-        
-        if call_with_tasks is None:
-            raise ItemNotFoundError(f'Call with id {call_id} not found')
-        
-        return CallRead.from_model(call_with_tasks)
+        return results
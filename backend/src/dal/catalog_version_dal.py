@@ -0,0 +1,34 @@
+from typing import Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dal.base import BaseDAL
+from src.models.base import utc_now
+from src.models.catalog_version import CatalogVersion
+
+
+class CatalogVersionDAL(BaseDAL[CatalogVersion]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, CatalogVersion)
+
+    async def get_version(self, name: str) -> int:
+        version: int | None = await self.db.scalar(select(CatalogVersion.version).where(CatalogVersion.name == name))
+        return version or 0
+
+    async def get_versions(self, names: List[str]) -> Dict[str, int]:
+        versions: Dict[str, int] = dict.fromkeys(names, 0)
+        rows = await self.db.execute(select(CatalogVersion.name, CatalogVersion.version).where(CatalogVersion.name.in_(names)))
+        versions.update({name: version for name, version in rows})
+        return versions
+
+    async def bump(self, name: str) -> int:
+        dialect_insert = postgresql.insert if self.db.bind.dialect.name == 'postgresql' else sqlite.insert
+        statement = dialect_insert(CatalogVersion).values(name=name, version=1)
+        return await self.db.scalar(
+            statement.on_conflict_do_update(
+                index_elements=[CatalogVersion.name],
+                set_={'version': CatalogVersion.version + 1, 'updated_at': utc_now()},
+            ).returning(CatalogVersion.version)
+        )
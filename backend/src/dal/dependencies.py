@@ -1,25 +1,43 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db import get_db
+from src.core.db import get_async_db
 from src.dal.call_dal import CallDAL
+from src.dal.catalog_version_dal import CatalogVersionDAL
+from src.dal.stats_dal import StatsDAL
+from src.dal.suggestion_dal import SuggestionDAL
 from src.dal.tag_dal import TagDAL
 from src.dal.task_dal import TaskDAL
 
 
-def get_tag_dal(db: Session = Depends(get_db)) -> TagDAL:
+async def get_tag_dal(db: AsyncSession = Depends(get_async_db)) -> TagDAL:
     return TagDAL(db)
 
 
-def get_task_dal(
-    db: Session = Depends(get_db),
+async def get_task_dal(
+    db: AsyncSession = Depends(get_async_db),
     tag_dal: TagDAL = Depends(get_tag_dal)
 ) -> TaskDAL:
     return TaskDAL(db, tag_dal)
 
 
-def get_call_dal(
-    db: Session = Depends(get_db),
+async def get_call_dal(
+    db: AsyncSession = Depends(get_async_db),
     tag_dal: TagDAL = Depends(get_tag_dal)
 ) -> CallDAL:
     return CallDAL(db, tag_dal)
+
+
+async def get_catalog_version_dal(db: AsyncSession = Depends(get_async_db)) -> CatalogVersionDAL:
+    return CatalogVersionDAL(db)
+
+
+async def get_stats_dal(db: AsyncSession = Depends(get_async_db)) -> StatsDAL:
+    return StatsDAL(db)
+
+
+async def get_suggestion_dal(
+    db: AsyncSession = Depends(get_async_db),
+    tag_dal: TagDAL = Depends(get_tag_dal)
+) -> SuggestionDAL:
+    return SuggestionDAL(db, tag_dal)
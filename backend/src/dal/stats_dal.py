@@ -0,0 +1,63 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+
+from sqlalchemy import ColumnElement, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants.limits import DEFAULT_STATS_DAYS
+from src.core.rollups import add_counts, tag_call_counts, task_status_counts
+from src.models.associations import calls_tags, calls_tasks
+from src.models.rollups import tag_call_daily_counts, task_status_daily_counts
+from src.schemas.stats import StatsRead, TagCallDailyCount, TaskStatusDailyCount
+from src.utils.validations import validate_stats_range
+
+
+class StatsDAL:
+    def __init__(self, db: AsyncSession):
+        self.db: AsyncSession = db
+
+    async def add_call_tags(self, call_ids: List[int], sign: int = 1) -> None:
+        counts: Select = tag_call_counts(calls_tags.c.call_id.in_(call_ids), sign=sign)
+        await self.db.execute(add_counts(self.db.bind.dialect.name, tag_call_daily_counts, counts))
+
+    async def add_call_tasks(self, task_id: int, call_id: int | None = None, sign: int = 1) -> None:
+        await self.add_call_task_links(
+            calls_tasks.c.task_id == task_id,
+            *([calls_tasks.c.call_id == call_id] if call_id is not None else []),
+            sign=sign,
+        )
+
+    async def add_call_task_links(self, *criteria: ColumnElement[bool], sign: int = 1) -> None:
+        counts: Select = task_status_counts(*criteria, sign=sign)
+        await self.db.execute(add_counts(self.db.bind.dialect.name, task_status_daily_counts, counts))
+
+    async def get_stats(self, start: date | None = None, end: date | None = None, tag_ids: List[int] | None = None) -> StatsRead:
+        end = end or datetime.now(timezone.utc).date()
+        start = start or end - timedelta(days=DEFAULT_STATS_DAYS - 1)
+        validate_stats_range(start, end)
+
+        tag_calls_query: Select = (
+            select(tag_call_daily_counts)
+            .where(tag_call_daily_counts.c.day.between(start, end), tag_call_daily_counts.c.call_count > 0)
+            .order_by(tag_call_daily_counts.c.day, tag_call_daily_counts.c.tag_id)
+        )
+        if tag_ids:
+            tag_calls_query = tag_calls_query.where(tag_call_daily_counts.c.tag_id.in_(tag_ids))
+        task_statuses_query: Select = (
+            select(task_status_daily_counts)
+            .where(task_status_daily_counts.c.day.between(start, end), task_status_daily_counts.c.task_count > 0)
+            .order_by(task_status_daily_counts.c.day, task_status_daily_counts.c.status)
+        )
+
+        return StatsRead(
+            start=start,
+            end=end,
+            tag_calls=[
+                TagCallDailyCount.construct_trusted(day=day, tag_id=tag_id, call_count=call_count)
+                for day, tag_id, call_count in await self.db.execute(tag_calls_query)
+            ],
+            task_statuses=[
+                TaskStatusDailyCount.construct_trusted(day=day, status=status, task_count=task_count)
+                for day, status, task_count in await self.db.execute(task_statuses_query)
+            ],
+        )
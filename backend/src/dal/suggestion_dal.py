@@ -0,0 +1,81 @@
+from typing import Dict, List, Set
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants.db import TEMPLATE_TASKS_CATALOG_NAME
+from src.core.exceptions import ItemNotFoundError
+from src.dal.catalog_version_dal import CatalogVersionDAL
+from src.dal.suggestion_index import SuggestionIndex, suggestion_index
+from src.dal.tag_dal import TagDAL
+from src.models.associations import calls_tags, calls_tasks, tasks_tags
+from src.models.call import Call
+from src.models.custom_types import TaskType
+from src.models.tag import Tag
+from src.models.task import Task
+from src.schemas.associations import TagWithSuggestedTasks
+from src.schemas.task import SuggestedTaskRead, TaskRead
+from src.utils.validations import validate_tag_ids
+
+
+class SuggestionDAL:
+    def __init__(self, db: AsyncSession, tag_dal: TagDAL, index: SuggestionIndex = suggestion_index):
+        self.db: AsyncSession = db
+        self._tag_dal: TagDAL = tag_dal
+        self._index: SuggestionIndex = index
+        self._versions: CatalogVersionDAL = CatalogVersionDAL(db)
+
+    async def _get_index(self, version: int | None = None) -> SuggestionIndex:
+        if version is None:
+            version = await self._versions.get_version(TEMPLATE_TASKS_CATALOG_NAME)
+        if self._index.is_current(version):
+            return self._index
+
+        rows = (
+            await self.db.execute(
+                select(Task.id, Task.name, Task.created_at, Task.updated_at, Task.is_active, Task.type, tasks_tags.c.tag_id)
+                .outerjoin(tasks_tags, tasks_tags.c.task_id == Task.id)
+                .where(Task.type == TaskType.TEMPLATE, Task.is_active.is_(True))
+            )
+        ).all()
+
+        tasks: Dict[int, TaskRead] = {}
+        tag_ids: Dict[int, List[int]] = {}
+        for task_id, name, created_at, updated_at, is_active, task_type, tag_id in rows:
+            if task_id not in tasks:
+                tasks[task_id] = TaskRead.construct_trusted(
+                    id=task_id, name=name, created_at=created_at, updated_at=updated_at, is_active=is_active, type=task_type
+                )
+                tag_ids[task_id] = []
+            if tag_id is not None:
+                tag_ids[task_id].append(tag_id)
+
+        self._index.load(version, [(task, tag_ids[task_id]) for task_id, task in tasks.items()])
+        return self._index
+
+    async def get_tag_with_suggested_tasks(self, tag_id: int, version: int | None = None) -> TagWithSuggestedTasks:
+        tag: Tag = await self._tag_dal.get_tag_by_id(tag_id)
+        index: SuggestionIndex = await self._get_index(version)
+        return TagWithSuggestedTasks.from_model(tag, suggested_tasks=index.tasks_for_tag(tag_id))
+
+    async def suggest_for_tags(self, tag_ids: List[int], version: int | None = None) -> List[SuggestedTaskRead]:
+        validate_tag_ids(tag_ids)
+        active_tag_ids: Set[int] = await self._tag_dal.get_active_tag_ids()
+        index: SuggestionIndex = await self._get_index(version)
+        return index.suggest(tag_id for tag_id in tag_ids if tag_id in active_tag_ids)
+
+    async def suggest_for_call(self, call_id: int) -> List[SuggestedTaskRead]:
+        index: SuggestionIndex = await self._get_index()
+        rows = (
+            await self.db.execute(
+                select(Call.id, Tag.id)
+                .outerjoin(calls_tags, calls_tags.c.call_id == Call.id)
+                .outerjoin(Tag, and_(Tag.id == calls_tags.c.tag_id, Tag.is_active.is_(True)))
+                .where(Call.id == call_id)
+            )
+        ).all()
+        if not rows:
+            raise ItemNotFoundError(f'Call with id {call_id} not found')
+
+        linked_task_ids: Set[int] = set(await self.db.scalars(select(calls_tasks.c.task_id).where(calls_tasks.c.call_id == call_id)))
+        return index.suggest((tag_id for _, tag_id in rows if tag_id is not None), exclude_task_ids=linked_task_ids)
@@ -0,0 +1,104 @@
+from typing import Collection, Dict, Iterable, List, Tuple
+
+from src.schemas.task import SuggestedTaskRead, TaskRead
+
+
+class SuggestionIndex:
+    def __init__(self):
+        self.version: int | None = None
+        self._tasks: List[TaskRead | None] = []
+        self._task_tag_ids: List[Tuple[int, ...]] = []
+        self._slots_by_task_id: Dict[int, int] = {}
+        self._free_slots: List[int] = []
+        self._bits_by_tag_id: Dict[int, int] = {}
+
+    def is_current(self, version: int) -> bool:
+        return self.version == version
+
+    def load(self, version: int, tasks: Iterable[Tuple[TaskRead, Iterable[int]]]) -> None:
+        self._tasks = []
+        self._task_tag_ids = []
+        self._slots_by_task_id = {}
+        self._free_slots = []
+        self._bits_by_tag_id = {}
+        for task, tag_ids in sorted(tasks, key=lambda item: item[0].id):
+            self._add(task, tag_ids)
+        self.version = version
+
+    def invalidate(self) -> None:
+        self.version = None
+
+    def apply(self, version: int, task: TaskRead, tag_ids: Iterable[int] | None = None) -> None:
+        if not self.is_current(version - 1):
+            self.invalidate()
+            return
+
+        previous_tag_ids: Tuple[int, ...] = self._remove(task.id)
+        if task.is_active:
+            self._add(task, previous_tag_ids if tag_ids is None else tag_ids)
+        self.version = version
+
+    def _add(self, task: TaskRead, tag_ids: Iterable[int]) -> None:
+        if self._free_slots:
+            slot: int = self._free_slots.pop()
+            self._tasks[slot] = task
+            self._task_tag_ids[slot] = tuple(dict.fromkeys(tag_ids))
+        else:
+            slot = len(self._tasks)
+            self._tasks.append(task)
+            self._task_tag_ids.append(tuple(dict.fromkeys(tag_ids)))
+        self._slots_by_task_id[task.id] = slot
+
+        bit: int = 1 << slot
+        for tag_id in self._task_tag_ids[slot]:
+            self._bits_by_tag_id[tag_id] = self._bits_by_tag_id.get(tag_id, 0) | bit
+
+    def _remove(self, task_id: int) -> Tuple[int, ...]:
+        slot: int | None = self._slots_by_task_id.pop(task_id, None)
+        if slot is None:
+            return ()
+
+        tag_ids: Tuple[int, ...] = self._task_tag_ids[slot]
+        for tag_id in tag_ids:
+            bits: int = self._bits_by_tag_id[tag_id] & ~(1 << slot)
+            if bits:
+                self._bits_by_tag_id[tag_id] = bits
+            else:
+                del self._bits_by_tag_id[tag_id]
+        self._tasks[slot] = None
+        self._task_tag_ids[slot] = ()
+        self._free_slots.append(slot)
+        return tag_ids
+
+    def tasks_for_tag(self, tag_id: int) -> List[TaskRead]:
+        tasks: List[TaskRead] = []
+        bits: int = self._bits_by_tag_id.get(tag_id, 0)
+        while bits:
+            lowest: int = bits & -bits
+            bits ^= lowest
+            tasks.append(self._tasks[lowest.bit_length() - 1])
+        return sorted(tasks, key=lambda task: task.id)
+
+    def suggest(self, tag_ids: Iterable[int], exclude_task_ids: Collection[int] = ()) -> List[SuggestedTaskRead]:
+        tag_bits: Dict[int, int] = {tag_id: self._bits_by_tag_id[tag_id] for tag_id in dict.fromkeys(tag_ids) if tag_id in self._bits_by_tag_id}
+
+        candidates: int = 0
+        for bits in tag_bits.values():
+            candidates |= bits
+        for task_id in exclude_task_ids:
+            slot: int | None = self._slots_by_task_id.get(task_id)
+            if slot is not None:
+                candidates &= ~(1 << slot)
+
+        suggestions: List[SuggestedTaskRead] = []
+        while candidates:
+            lowest: int = candidates & -candidates
+            candidates ^= lowest
+            task: TaskRead = self._tasks[lowest.bit_length() - 1]
+            suggestions.append(SuggestedTaskRead.from_task(task, [tag_id for tag_id, bits in tag_bits.items() if bits & lowest]))
+
+        suggestions.sort(key=lambda suggestion: (-len(suggestion.matched_tag_ids), suggestion.id))
+        return suggestions
+
+
+suggestion_index: SuggestionIndex = SuggestionIndex()
@@ -0,0 +1,46 @@
+from typing import Dict, Iterable, List, Set
+
+from src.models.tag import Tag
+
+
+class TagCatalog:
+    def __init__(self):
+        self.version: int | None = None
+        self._tags_by_id: Dict[int, Tag] = {}
+        self._tags_by_name: Dict[str, Tag] = {}
+
+    def is_current(self, version: int) -> bool:
+        return self.version == version
+
+    def load(self, version: int, tags: Iterable[Tag]) -> None:
+        tags_by_id: Dict[int, Tag] = {tag.id: tag for tag in sorted(tags, key=lambda t: t.id)}
+        self._tags_by_id = tags_by_id
+        self._tags_by_name = {tag.name: tag for tag in tags_by_id.values()}
+        self.version = version
+
+    def invalidate(self) -> None:
+        self.version = None
+
+    def get_active(self, tag_id: int) -> Tag | None:
+        tag: Tag | None = self._tags_by_id.get(tag_id)
+        return tag if tag is not None and tag.is_active else None
+
+    def get_by_name(self, name: str) -> Tag | None:
+        return self._tags_by_name.get(name)
+
+    def get_active_by_ids(self, tag_ids: Iterable[int]) -> List[Tag]:
+        tags: List[Tag] = []
+        for tag_id in dict.fromkeys(tag_ids):
+            tag: Tag | None = self.get_active(tag_id)
+            if tag is not None:
+                tags.append(tag)
+        return tags
+
+    def active_ids(self) -> Set[int]:
+        return {tag.id for tag in self._tags_by_id.values() if tag.is_active}
+
+    def list_active(self) -> List[Tag]:
+        return [tag for tag in self._tags_by_id.values() if tag.is_active]
+
+
+tag_catalog: TagCatalog = TagCatalog()
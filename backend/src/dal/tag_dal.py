@@ -1,64 +1,97 @@
-from typing import List
+from typing import Any, Dict, List, Set
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from src.constants.db import TAGS_CATALOG_NAME
 from src.dal.base import BaseDAL
+from src.dal.catalog_version_dal import CatalogVersionDAL
+from src.dal.tag_catalog import TagCatalog, tag_catalog
 from src.models.tag import Tag
-from src.models.custom_types import TaskType
 from src.schemas.tag import TagRead
-from src.schemas.associations import TagWithSuggestedTasks
-from src.schemas.task import TaskRead
-from src.core.exceptions import ItemNotFoundError
+from src.core.exceptions import ItemAlreadyExistsError, ItemNotFoundError
 
 class TagDAL(BaseDAL[Tag]):
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, catalog: TagCatalog = tag_catalog):
         super().__init__(db, Tag)
+        self._catalog: TagCatalog = catalog
+        self._catalog_checked: bool = False
+        self._versions: CatalogVersionDAL = CatalogVersionDAL(db)
 
-    def list_all_tags(self) -> List[Tag]:
-        return self.get_all()
+    async def _get_catalog(self) -> TagCatalog:
+        if self._catalog_checked and self._catalog.version is not None:
+            return self._catalog
 
-    def get_tag_by_id(self, tag_id: int) -> Tag:
-        tag: Tag | None = self.get_by_id(tag_id)
+        version: int = await self._versions.get_version(TAGS_CATALOG_NAME)
+        if not self._catalog.is_current(version):
+            rows = (await self.db.execute(select(*Tag.__table__.columns))).mappings().all()
+            tags: List[Tag] = [Tag(**row) for row in rows]
+            for tag in tags:
+                make_transient_to_detached(tag)
+            self._catalog.load(version, tags)
+
+        self._catalog_checked = True
+        return self._catalog
+
+    async def get_catalog_version(self) -> int:
+        return (await self._get_catalog()).version
+
+    def _invalidate_catalog(self) -> None:
+        self._catalog.invalidate()
+        self._catalog_checked = False
+
+    async def get_all_active(self) -> List[Tag]:
+        return (await self._get_catalog()).list_active()
+
+    async def list_all_tags(self) -> List[Tag]:
+        return await self.get_all_active()
+
+    async def get_tag_by_id(self, tag_id: int) -> Tag:
+        tag: Tag | None = (await self._get_catalog()).get_active(tag_id)
         if tag is None:
             raise ItemNotFoundError(f'Tag with id {tag_id} not found')
         return tag
-    
-    def get_tags_by_ids(self, tag_ids: List[int]) -> List[TagRead]:
-        tags: List[Tag] = [
-            tag for tag in self.get_all_active()
-            if tag.id in tag_ids
-        ]
+
+    async def get_tags_by_ids(self, tag_ids: List[int]) -> List[TagRead]:
+        tags: List[Tag] = (await self._get_catalog()).get_active_by_ids(tag_ids)
         return [TagRead.from_model(t) for t in tags]
 
-    def get_tag_with_suggested_tasks(self, tag_id: int) -> TagWithSuggestedTasks:
-        tag: Tag | None = (
-            self.db.query(Tag)
-            .options(joinedload(Tag.tasks))
-            .filter(Tag.id == tag_id, Tag.is_active.is_(True))
-            .first()
-        )
-        if tag is None:
-            raise ItemNotFoundError(f'Tag with id {tag_id} not found')
+    async def get_active_tags_by_ids(self, tag_ids: List[int]) -> List[Tag]:
+        tags: List[Tag] = (await self._get_catalog()).get_active_by_ids(tag_ids)
+        return [await self.db.merge(tag, load=False) for tag in tags]
 
-        template_tasks: List[TaskRead] = [TaskRead.from_model(t) for t in tag.tasks if t.type == TaskType.TEMPLATE and t.is_active]
-    
-        return TagWithSuggestedTasks.from_model(tag, suggested_tasks=template_tasks)
+    async def get_active_tag_ids(self) -> Set[int]:
+        return (await self._get_catalog()).active_ids()
 
-    def create_tag(self, name: str, color_id: int = 0) -> Tag:
-        tag: Tag = Tag(name=name, color_id=color_id)
-        return self.create(tag)
-    
-    def update_tag(self, tag_id: int, name: str | None = None, is_active: bool | None = None, color_id: int | None = None) -> Tag:
-        tag: Tag | None = self.get_tag_by_id(tag_id)
+    async def _validate_unique_name(self, name: str, tag_id: int | None = None) -> None:
+        existing: Tag | None = (await self._get_catalog()).get_by_name(name)
+        if existing is not None and existing.id != tag_id:
+            raise ItemAlreadyExistsError(f'Tag with name {name} already exists')
 
-        if name is not None:
-            tag.name = name
-        if is_active is not None:
-            tag.is_active = is_active
-        if color_id is not None:
-            tag.color_id = color_id
+    async def create_tag(self, name: str, color_id: int = 0) -> Tag:
+        async with self.unit_of_work():
+            await self._validate_unique_name(name)
+            await self._versions.bump(TAGS_CATALOG_NAME)
+            tag: Tag = await self.insert_returning(name=name, color_id=color_id)
+            self.on_commit(self._invalidate_catalog)
+        return tag
+
+    async def update_tag(self, tag_id: int, name: str | None = None, is_active: bool | None = None, color_id: int | None = None) -> Tag:
+        changes: Dict[str, Any] = {
+            key: value for key, value in {'name': name, 'is_active': is_active, 'color_id': color_id}.items() if value is not None
+        }
+        async with self.unit_of_work():
+            if name is not None:
+                await self.get_tag_by_id(tag_id)
+                await self._validate_unique_name(name, tag_id=tag_id)
 
-        return self.update(tag)
+            await self._versions.bump(TAGS_CATALOG_NAME)
+            tag: Tag | None = await self.update_returning(tag_id, **changes)
+            if tag is None:
+                raise ItemNotFoundError(f'Tag with id {tag_id} not found')
+            self.on_commit(self._invalidate_catalog)
+        return tag
 
-    def deactivate(self, tag_id: int) -> None:
-        self.update_tag(tag_id, is_active=False)
+    async def deactivate(self, tag_id: int) -> None:
+        await self.update_tag(tag_id, is_active=False)
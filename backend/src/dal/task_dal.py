@@ -1,161 +1,283 @@
-from typing import Dict, List, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import ColumnElement, Select, delete, literal, or_, select, true, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from src.constants.db import TEMPLATE_TASKS_CATALOG_NAME
+from src.constants.events import CallEventType
 from src.dal.base import BaseDAL
-from src.models.associations import calls_tasks
+from src.dal.catalog_version_dal import CatalogVersionDAL
+from src.dal.stats_dal import StatsDAL
+from src.dal.suggestion_index import SuggestionIndex, suggestion_index
+from src.models.associations import calls_tags, calls_tasks, tasks_tags
+from src.models.call import Call
 from src.models.custom_types import TaskStatus
 from src.models.tag import Tag
 from src.models.task import Task, TaskType
-from src.schemas.task import CallTaskRead, TemplateTaskRead
+from src.schemas.task import CallTaskLink, CallTaskLinkResult, CallTaskRead, TaskRead, TemplateTaskRead
+from src.core.events import call_event, stage_events
 from src.core.exceptions import ItemNotFoundError, InvalidTaskTypeError
+from src.utils.validations import validate_call_ids, validate_link_ids
 
 if TYPE_CHECKING:
     from src.dal.tag_dal import TagDAL
 
 
 class TaskDAL(BaseDAL[Task]):
-    def __init__(self, db: Session, tag_dal: 'TagDAL'):
+    def __init__(self, db: AsyncSession, tag_dal: 'TagDAL', suggestions: SuggestionIndex = suggestion_index):
         super().__init__(db, Task)
         self._tag_dal = tag_dal
+        self._suggestions: SuggestionIndex = suggestions
+        self._versions: CatalogVersionDAL = CatalogVersionDAL(db)
+        self._stats: StatsDAL = StatsDAL(db)
 
-    def list_all_tasks(self) -> List[Task]:
-        return self.get_all()
-    
-    def list_all_template_tasks(self) -> List[TemplateTaskRead]:
+    async def list_all_tasks(self) -> List[Task]:
+        return await self.get_all()
+
+    async def list_all_template_tasks(self) -> List[TemplateTaskRead]:
         tasks: List[Task] = (
-            self.db.query(Task)
-            .options(joinedload(Task.tags))
-            .filter(Task.type == TaskType.TEMPLATE, Task.is_active.is_(True))
-            .all()
-        )
+            await self.db.scalars(
+                select(Task)
+                .options(selectinload(Task.tags))
+                .where(Task.type == TaskType.TEMPLATE, Task.is_active.is_(True))
+            )
+        ).all()
 
         return [TemplateTaskRead.from_model(t) for t in tasks]
 
-    def get_task_by_id(self, task_id: int) -> Task:
-        task: Task | None = self.get_by_id(task_id)
+    async def get_task_by_id(self, task_id: int) -> Task:
+        task: Task | None = await self.get_by_id(task_id)
         if task is None:
             raise ItemNotFoundError(f'Task with id {task_id} not found')
         return task
 
-    def get_template_task_by_id(self, task_id: int) -> TemplateTaskRead:
-        task: Task = self.get_task_by_id(task_id)
+    async def _get_task_with_tags(self, task_id: int) -> Task:
+        task: Task | None = (
+            await self.db.scalars(
+                select(Task)
+                .options(selectinload(Task.tags))
+                .where(Task.id == task_id, Task.is_active.is_(True))
+                .execution_options(populate_existing=True)
+            )
+        ).first()
+        if task is None:
+            raise ItemNotFoundError(f'Task with id {task_id} not found')
+        return task
+
+    async def get_template_task_by_id(self, task_id: int) -> TemplateTaskRead:
+        task: Task = await self._get_task_with_tags(task_id)
         if task.type != TaskType.TEMPLATE:
             raise InvalidTaskTypeError(f'Task with id {task_id} is not a template task')
 
         return TemplateTaskRead.from_model(task)
 
-    def create_template_task(self, name: str, tag_ids: List[int] | None = None) -> Task:
-        task: Task = Task(name=name, type=TaskType.TEMPLATE)
-        
-        if tag_ids and self._tag_dal:
-            all_active_tags = self._tag_dal.get_all_active()
-            tags: List[Tag] = [tag for tag in all_active_tags if tag.id in tag_ids]
-            task.tags = tags
-        
-        return self.create(task)
-
-    def create_ad_hoc_task(self, name: str, call_id: int, status: TaskStatus = TaskStatus.OPEN) -> Task:
-        task: Task = Task(name=name, type=TaskType.AD_HOC)
-        task = self.create(task)
-        
-        self.db.execute(
-            calls_tasks.insert().values(
-                task_id=task.id,
-                call_id=call_id,
-                status=status
-            )
-        )
-        self.db.commit()
-        return task
+    async def create_template_task(self, name: str, tag_ids: List[int] | None = None) -> TemplateTaskRead:
+        async with self.unit_of_work():
+            tags: List[Tag] = []
+            if tag_ids and self._tag_dal:
+                tags = await self._tag_dal.get_active_tags_by_ids(tag_ids)
 
-    def update_task(self, task_id: int, name: str | None = None, is_active: bool | None = None) -> Task:
-        task: Task = self.get_task_by_id(task_id)
+            version: int = await self._versions.bump(TEMPLATE_TASKS_CATALOG_NAME)
+            task: Task = await self.create(Task(name=name, type=TaskType.TEMPLATE, tags=tags))
+            self.on_commit(self._suggestions.apply, version, TaskRead.from_model(task), [tag.id for tag in tags])
+        return TemplateTaskRead.from_model(task)
+
+    async def create_ad_hoc_task(self, name: str, call_id: int, status: TaskStatus = TaskStatus.OPEN) -> Task:
+        async with self.unit_of_work():
+            task: Task = await self.insert_returning(name=name, type=TaskType.AD_HOC)
 
-        if name is not None:
-            task.name = name
-        if is_active is not None:
-            task.is_active = is_active
+            await self.db.execute(
+                calls_tasks.insert().values(
+                    task_id=task.id,
+                    call_id=call_id,
+                    status=status
+                )
+            )
+            await self._stats.add_call_tasks(task.id, call_id)
+            stage_events(self.db, call_event(CallEventType.TASK_LINKED, call_id, task_id=task.id, status=status.value))
+        return task
 
-        return self.update(task)
+    async def update_task(self, task_id: int, name: str | None = None, is_active: bool | None = None) -> Task:
+        async with self.unit_of_work():
+            changes: Dict[str, Any] = {key: value for key, value in {'name': name, 'is_active': is_active}.items() if value is not None}
+            task: Task | None = None
+            if changes:
+                changed: ColumnElement[bool] = or_(*(getattr(Task, key).is_distinct_from(value) for key, value in changes.items()))
+                task = await self.update_returning(task_id, changed, **changes)
+                if task is not None and task.type == TaskType.TEMPLATE:
+                    version: int = await self._versions.bump(TEMPLATE_TASKS_CATALOG_NAME)
+                    self.on_commit(self._suggestions.apply, version, TaskRead.from_model(task))
+            if task is None:
+                task = await self.get_by_id(task_id)
+            if task is None:
+                raise ItemNotFoundError(f'Task with id {task_id} not found')
+        return task
 
-    def update_task_and_status(self, task_id: int, call_id: int, status: TaskStatus, name: str | None = None) -> CallTaskRead:
-        self.db.execute(
-            calls_tasks.update()
-            .where(calls_tasks.c.task_id == task_id, calls_tasks.c.call_id == call_id)
-            .values(status=status)
-        )
-        task: Task = self.update_task(task_id, name=name)
+    async def update_task_and_status(self, task_id: int, call_id: int, status: TaskStatus, name: str | None = None) -> CallTaskRead:
+        async with self.unit_of_work():
+            await self._stats.add_call_tasks(task_id, call_id, sign=-1)
+            await self.db.execute(
+                calls_tasks.update()
+                .where(calls_tasks.c.task_id == task_id, calls_tasks.c.call_id == call_id)
+                .values(status=status)
+            )
+            await self._stats.add_call_tasks(task_id, call_id)
+            stage_events(self.db, call_event(CallEventType.TASK_STATUS_CHANGED, call_id, task_id=task_id, status=status.value))
+            task: Task = await self.update_task(task_id, name=name)
         return CallTaskRead.from_model(task, call_id=call_id, status=status)
 
-    def update_template_task_and_tags(self, task_id: int, name: str | None = None, tag_ids: List[int] | None = None) -> TemplateTaskRead:
-        task: Task = self.get_task_by_id(task_id)
-        if task.type != TaskType.TEMPLATE:
-            raise InvalidTaskTypeError(f'Task with id {task_id} is not a template task')
+    async def update_template_task_and_tags(self, task_id: int, name: str | None = None, tag_ids: List[int] | None = None) -> TemplateTaskRead:
+        async with self.unit_of_work():
+            task: Task = await self._get_task_with_tags(task_id)
+            if task.type != TaskType.TEMPLATE:
+                raise InvalidTaskTypeError(f'Task with id {task_id} is not a template task')
 
-        if tag_ids is not None and self._tag_dal:
-            all_active_tags = self._tag_dal.get_all_active()
-            tags: List[Tag] = [tag for tag in all_active_tags if tag.id in tag_ids]
-            task.tags = tags
-            self.commit_and_refresh(task)
+            if tag_ids is not None and self._tag_dal:
+                task.tags = await self._tag_dal.get_active_tags_by_ids(tag_ids)
+            if name is not None:
+                task.name = name
+            version: int = await self._versions.bump(TEMPLATE_TASKS_CATALOG_NAME)
+            await self.db.flush()
+            self.on_commit(self._suggestions.apply, version, TaskRead.from_model(task), [tag.id for tag in task.tags])
 
-        task = self.update_task(task_id, name=name)
         return TemplateTaskRead.from_model(task)
 
-    def link_template_task_to_call(self, task_id: int, call_id: int) -> CallTaskRead:
-        task: Task = self.get_task_by_id(task_id)
+    async def _get_template_task(self, task_id: int) -> Task:
+        task: Task = await self.get_task_by_id(task_id)
         if task.type != TaskType.TEMPLATE:
             raise InvalidTaskTypeError(f'Task with id {task_id} is not a template task')
+        return task
 
-        self.db.execute(
-            calls_tasks.insert().values(
-                task_id=task_id,
-                call_id=call_id,
-                status=TaskStatus.OPEN
-            )
-        )
-        
-        self.db.commit()
-        
-        return CallTaskRead.from_model(task, call_id=call_id, status=TaskStatus.OPEN)
-
-    def unlink_template_task_from_call(self, task_id: int, call_id: int) -> None:
-        task: Task = self.get_task_by_id(task_id)
-        if task.type != TaskType.TEMPLATE:
-            raise InvalidTaskTypeError(f'Task with id {task_id} is not a template task')
+    async def _validate_call_exists(self, call_id: int) -> None:
+        if await self.db.scalar(select(Call.id).where(Call.id == call_id)) is None:
+            raise ItemNotFoundError(f'Call with id {call_id} not found')
 
-        self.db.execute(
-            calls_tasks.delete()
-            .where(calls_tasks.c.task_id == task_id, calls_tasks.c.call_id == call_id)
+    def _template_links(self, *criteria: ColumnElement[bool]) -> Select:
+        return (
+            select(Call.id, Task.id, literal(TaskStatus.OPEN, calls_tasks.c.status.type))
+            .join(Task, true())
+            .where(Task.type == TaskType.TEMPLATE, Task.is_active.is_(True), *criteria)
         )
-        self.db.commit()
-
-    def deactivate(self, task_id: int) -> None:
-        task: Task = self.get_task_by_id(task_id)
-        task.is_active = False
-        self.db.execute(
-            calls_tasks.delete()
-            .where(calls_tasks.c.task_id == task_id)
+
+    async def _insert_links(self, links: Select) -> CallTaskLinkResult:
+        dialect_insert = postgresql.insert if self.db.bind.dialect.name == 'postgresql' else sqlite.insert
+        statement = (
+            dialect_insert(calls_tasks)
+            .from_select([calls_tasks.c.call_id, calls_tasks.c.task_id, calls_tasks.c.status], links)
+            .on_conflict_do_nothing()
+            .returning(calls_tasks.c.call_id, calls_tasks.c.task_id)
         )
-        self.update_task(task_id, is_active=False)
-
-   
-    def get_all_tasks_by_call_id(self, call_id: int) -> List[CallTaskRead]:
-        all_active_tasks: Dict[int, Task] = {t.id: t for t in self.get_all_active()}
-        results: List[Tuple[Task, TaskStatus]] = (
-            self.db.query(Task, calls_tasks.c.status)
-            .join(calls_tasks, Task.id == calls_tasks.c.task_id)
-            .filter(calls_tasks.c.call_id == call_id)
-            .all()
+        inserted: List[Tuple[int, int]] = sorted(tuple(row) for row in await self.db.execute(statement))
+        if inserted:
+            await self._stats.add_call_task_links(tuple_(calls_tasks.c.call_id, calls_tasks.c.task_id).in_(inserted))
+            stage_events(self.db, *(
+                call_event(CallEventType.TASK_LINKED, call_id, task_id=task_id, status=TaskStatus.OPEN.value) for call_id, task_id in inserted
+            ))
+        return CallTaskLinkResult(links=[CallTaskLink(call_id=call_id, task_id=task_id) for call_id, task_id in inserted])
+
+    async def _delete_links(self, *criteria: ColumnElement[bool]) -> CallTaskLinkResult:
+        await self._stats.add_call_task_links(*criteria, sign=-1)
+        deleted: List[Tuple[int, int]] = sorted(
+            tuple(row) for row in await self.db.execute(delete(calls_tasks).where(*criteria).returning(calls_tasks.c.call_id, calls_tasks.c.task_id))
         )
-        results: List[Tuple[Task, TaskStatus]] = [
-            (task, status) for task, status in results if task.id in all_active_tasks
-        ]
+        stage_events(self.db, *(call_event(CallEventType.TASK_UNLINKED, call_id, task_id=task_id) for call_id, task_id in deleted))
+        return CallTaskLinkResult(links=[CallTaskLink(call_id=call_id, task_id=task_id) for call_id, task_id in deleted])
+
+    async def link_template_task_to_call(self, task_id: int, call_id: int) -> CallTaskRead:
+        async with self.unit_of_work():
+            task: Task = await self._get_template_task(task_id)
+
+            status: TaskStatus | None = TaskStatus.OPEN
+            if not (await self._insert_links(self._template_links(Call.id == call_id, Task.id == task_id))).links:
+                status = await self.db.scalar(
+                    select(calls_tasks.c.status).where(calls_tasks.c.task_id == task_id, calls_tasks.c.call_id == call_id)
+                )
+                if status is None:
+                    raise ItemNotFoundError(f'Call with id {call_id} not found')
+
+        return CallTaskRead.from_model(task, call_id=call_id, status=TaskStatus(status))
+
+    async def link_template_tasks_to_call(self, call_id: int, task_ids: List[int]) -> CallTaskLinkResult:
+        validate_link_ids(task_ids)
+        async with self.unit_of_work():
+            await self._validate_call_exists(call_id)
+            result: CallTaskLinkResult = await self._insert_links(self._template_links(Call.id == call_id, Task.id.in_(task_ids)))
+        return result
 
-        call_tasks: List[CallTaskRead] = [
+    async def link_template_task_to_calls(self, task_id: int, call_ids: List[int]) -> CallTaskLinkResult:
+        validate_link_ids(call_ids)
+        async with self.unit_of_work():
+            await self._get_template_task(task_id)
+            result: CallTaskLinkResult = await self._insert_links(self._template_links(Call.id.in_(call_ids), Task.id == task_id))
+        return result
+
+    async def link_suggested_tasks_to_call(self, call_id: int) -> CallTaskLinkResult:
+        async with self.unit_of_work():
+            await self._validate_call_exists(call_id)
+            suggested: Select = (
+                select(calls_tags.c.call_id, Task.id, literal(TaskStatus.OPEN, calls_tasks.c.status.type))
+                .distinct()
+                .join(tasks_tags, tasks_tags.c.tag_id == calls_tags.c.tag_id)
+                .join(Task, Task.id == tasks_tags.c.task_id)
+                .join(Tag, Tag.id == calls_tags.c.tag_id)
+                .where(calls_tags.c.call_id == call_id, Tag.is_active.is_(True), Task.type == TaskType.TEMPLATE, Task.is_active.is_(True))
+            )
+            result: CallTaskLinkResult = await self._insert_links(suggested)
+        return result
+
+    async def unlink_template_tasks_from_call(self, call_id: int, task_ids: List[int]) -> CallTaskLinkResult:
+        validate_link_ids(task_ids)
+        async with self.unit_of_work():
+            await self._validate_call_exists(call_id)
+            result: CallTaskLinkResult = await self._delete_links(
+                calls_tasks.c.call_id == call_id,
+                calls_tasks.c.task_id.in_(select(Task.id).where(Task.id.in_(task_ids), Task.type == TaskType.TEMPLATE)),
+            )
+        return result
+
+    async def unlink_template_task_from_calls(self, task_id: int, call_ids: List[int]) -> CallTaskLinkResult:
+        validate_link_ids(call_ids)
+        async with self.unit_of_work():
+            await self._get_template_task(task_id)
+            result: CallTaskLinkResult = await self._delete_links(calls_tasks.c.task_id == task_id, calls_tasks.c.call_id.in_(call_ids))
+        return result
+
+    async def unlink_template_task_from_call(self, task_id: int, call_id: int) -> None:
+        async with self.unit_of_work():
+            await self._get_template_task(task_id)
+            await self._delete_links(calls_tasks.c.task_id == task_id, calls_tasks.c.call_id == call_id)
+
+    async def deactivate(self, task_id: int) -> None:
+        async with self.unit_of_work():
+            task: Task = await self.get_task_by_id(task_id)
+            task.is_active = False
+            await self._delete_links(calls_tasks.c.task_id == task_id)
+            if task.type == TaskType.TEMPLATE:
+                version: int = await self._versions.bump(TEMPLATE_TASKS_CATALOG_NAME)
+                self.on_commit(self._suggestions.apply, version, TaskRead.from_model(task))
+
+    async def _get_call_tasks(self, call_ids: List[int]) -> List[Tuple[Task, int, TaskStatus]]:
+        return (
+            await self.db.execute(
+                select(Task, calls_tasks.c.call_id, calls_tasks.c.status)
+                .join(calls_tasks, Task.id == calls_tasks.c.task_id)
+                .where(calls_tasks.c.call_id.in_(call_ids), Task.is_active.is_(True))
+                .order_by(calls_tasks.c.call_id, Task.id)
+            )
+        ).all()
+
+    async def get_all_tasks_by_call_id(self, call_id: int) -> List[CallTaskRead]:
+        return [
             CallTaskRead.from_model(task, call_id=call_id, status=TaskStatus(status))
-            for task, status in results
+            for task, _, status in await self._get_call_tasks([call_id])
         ]
 
+    async def get_tasks_by_call_ids(self, call_ids: List[int]) -> Dict[int, List[CallTaskRead]]:
+        validate_call_ids(call_ids)
+        call_tasks: Dict[int, List[CallTaskRead]] = {call_id: [] for call_id in call_ids}
+        for task, call_id, status in await self._get_call_tasks(list(call_tasks)):
+            call_tasks[call_id].append(CallTaskRead.from_model(task, call_id=call_id, status=TaskStatus(status)))
+
         return call_tasks
-        
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Table, Enum as SqlEnum
+from sqlalchemy import Column, ForeignKey, Index, Table, Enum as SqlEnum
 
 from src.models.base import Base
 from src.models.custom_types import TaskStatus
@@ -8,6 +8,7 @@ tasks_tags: Table = Table(
     Base.metadata,
     Column('task_id', ForeignKey('tasks.id', ondelete='CASCADE'), primary_key=True),
     Column('tag_id', ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_tasks_tags_tag_id', 'tag_id'),
 )
 
 calls_tags: Table = Table(
@@ -15,6 +16,7 @@ calls_tags: Table = Table(
     Base.metadata,
     Column('call_id', ForeignKey('calls.id', ondelete='CASCADE'), primary_key=True),
     Column('tag_id', ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_calls_tags_tag_id', 'tag_id'),
 )
 
 calls_tasks: Table = Table(
@@ -23,4 +25,5 @@ calls_tasks: Table = Table(
     Column('call_id', ForeignKey('calls.id', ondelete='CASCADE'), primary_key=True),
     Column('task_id', ForeignKey('tasks.id', ondelete='CASCADE'), primary_key=True),
     Column('status', SqlEnum(TaskStatus), default=TaskStatus.OPEN),
+    Index('ix_calls_tasks_task_id', 'task_id'),
 )
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 class Call(Base):
     __tablename__ = 'calls'
+    __table_args__ = (
+        Index('ix_calls_created_at_id', 'created_at', 'id'),
+    )
 
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -0,0 +1,11 @@
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class CatalogVersion(Base):
+    __tablename__ = 'catalog_versions'
+
+    name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    version: Mapped[int] = mapped_column(default=0, nullable=False)
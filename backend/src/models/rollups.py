@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer, Table, Enum as SqlEnum
+
+from src.models.base import Base
+from src.models.custom_types import TaskStatus
+
+tag_call_daily_counts: Table = Table(
+    'tag_call_daily_counts',
+    Base.metadata,
+    Column('day', Date, primary_key=True),
+    Column('tag_id', ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    Column('call_count', Integer, nullable=False, default=0),
+)
+
+task_status_daily_counts: Table = Table(
+    'task_status_daily_counts',
+    Base.metadata,
+    Column('day', Date, primary_key=True),
+    Column('status', SqlEnum(TaskStatus), primary_key=True),
+    Column('task_count', Integer, nullable=False, default=0),
+)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import String, Boolean, Enum as SqlEnum
+from sqlalchemy import String, Boolean, Index, text, Enum as SqlEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -14,6 +14,15 @@ if TYPE_CHECKING:
 
 class Task(Base):
     __tablename__ = 'tasks'
+    __table_args__ = (
+        Index('ix_tasks_active', 'id', postgresql_where=text('is_active IS true'), sqlite_where=text('is_active IS 1')),
+        Index(
+            'ix_tasks_active_templates',
+            'id',
+            postgresql_where=text("is_active IS true AND type = 'TEMPLATE'"),
+            sqlite_where=text("is_active IS 1 AND type = 'TEMPLATE'"),
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String, nullable=False)
     type: Mapped[TaskType] = mapped_column(SqlEnum(TaskType), nullable=False)
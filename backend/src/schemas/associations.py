@@ -13,7 +13,7 @@ class TagWithSuggestedTasks(TagRead):
     @classmethod
     def from_model(cls, tag: 'Tag', suggested_tasks: List[TaskRead]) -> 'TagWithSuggestedTasks':
         tag_read = TagRead.from_model(tag)
-        return cls(
+        return cls.construct_trusted(
             id=tag_read.id,
             name=tag_read.name,
             created_at=tag_read.created_at,
@@ -1,7 +1,23 @@
+from typing import Any, Self
+
 from pydantic import BaseModel
 from datetime import datetime
 
-class BaseReadSchema(BaseModel):
+_object_setattr = object.__setattr__
+
+
+class TrustedSchema(BaseModel):
+    @classmethod
+    def construct_trusted(cls, **values: Any) -> Self:
+        obj: Self = cls.__new__(cls)
+        _object_setattr(obj, '__dict__', values)
+        _object_setattr(obj, '__pydantic_fields_set__', set(values))
+        _object_setattr(obj, '__pydantic_extra__', None)
+        _object_setattr(obj, '__pydantic_private__', None)
+        return obj
+
+
+class BaseReadSchema(TrustedSchema):
     id: int
     name: str
     created_at: datetime
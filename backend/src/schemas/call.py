@@ -3,7 +3,7 @@ from typing import List, TYPE_CHECKING
 from pydantic import BaseModel
 
 from src.schemas.base import BaseReadSchema
-from src.schemas.tag import TagRead
+from src.schemas.tag import TagRead, unique_tags
 from src.schemas.task import TaskRead
 
 if TYPE_CHECKING:
@@ -20,22 +20,90 @@ class CallUpdate(CallCreate):
     pass
 
 
+class CallBulkItemResult(BaseModel):
+    index: int
+    id: int | None = None
+    error: str | None = None
+
+
+class CallBulkCreateResult(BaseModel):
+    created: int
+    failed: int
+    items: List[CallBulkItemResult]
+
+
 class CallListItem(BaseReadSchema):
     description: str | None
     tags: List[TagRead]
 
     @classmethod
-    def from_model(cls, call: 'Call') -> 'CallListItem':
+    def from_model(cls, call: 'Call', tags: List[TagRead] | None = None) -> 'CallListItem':
+        return cls.construct_trusted(
+            id=call.id,
+            name=call.name,
+            created_at=call.created_at,
+            updated_at=call.updated_at,
+            description=call.description,
+            tags=tags if tags is not None else [TagRead.from_model(tag) for tag in call.tags if tag.is_active]
+        )
+
+
+class CallListPage(BaseModel):
+    items: List[CallListItem]
+    next_cursor: str | None
+
+
+class CallListRef(BaseReadSchema):
+    description: str | None
+    tag_ids: List[int]
+
+    @classmethod
+    def from_item(cls, item: CallListItem) -> 'CallListRef':
+        return cls.construct_trusted(
+            id=item.id,
+            name=item.name,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+            description=item.description,
+            tag_ids=[tag.id for tag in item.tags]
+        )
+
+
+class NormalizedCallListPage(BaseModel):
+    items: List[CallListRef]
+    tags: List[TagRead]
+    next_cursor: str | None
+
+    @classmethod
+    def from_page(cls, page: CallListPage) -> 'NormalizedCallListPage':
         return cls(
+            items=[CallListRef.from_item(item) for item in page.items],
+            tags=unique_tags(item.tags for item in page.items),
+            next_cursor=page.next_cursor,
+        )
+
+
+class CallSearchItem(CallListItem):
+    score: float
+
+    @classmethod
+    def from_model(cls, call: 'Call', score: float, tags: List[TagRead]) -> 'CallSearchItem':
+        return cls.construct_trusted(
             id=call.id,
             name=call.name,
             created_at=call.created_at,
             updated_at=call.updated_at,
             description=call.description,
-            tags=[TagRead.from_model(tag) for tag in call.tags if tag.is_active]
+            tags=tags,
+            score=score
         )
 
 
+class CallSearchPage(BaseModel):
+    items: List[CallSearchItem]
+    next_cursor: str | None
+
+
 class CallRead(BaseReadSchema):
     description: str | None
     tags: List[TagRead]
@@ -43,7 +111,7 @@ class CallRead(BaseReadSchema):
 
     @classmethod
     def from_model(cls, call: 'Call') -> 'CallRead':
-        return cls(
+        return cls.construct_trusted(
             id=call.id,
             name=call.name,
             created_at=call.created_at,
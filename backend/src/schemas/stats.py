@@ -0,0 +1,26 @@
+from datetime import date
+from typing import List
+
+from pydantic import BaseModel
+
+from src.models.custom_types import TaskStatus
+from src.schemas.base import TrustedSchema
+
+
+class TagCallDailyCount(TrustedSchema):
+    day: date
+    tag_id: int
+    call_count: int
+
+
+class TaskStatusDailyCount(TrustedSchema):
+    day: date
+    status: TaskStatus
+    task_count: int
+
+
+class StatsRead(BaseModel):
+    start: date
+    end: date
+    tag_calls: List[TagCallDailyCount]
+    task_statuses: List[TaskStatusDailyCount]
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import Dict, Iterable, List, TYPE_CHECKING
 
 from pydantic import BaseModel
 
@@ -26,7 +26,7 @@ class TagRead(BaseReadSchema):
 
     @classmethod
     def from_model(cls, tag: 'Tag') -> 'TagRead':
-        return cls(
+        return cls.construct_trusted(
             id=tag.id,
             name=tag.name,
             created_at=tag.created_at,
@@ -34,3 +34,11 @@ class TagRead(BaseReadSchema):
             is_active=tag.is_active,
             color_id=tag.color_id
         )
+
+
+def unique_tags(tag_lists: Iterable[List[TagRead]]) -> List[TagRead]:
+    tags: Dict[int, TagRead] = {}
+    for tag_list in tag_lists:
+        for tag in tag_list:
+            tags.setdefault(tag.id, tag)
+    return list(tags.values())
@@ -4,7 +4,7 @@ from pydantic import BaseModel
 
 from src.models.custom_types import TaskType, TaskStatus
 from src.schemas.base import BaseReadSchema
-from src.schemas.tag import TagRead
+from src.schemas.tag import TagRead, unique_tags
 
 if TYPE_CHECKING:
     from src.models.task import Task
@@ -46,7 +46,7 @@ class TaskRead(BaseReadSchema):
 
     @classmethod
     def from_model(cls, task: 'Task') -> 'TaskRead':
-        return cls(
+        return cls.construct_trusted(
             id=task.id,
             name=task.name,
             created_at=task.created_at,
@@ -61,7 +61,7 @@ class TemplateTaskRead(TaskRead):
 
     @classmethod
     def from_model(cls, task: 'Task') -> 'TemplateTaskRead':
-        return cls(
+        return cls.construct_trusted(
             id=task.id,
             name=task.name,
             created_at=task.created_at,
@@ -72,13 +72,38 @@ class TemplateTaskRead(TaskRead):
         )
 
 
+class TemplateTaskRef(TaskRead):
+    tag_ids: List[int]
+
+    @classmethod
+    def from_read(cls, task: TemplateTaskRead) -> 'TemplateTaskRef':
+        return cls.construct_trusted(
+            id=task.id,
+            name=task.name,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            is_active=task.is_active,
+            type=task.type,
+            tag_ids=[tag.id for tag in task.tags]
+        )
+
+
+class NormalizedTemplateTaskList(BaseModel):
+    items: List[TemplateTaskRef]
+    tags: List[TagRead]
+
+    @classmethod
+    def from_reads(cls, tasks: List[TemplateTaskRead]) -> 'NormalizedTemplateTaskList':
+        return cls(items=[TemplateTaskRef.from_read(task) for task in tasks], tags=unique_tags(task.tags for task in tasks))
+
+
 class CallTaskRead(TaskRead):
     call_id: int
     status: TaskStatus
 
     @classmethod
     def from_model(cls, task: 'Task', call_id: int, status: TaskStatus) -> 'CallTaskRead':
-        return cls(
+        return cls.construct_trusted(
             id=task.id,
             name=task.name,
             created_at=task.created_at,
@@ -88,4 +113,36 @@ class CallTaskRead(TaskRead):
             call_id=call_id,
             status=status
         )
-        
\ No newline at end of file
+
+
+class SuggestedTaskRead(TaskRead):
+    matched_tag_ids: List[int]
+
+    @classmethod
+    def from_task(cls, task: TaskRead, matched_tag_ids: List[int]) -> 'SuggestedTaskRead':
+        return cls.construct_trusted(
+            id=task.id,
+            name=task.name,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            is_active=task.is_active,
+            type=task.type,
+            matched_tag_ids=matched_tag_ids
+        )
+
+
+class CallTasksLink(BaseModel):
+    task_ids: List[int]
+
+
+class TaskCallsLink(BaseModel):
+    call_ids: List[int]
+
+
+class CallTaskLink(BaseModel):
+    call_id: int
+    task_id: int
+
+
+class CallTaskLinkResult(BaseModel):
+    links: List[CallTaskLink]
@@ -0,0 +1,65 @@
+import json
+from typing import Any, List, Tuple, Type, TypeVar
+
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+
+from src.constants.api import NDJSON_CONTENT_TYPE
+from src.constants.limits import MAX_BULK_BODY_BYTES, MAX_BULK_ITEMS
+from src.core.exceptions import BulkLimitExceededError, InvalidBulkPayloadError
+
+SchemaType = TypeVar('SchemaType', bound=BaseModel)
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return '; '.join(
+        f'{".".join(str(part) for part in e["loc"]) or "item"}: {e["msg"]}'
+        for e in error.errors()
+    )
+
+
+def _split_payload(body: bytes, content_type: str) -> List[Any]:
+    if content_type.split(';', 1)[0].strip() == NDJSON_CONTENT_TYPE:
+        return [line for line in body.splitlines() if line.strip()]
+
+    try:
+        items: Any = json.loads(body)
+    except ValueError as e:
+        raise InvalidBulkPayloadError(f'Request body is not valid JSON: {e}') from e
+    if not isinstance(items, list):
+        raise InvalidBulkPayloadError('Request body must be a JSON array or NDJSON')
+    return items
+
+
+async def read_bulk_body(request: Request, max_bytes: int = MAX_BULK_BODY_BYTES) -> bytes:
+    content_length: str | None = request.headers.get('content-length')
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+        raise BulkLimitExceededError(f'Bulk request bodies are limited to {max_bytes} bytes, got {content_length}')
+
+    chunks: List[bytes] = []
+    size: int = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise BulkLimitExceededError(f'Bulk request bodies are limited to {max_bytes} bytes')
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def parse_bulk_items(body: bytes, content_type: str, schema: Type[SchemaType]) -> Tuple[List[Tuple[int, SchemaType]], List[Tuple[int, str]]]:
+    raw_items: List[Any] = _split_payload(body, content_type)
+    if len(raw_items) > MAX_BULK_ITEMS:
+        raise BulkLimitExceededError(f'Bulk requests are limited to {MAX_BULK_ITEMS} items, got {len(raw_items)}')
+
+    items: List[Tuple[int, SchemaType]] = []
+    errors: List[Tuple[int, str]] = []
+    for index, raw_item in enumerate(raw_items):
+        try:
+            if isinstance(raw_item, bytes):
+                items.append((index, schema.model_validate_json(raw_item)))
+            else:
+                items.append((index, schema.model_validate(raw_item)))
+        except ValidationError as e:
+            errors.append((index, _format_validation_error(e)))
+
+    return items, errors
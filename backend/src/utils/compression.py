@@ -0,0 +1,42 @@
+import brotli
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.constants.api import BROTLI_ENCODING, BROTLI_QUALITY, GZIP_COMPRESS_LEVEL, GZIP_ENCODING
+from src.utils.negotiation import preferred
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = BROTLI_ENCODING
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = BROTLI_QUALITY):
+        super().__init__(app, minimum_size)
+        self.compressor: brotli.Compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        compressed: bytes = self.compressor.process(body)
+        return compressed + (self.compressor.flush() if more_body else self.compressor.finish())
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int, gzip_level: int = GZIP_COMPRESS_LEVEL, brotli_quality: int = BROTLI_QUALITY):
+        self.app: ASGIApp = app
+        self.minimum_size: int = minimum_size
+        self.gzip_level: int = gzip_level
+        self.brotli_quality: int = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding: str | None = preferred(Headers(scope=scope).get('accept-encoding'), [BROTLI_ENCODING, GZIP_ENCODING])
+        responder: ASGIApp
+        if encoding == BROTLI_ENCODING:
+            responder = BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+        elif encoding == GZIP_ENCODING:
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
@@ -0,0 +1,40 @@
+import csv
+import io
+from typing import Any, AsyncIterator, Dict, Final, List
+
+import orjson
+
+from src.utils.responses import dump_json
+
+CSV_COLUMNS: Final[List[str]] = ['id', 'name', 'description', 'created_at', 'updated_at', 'tags', 'tasks']
+CSV_LIST_SEPARATOR: Final[str] = '|'
+
+
+async def to_ndjson(batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield b''.join(dump_json(record, orjson.OPT_APPEND_NEWLINE) for record in batch)
+
+
+def _csv_row(record: Dict[str, Any]) -> List[Any]:
+    return [
+        record['id'],
+        record['name'],
+        record['description'] or '',
+        record['created_at'].isoformat(),
+        record['updated_at'].isoformat(),
+        CSV_LIST_SEPARATOR.join(tag['name'] for tag in record['tags']),
+        CSV_LIST_SEPARATOR.join(f'{task["name"]}:{task["status"]}' for task in record['tasks']),
+    ]
+
+
+async def to_csv(batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[str]:
+    buffer: io.StringIO = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue()
+
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_csv_row(record) for record in batch)
+        yield buffer.getvalue()
@@ -0,0 +1,29 @@
+from typing import Dict
+
+from fastapi import Response, status
+
+from src.constants.api import CATALOG_CACHE_CONTROL, JSON_CONTENT_TYPE, VARY_ACCEPT_HEADERS
+
+
+def make_etag(name: str, *versions: int, media_type: str = JSON_CONTENT_TYPE) -> str:
+    if media_type != JSON_CONTENT_TYPE:
+        name = f'{name}-{media_type.rsplit("/", 1)[-1]}'
+    return f'W/"{name}-{"-".join(str(version) for version in versions)}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque_tag: str = etag.removeprefix('W/')
+    return any(candidate.strip().removeprefix('W/') == opaque_tag for candidate in if_none_match.split(','))
+
+
+def catalog_cache_headers(etag: str, vary_accept: bool = False) -> Dict[str, str]:
+    headers: Dict[str, str] = {'ETag': etag, 'Cache-Control': CATALOG_CACHE_CONTROL}
+    return {**headers, **VARY_ACCEPT_HEADERS} if vary_accept else headers
+
+
+def not_modified(etag: str, vary_accept: bool = False) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=catalog_cache_headers(etag, vary_accept))
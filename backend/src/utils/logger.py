@@ -1,9 +1,17 @@
-from datetime import datetime
+import atexit
+import os
+import sys
+import traceback
+from datetime import date, datetime
 from enum import Enum
 from pathlib import Path
+from queue import Empty, SimpleQueue
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Any, Dict, List, TextIO, Tuple
 
-from src.constants.logger import LOG_DIR_PATH, LOG_FILE_DATE_FORMAT
-from src.utils.files import append_to_file
+from src.constants.logger import LOG_DIR_PATH, LOG_FILE_DATE_FORMAT, LOG_FLUSH_BATCH_SIZE, LOG_FLUSH_INTERVAL_SECONDS
+from src.core.config import settings
 
 
 class LogLevel(str, Enum):
@@ -14,41 +22,172 @@ class LogLevel(str, Enum):
     CRITICAL = 'CRITICAL'
 
 
+LOG_LEVEL_PRIORITIES: Dict[LogLevel, int] = {level: priority for priority, level in enumerate(LogLevel)}
+
+_STOP: object = object()
+
+
+class LogWriter:
+    def __init__(
+        self,
+        log_dir: Path,
+        flush_interval_seconds: float = LOG_FLUSH_INTERVAL_SECONDS,
+        batch_size: int = LOG_FLUSH_BATCH_SIZE,
+        stream: TextIO | None = sys.stdout,
+    ):
+        self.log_dir: Path = log_dir
+        self._flush_interval_seconds: float = flush_interval_seconds
+        self._batch_size: int = batch_size
+        self._stream: TextIO | None = stream
+        self._lock: Lock = Lock()
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread: Thread | None = None
+        self._pid: int | None = None
+        self._file: TextIO | None = None
+        self._file_day: date | None = None
+
+    def _ensure_started(self) -> None:
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = SimpleQueue()
+            self._thread = Thread(target=self._run, name='log-writer', daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def write(self, day: date, line: str) -> None:
+        self._ensure_started()
+        self._queue.put((day, line))
+
+    def flush(self) -> None:
+        if self._pid != os.getpid():
+            return
+        done: Event = Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        if self._pid != os.getpid():
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._pid = None
+
+    def _get_log_file_path(self, day: date) -> Path:
+        return self.log_dir / f'{day.strftime(LOG_FILE_DATE_FORMAT)}.log'
+
+    def _open_for(self, day: date) -> TextIO:
+        if self._file_day != day or self._file is None:
+            if self._file is not None:
+                self._file.close()
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._get_log_file_path(day), 'a', encoding='utf-8')
+            self._file_day = day
+        return self._file
+
+    def _write_batch(self, batch: List[Tuple[date, str]]) -> None:
+        if not batch:
+            return
+        try:
+            start: int = 0
+            for end in range(1, len(batch) + 1):
+                if end == len(batch) or batch[end][0] != batch[start][0]:
+                    lines: str = ''.join(line + '\n' for _, line in batch[start:end])
+                    log_file: TextIO = self._open_for(batch[start][0])
+                    log_file.write(lines)
+                    log_file.flush()
+                    if self._stream is not None:
+                        self._stream.write(lines)
+                    start = end
+            if self._stream is not None:
+                self._stream.flush()
+        except Exception:
+            self._report_error(len(batch))
+        batch.clear()
+
+    @staticmethod
+    def _report_error(dropped: int) -> None:
+        if sys.__stderr__ is None:
+            return
+        try:
+            sys.__stderr__.write(f'--- Logging error: failed to write {dropped} log lines ---\n')
+            traceback.print_exc(file=sys.__stderr__)
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        batch: List[Tuple[date, str]] = []
+        deadline: float = monotonic() + self._flush_interval_seconds
+        while True:
+            try:
+                item: Any = self._queue.get(timeout=max(0.0, deadline - monotonic()))
+            except Empty:
+                item = None
+
+            if isinstance(item, tuple):
+                batch.append(item)
+                if len(batch) < self._batch_size:
+                    continue
+            self._write_batch(batch)
+            deadline = monotonic() + self._flush_interval_seconds
+
+            if isinstance(item, Event):
+                item.set()
+            elif item is _STOP:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                    self._file_day = None
+                return
+
 
 class Logger:
-    def __init__(self, name: str = 'app'):
+    def __init__(self, name: str = 'app', min_level: LogLevel = LogLevel.INFO, writer: LogWriter | None = None):
         self.name: str = name
-        self.log_dir: Path = Path(LOG_DIR_PATH)
+        self.min_level: LogLevel = min_level
+        self._min_priority: int = LOG_LEVEL_PRIORITIES[min_level]
+        self._writer: LogWriter = writer or LogWriter(Path(LOG_DIR_PATH))
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        return LOG_LEVEL_PRIORITIES[level] >= self._min_priority
 
-    def _get_log_file_path_for_today(self) -> str:
-        today_str: str = datetime.now().strftime(LOG_FILE_DATE_FORMAT)
-        return str(self.log_dir / f'{today_str}.log')
+    def _log(self, level: LogLevel, message: str, args: Tuple[Any, ...], exception: Exception | None = None) -> None:
+        if LOG_LEVEL_PRIORITIES[level] < self._min_priority:
+            return
 
-    def _log(self, level: LogLevel, message: str, exception: Exception | None = None) -> None:
-        timestamp: str = datetime.now().isoformat()
-        log_message: str = f'[{timestamp}] [{level.value}] [{self.name}] {message}'
+        if args:
+            message = message % args
+        now: datetime = datetime.now()
+        log_message: str = f'[{now.isoformat()}] [{level.value}] [{self.name}] {message}'
 
         if exception:
             log_message += f' | Exception: {type(exception).__name__}: {str(exception)}'
 
-        print(log_message)
-        log_file_path: str = self._get_log_file_path_for_today()
-        append_to_file(log_file_path, log_message)
+        self._writer.write(now.date(), log_message)
+
+    def debug(self, message: str, *args: Any) -> None:
+        self._log(LogLevel.DEBUG, message, args)
+
+    def info(self, message: str, *args: Any) -> None:
+        self._log(LogLevel.INFO, message, args)
 
-    def debug(self, message: str) -> None:
-        self._log(LogLevel.DEBUG, message)
+    def warning(self, message: str, *args: Any, exception: Exception | None = None) -> None:
+        self._log(LogLevel.WARNING, message, args, exception)
 
-    def info(self, message: str) -> None:
-        self._log(LogLevel.INFO, message)
+    def error(self, message: str, *args: Any, exception: Exception | None = None) -> None:
+        self._log(LogLevel.ERROR, message, args, exception)
 
-    def warning(self, message: str, exception: Exception | None = None) -> None:
-        self._log(LogLevel.WARNING, message, exception)
+    def critical(self, message: str, *args: Any, exception: Exception | None = None) -> None:
+        self._log(LogLevel.CRITICAL, message, args, exception)
 
-    def error(self, message: str, exception: Exception | None = None) -> None:
-        self._log(LogLevel.ERROR, message, exception)
+    def flush(self) -> None:
+        self._writer.flush()
 
-    def critical(self, message: str, exception: Exception | None = None) -> None:
-        self._log(LogLevel.CRITICAL, message, exception)
+    def close(self) -> None:
+        self._writer.close()
 
 
-logger: Logger = Logger('app')
+logger: Logger = Logger('app', min_level=LogLevel(settings.log_level.upper()))
+atexit.register(logger.close)
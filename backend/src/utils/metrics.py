@@ -0,0 +1,271 @@
+from bisect import bisect_left
+from contextvars import ContextVar, Token
+from threading import Lock
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Sequence, Tuple
+
+from src.constants.metrics import LATENCY_BUCKETS_SECONDS, METRICS_UNMATCHED_ROUTE, QUERY_COUNT_BUCKETS
+
+Labels = Tuple[str, ...]
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)) + '}'
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name: str = name
+        self.documentation: str = documentation
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._values: Dict[Labels, float] = {}
+        self._lock: Lock = Lock()
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines: List[str] = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        with self._lock:
+            values: List[Tuple[Labels, float]] = sorted(self._values.items())
+        for labels, value in values:
+            lines.append(f'{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}')
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name: str = name
+        self.documentation: str = documentation
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._values: Dict[Labels, float] = {}
+        self._lock: Lock = Lock()
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines: List[str] = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} gauge']
+        with self._lock:
+            values: List[Tuple[Labels, float]] = sorted(self._values.items())
+        for labels, value in values:
+            lines.append(f'{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float], label_names: Sequence[str] = ()):
+        self.name: str = name
+        self.documentation: str = documentation
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._series: Dict[Labels, List[float]] = {}
+        self._lock: Lock = Lock()
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        index: int = bisect_left(self.buckets, value)
+        with self._lock:
+            series: List[float] | None = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, labels: Labels = ()) -> int:
+        series: List[float] | None = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def sum(self, labels: Labels = ()) -> float:
+        series: List[float] | None = self._series.get(labels)
+        return series[-1] if series else 0.0
+
+    def render(self) -> List[str]:
+        lines: List[str] = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            snapshot: List[Tuple[Labels, List[float]]] = sorted((labels, list(series)) for labels, series in self._series.items())
+        bucket_label_names: Tuple[str, ...] = self.label_names + ('le',)
+        for labels, series in snapshot:
+            cumulative: int = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                cumulative += int(count)
+                lines.append(f'{self.name}_bucket{_format_labels(bucket_label_names, labels + (_format_value(bound),))} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(series[-1])}')
+            lines.append(f'{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}')
+        return lines
+
+
+class RequestStats:
+    __slots__ = ('queries', 'db_seconds')
+
+    def __init__(self):
+        self.queries: int = 0
+        self.db_seconds: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar('request_stats', default=None)
+
+
+class AppMetrics:
+    def __init__(self):
+        self.requests_total: Counter = Counter('http_requests_total', 'HTTP requests by route and status code.', ('method', 'route', 'status'))
+        self.request_duration: Histogram = Histogram(
+            'http_request_duration_seconds', 'HTTP request latency by route.', LATENCY_BUCKETS_SECONDS, ('method', 'route'),
+        )
+        self.request_db_duration: Histogram = Histogram(
+            'http_request_db_duration_seconds', 'Time spent executing SQL per HTTP request.', LATENCY_BUCKETS_SECONDS, ('method', 'route'),
+        )
+        self.request_db_queries: Histogram = Histogram(
+            'http_request_db_queries', 'SQL statements executed per HTTP request.', QUERY_COUNT_BUCKETS, ('method', 'route'),
+        )
+        self.db_queries_total: Counter = Counter('db_queries_total', 'SQL statements executed.')
+        self.db_query_seconds_total: Counter = Counter('db_query_seconds_total', 'Total time spent executing SQL statements.')
+        self.db_pool_checkout_wait: Histogram = Histogram(
+            'db_pool_checkout_wait_seconds', 'Time spent waiting for a connection from the pool.', LATENCY_BUCKETS_SECONDS,
+        )
+        self.rate_limit_rejections_total: Counter = Counter('rate_limit_rejections_total', 'Requests rejected by the rate limiter.', ('route',))
+        self.db_engine_up: Gauge = Gauge('db_engine_up', 'Whether a database engine is currently routed to (1) or marked unavailable (0).', ('engine',))
+        self.db_pool_checked_out: Gauge = Gauge('db_pool_checked_out_connections', 'Connections currently checked out of the pool.', ('engine',))
+        self.db_pool_idle: Gauge = Gauge('db_pool_idle_connections', 'Open connections waiting in the pool.', ('engine',))
+        self.db_pool_overflow: Gauge = Gauge('db_pool_overflow_connections', 'Connections open beyond the configured pool size.', ('engine',))
+        self.db_pool_size: Gauge = Gauge('db_pool_size', 'Configured pool size, excluding overflow.', ('engine',))
+        self.db_pool_timeouts_total: Counter = Counter('db_pool_timeouts_total', 'Checkouts that gave up waiting for a connection.')
+        self.event_stream_clients: Gauge = Gauge('event_stream_clients', 'Clients connected to the call event stream on this worker.')
+        self.event_stream_events_total: Counter = Counter('event_stream_events_total', 'Call events dispatched to stream clients on this worker.')
+        self.event_stream_dropped_total: Counter = Counter('event_stream_dropped_total', 'Stream clients disconnected because their queue was full.')
+        self.startup_seconds: Gauge = Gauge('app_startup_seconds', 'Time spent in each startup phase of this worker.', ('phase',))
+        self._collectors: List[Callable[[], None]] = []
+
+    def record_request(self, method: str, route: str, status_code: int, seconds: float, stats: RequestStats) -> None:
+        labels: Labels = (method, route)
+        self.requests_total.inc((method, route, str(status_code)))
+        self.request_duration.observe(seconds, labels)
+        self.request_db_duration.observe(stats.db_seconds, labels)
+        self.request_db_queries.observe(stats.queries, labels)
+        if stats.queries:
+            self.db_queries_total.inc(amount=stats.queries)
+            self.db_query_seconds_total.inc(amount=stats.db_seconds)
+
+    def record_query(self, seconds: float) -> None:
+        stats: RequestStats | None = _request_stats.get()
+        if stats is None:
+            self.db_queries_total.inc()
+            self.db_query_seconds_total.inc(amount=seconds)
+            return
+        stats.queries += 1
+        stats.db_seconds += seconds
+
+    def record_pool_checkout(self, seconds: float) -> None:
+        self.db_pool_checkout_wait.observe(seconds)
+
+    def record_pool_timeout(self) -> None:
+        self.db_pool_timeouts_total.inc()
+
+    def record_pool_status(self, engine: str, size: int, checked_out: int, idle: int, overflow: int) -> None:
+        labels: Labels = (engine,)
+        self.db_pool_size.set(size, labels)
+        self.db_pool_checked_out.set(checked_out, labels)
+        self.db_pool_idle.set(idle, labels)
+        self.db_pool_overflow.set(overflow, labels)
+
+    def record_rate_limit_rejection(self, route: str) -> None:
+        self.rate_limit_rejections_total.inc((route,))
+
+    def record_event_stream_clients(self, clients: int) -> None:
+        self.event_stream_clients.set(clients)
+
+    def record_event_stream_dispatch(self, events: int) -> None:
+        self.event_stream_events_total.inc(amount=events)
+
+    def record_event_stream_drop(self) -> None:
+        self.event_stream_dropped_total.inc()
+
+    def record_startup_phase(self, phase: str, seconds: float) -> None:
+        self.startup_seconds.set(seconds, (phase,))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+        lines: List[str] = []
+        for metric in (
+            self.requests_total,
+            self.request_duration,
+            self.request_db_duration,
+            self.request_db_queries,
+            self.db_queries_total,
+            self.db_query_seconds_total,
+            self.db_pool_checkout_wait,
+            self.db_pool_timeouts_total,
+            self.rate_limit_rejections_total,
+            self.db_engine_up,
+            self.db_pool_size,
+            self.db_pool_checked_out,
+            self.db_pool_idle,
+            self.db_pool_overflow,
+            self.event_stream_clients,
+            self.event_stream_events_total,
+            self.event_stream_dropped_total,
+            self.startup_seconds,
+        ):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+metrics: AppMetrics = AppMetrics()
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, app_metrics: AppMetrics = metrics):
+        self.app: ASGIApp = app
+        self.metrics: AppMetrics = app_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        stats: RequestStats = RequestStats()
+        token: Token = _request_stats.set(stats)
+        status_code: int = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        started: float = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed: float = perf_counter() - started
+            _request_stats.reset(token)
+            route = scope.get('route')
+            self.metrics.record_request(scope['method'], route.path if route else METRICS_UNMATCHED_ROUTE, status_code, elapsed, stats)
@@ -0,0 +1,34 @@
+from typing import Dict, List
+
+
+def header_qualities(value: str) -> Dict[str, float]:
+    qualities: Dict[str, float] = {}
+    for part in value.split(','):
+        token, *params = part.split(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality: float = 1.0
+        for param in params:
+            key, _, raw_value = param.strip().partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(raw_value)
+                except ValueError:
+                    quality = 0.0
+        qualities[token] = max(quality, qualities.get(token, 0.0))
+    return qualities
+
+
+def preferred(value: str | None, offers: List[str]) -> str | None:
+    if not value:
+        return None
+    qualities: Dict[str, float] = header_qualities(value)
+    best: str | None = None
+    best_quality: float = 0.0
+    for offer in offers:
+        wildcards: List[str] = [f'{offer.split("/")[0]}/*', '*/*'] if '/' in offer else ['*']
+        quality: float = next((qualities[key] for key in [offer, *wildcards] if key in qualities), 0.0)
+        if quality > best_quality:
+            best, best_quality = offer, quality
+    return best
@@ -0,0 +1,43 @@
+import base64
+from datetime import datetime
+from typing import Tuple
+
+from src.core.exceptions import InvalidCursorError
+
+CURSOR_SEPARATOR: str = '|'
+
+
+def _encode(key: str, id: int) -> str:
+    raw: str = f'{key}{CURSOR_SEPARATOR}{id}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode(cursor: str) -> Tuple[str, int]:
+    padded: str = cursor + '=' * (-len(cursor) % 4)
+    raw: str = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+    key, id = raw.rsplit(CURSOR_SEPARATOR, 1)
+    return key, int(id)
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    return _encode(created_at.isoformat(), id)
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, id = _decode(cursor)
+        return datetime.fromisoformat(created_at), id
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f'Invalid cursor: {cursor}') from e
+
+
+def encode_score_cursor(score: float, id: int) -> str:
+    return _encode(repr(score), id)
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, int]:
+    try:
+        score, id = _decode(cursor)
+        return float(score), id
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f'Invalid cursor: {cursor}') from e
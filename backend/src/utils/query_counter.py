@@ -0,0 +1,50 @@
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.constants.db import N_PLUS_ONE_THRESHOLD
+
+_IN_LIST_PATTERN: re.Pattern = re.compile(r'\((?:\s*(?:\?|%s|\$\d+|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|%s|\$\d+|%\(\w+\)s|:\w+)\s*\)')
+_WHITESPACE_PATTERN: re.Pattern = re.compile(r'\s+')
+
+
+def normalize_statement(statement: str) -> str:
+    return _IN_LIST_PATTERN.sub('(?)', _WHITESPACE_PATTERN.sub(' ', statement).strip())
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements: List[Tuple[str, Any]] = []
+        self._last_context: Any = None
+
+    def __enter__(self) -> 'QueryCounter':
+        event.listen(Engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(Engine, 'before_cursor_execute', self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None and context is self._last_context:
+            return
+        self._last_context = context
+        self.statements.append((statement, parameters))
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+    def find_n_plus_one(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> List[str]:
+        parameters_by_statement: Dict[str, Set[str]] = defaultdict(set)
+        for statement, parameters in self.statements:
+            parameters_by_statement[normalize_statement(statement)].add(repr(parameters))
+        return [statement for statement, parameters in parameters_by_statement.items() if len(parameters) >= threshold]
+
+    def report(self) -> str:
+        return '\n'.join(f'{index}. {normalize_statement(statement)} {parameters!r}' for index, (statement, parameters) in enumerate(self.statements, start=1))
@@ -0,0 +1,33 @@
+import json
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy.engine import Connection
+
+EXPLAINABLE_STATEMENTS: Tuple[str, ...] = ('SELECT', 'UPDATE', 'DELETE', 'WITH')
+
+
+def is_explainable(statement: str) -> bool:
+    return statement.lstrip().upper().startswith(EXPLAINABLE_STATEMENTS)
+
+
+def _postgres_seq_scans(node: Dict[str, Any]) -> List[str]:
+    scans: List[str] = []
+    if node.get('Node Type') == 'Seq Scan' and 'Filter' in node:
+        scans.append(f'{node["Relation Name"]}: {node["Filter"]}')
+    for child in node.get('Plans', []):
+        scans.extend(_postgres_seq_scans(child))
+    return scans
+
+
+def find_unindexed_scans(connection: Connection, statement: str, parameters: Any = None) -> List[str]:
+    if connection.dialect.name == 'postgresql':
+        connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+        plan: Any = connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {statement}', parameters).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return _postgres_seq_scans(plan[0]['Plan'])
+
+    rows: List[Any] = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+    if ' WHERE ' not in statement.upper():
+        return []
+    return [row[-1] for row in rows if row[-1].startswith('SCAN ') and ' USING ' not in row[-1]]
@@ -1,31 +1,153 @@
-from collections import deque
-from time import monotonic
-from typing import Deque, Dict
+import math
+import sqlite3
+from abc import ABC, abstractmethod
+from threading import Lock
+from time import time
+from typing import Dict, Tuple
 
+from anyio import to_thread
 from fastapi import Request, HTTPException, status
 
-from src.constants.api import RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW_SECONDS
+from src.constants.api import (
+    RATE_LIMIT_MAX_KEYS,
+    RATE_LIMIT_MAX_REQUESTS,
+    RATE_LIMIT_ROUTE_LIMITS,
+    RATE_LIMIT_SWEEP_INTERVAL_SECONDS,
+    RATE_LIMIT_WINDOW_SECONDS,
+)
+from src.core.config import settings
 from src.utils.logger import logger
+from src.utils.metrics import metrics
 
 
-_requests_log: Dict[str, Deque[float]] = {}
+class RateLimit:
+    def __init__(self, max_requests: int, window_seconds: float):
+        self.max_requests: int = max_requests
+        self.window_seconds: float = window_seconds
+        self.emission_interval: float = window_seconds / max_requests
 
 
-async def rate_limiter(request: Request) -> None:
-  client_ip: str = request.client.host if request.client else 'unknown'
-  key: str = f'{client_ip}:{request.url.path}'
-  now: float = monotonic()
+class RateLimitStore(ABC):
+    blocking: bool = False
+
+    @abstractmethod
+    def acquire(self, key: str, limit: RateLimit, now: float) -> float:
+        ...
+
+
+def _gcra(tat: float | None, limit: RateLimit, now: float) -> Tuple[float | None, float]:
+    tat = max(tat or now, now)
+    new_tat: float = tat + limit.emission_interval
+    retry_after: float = new_tat - limit.window_seconds - now
+    if retry_after > 0:
+        return None, retry_after
+    return new_tat, 0.0
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS, sweep_interval_seconds: float = RATE_LIMIT_SWEEP_INTERVAL_SECONDS):
+        self._tats: Dict[str, float] = {}
+        self._max_keys: int = max_keys
+        self._sweep_interval_seconds: float = sweep_interval_seconds
+        self._next_sweep: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    def _sweep(self, now: float) -> None:
+        for key, tat in list(self._tats.items()):
+            if tat <= now:
+                del self._tats[key]
+        self._next_sweep = now + self._sweep_interval_seconds
+
+    def acquire(self, key: str, limit: RateLimit, now: float) -> float:
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        tat: float | None = self._tats.pop(key, None)
+        new_tat, retry_after = _gcra(tat, limit, now)
+        if tat is None and len(self._tats) >= self._max_keys:
+            del self._tats[next(iter(self._tats))]
+        self._tats[key] = tat if new_tat is None else new_tat
+        return retry_after
+
+
+class SQLiteRateLimitStore(RateLimitStore):
+    blocking: bool = True
+
+    def __init__(self, path: str, sweep_interval_seconds: float = RATE_LIMIT_SWEEP_INTERVAL_SECONDS):
+        self._connection: sqlite3.Connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=5)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=OFF')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, tat REAL NOT NULL) WITHOUT ROWID')
+        self._lock: Lock = Lock()
+        self._sweep_interval_seconds: float = sweep_interval_seconds
+        self._next_sweep: float = 0.0
 
-  bucket: Deque[float] = _requests_log.setdefault(key, deque())
+    def acquire(self, key: str, limit: RateLimit, now: float) -> float:
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                if now >= self._next_sweep:
+                    self._connection.execute('DELETE FROM rate_limits WHERE tat <= ?', (now,))
+                    self._next_sweep = now + self._sweep_interval_seconds
 
-  while bucket and now - bucket[0] > RATE_LIMIT_WINDOW_SECONDS:
-    bucket.popleft()
+                row: Tuple[float] | None = self._connection.execute('SELECT tat FROM rate_limits WHERE key = ?', (key,)).fetchone()
+                new_tat, retry_after = _gcra(row[0] if row else None, limit, now)
+                if new_tat is not None:
+                    self._connection.execute('INSERT OR REPLACE INTO rate_limits (key, tat) VALUES (?, ?)', (key, new_tat))
+                self._connection.execute('COMMIT')
+                return retry_after
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+
+class RateLimiter:
+    def __init__(self, store: RateLimitStore, default_limit: RateLimit, route_limits: Dict[str, RateLimit] | None = None):
+        self.store: RateLimitStore = store
+        self.default_limit: RateLimit = default_limit
+        self.route_limits: Dict[str, RateLimit] = route_limits or {}
+
+    def get_limit(self, route_key: str) -> RateLimit:
+        return self.route_limits.get(route_key, self.default_limit)
+
+    def acquire(self, client_key: str, route_key: str, now: float | None = None) -> float:
+        return self.store.acquire(f'{client_key}:{route_key}', self.get_limit(route_key), time() if now is None else now)
+
+    async def acquire_async(self, client_key: str, route_key: str) -> float:
+        if self.store.blocking:
+            return await to_thread.run_sync(self.acquire, client_key, route_key)
+        return self.acquire(client_key, route_key)
+
+
+def _build_store() -> RateLimitStore:
+    if settings.rate_limit_backend == 'sqlite':
+        return SQLiteRateLimitStore(settings.rate_limit_sqlite_path)
+    return InMemoryRateLimitStore()
+
+
+_limiter: RateLimiter = RateLimiter(
+    store=_build_store(),
+    default_limit=RateLimit(RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW_SECONDS),
+    route_limits={route: RateLimit(*limit) for route, limit in RATE_LIMIT_ROUTE_LIMITS.items()},
+)
+
+
+async def rate_limiter(request: Request) -> None:
+    if not settings.rate_limit_enabled:
+        return
 
-  if len(bucket) >= RATE_LIMIT_MAX_REQUESTS:
-    logger.warning(f'Rate limit exceeded: client_ip={client_ip}, path={request.url.path}, requests={len(bucket)}')
-    raise HTTPException(
-      status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-      detail='Too many requests, please slow down.'
-    )
+    client_ip: str = request.client.host if request.client else 'unknown'
+    route = request.scope.get('route')
+    route_key: str = f'{request.method} {route.path if route else request.url.path}'
 
-  bucket.append(now)
+    retry_after: float = await _limiter.acquire_async(client_ip, route_key)
+    if retry_after > 0:
+        metrics.record_rate_limit_rejection(route_key)
+        logger.warning('Rate limit exceeded: client_ip=%s, route=%s, retry_after=%.2fs', client_ip, route_key, retry_after)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail='Too many requests, please slow down.',
+            headers={'Retry-After': str(math.ceil(retry_after))},
+        )
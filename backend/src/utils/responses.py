@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Type
+
+import msgpack
+import orjson
+from fastapi import Header
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from src.constants.api import JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE
+from src.utils.negotiation import preferred
+
+_NAIVE_UTC_EPOCH: datetime = datetime(1970, 1, 1)
+_UTC_EPOCH: datetime = _NAIVE_UTC_EPOCH.replace(tzinfo=timezone.utc)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class _MsgPackDefault:
+    def __init__(self):
+        self.timestamps: Dict[datetime, msgpack.Timestamp] = {}
+
+    def __call__(self, obj: Any) -> Any:
+        if isinstance(obj, BaseModel):
+            return obj.__dict__
+        if isinstance(obj, datetime):
+            timestamp: msgpack.Timestamp | None = self.timestamps.get(obj)
+            if timestamp is None:
+                since_epoch: timedelta = obj - (_UTC_EPOCH if obj.tzinfo else _NAIVE_UTC_EPOCH)
+                timestamp = self.timestamps[obj] = msgpack.Timestamp(since_epoch.days * 86400 + since_epoch.seconds, since_epoch.microseconds * 1000)
+            return timestamp
+        raise TypeError(f'Object of type {type(obj).__name__} is not MessagePack serializable')
+
+
+def dump_json(content: Any, option: int = 0) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | option)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_CONTENT_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_MsgPackDefault())
+
+
+def negotiate_response_class(accept: str | None = Header(None)) -> Type[Response]:
+    if preferred(accept, [JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE]) == MSGPACK_CONTENT_TYPE:
+        return MsgPackResponse
+    return FastJSONResponse
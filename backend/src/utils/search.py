@@ -0,0 +1,12 @@
+import re
+from typing import List
+
+_TOKEN_PATTERN: re.Pattern = re.compile(r'\w+')
+
+
+def tokenize_search_query(query: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(query)
+
+
+def to_fts5_match_query(query: str) -> str:
+    return ' '.join(f'"{token}"' for token in tokenize_search_query(query))
@@ -0,0 +1,31 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict
+
+import orjson
+
+from src.constants.events import CallEventType
+from src.core.events import EventHub, Subscription
+
+KEEPALIVE_MESSAGE: bytes = b': keepalive\n\n'
+
+
+def format_event(event: Dict[str, Any]) -> bytes:
+    return b'event: ' + event['type'].encode() + b'\ndata: ' + orjson.dumps(event) + b'\n\n'
+
+
+async def stream_events(hub: EventHub, subscription: Subscription, keepalive_seconds: float, reconnect_ms: int) -> AsyncIterator[bytes]:
+    try:
+        yield f'retry: {reconnect_ms}\n\n'.encode()
+        while True:
+            try:
+                event: Dict[str, Any] | None = await asyncio.wait_for(subscription.queue.get(), keepalive_seconds)
+            except asyncio.TimeoutError:
+                yield KEEPALIVE_MESSAGE
+                continue
+            if event is None:
+                if subscription.dropped:
+                    yield format_event({'type': CallEventType.STREAM_OVERFLOW.value})
+                return
+            yield format_event(event)
+    finally:
+        hub.unsubscribe(subscription)
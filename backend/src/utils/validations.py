@@ -1,7 +1,49 @@
-from src.core.exceptions import InvalidDaysLimitError
-from src.constants.limits import MIN_DAYS_LIMIT, MAX_DAYS_LIMIT
+from datetime import date, datetime
+from typing import List
+
+from src.core.exceptions import BulkLimitExceededError, InvalidCallIdsError, InvalidDateRangeError, InvalidDaysLimitError, InvalidPageLimitError, InvalidSearchQueryError, InvalidTagIdsError
+from src.constants.limits import MIN_DAYS_LIMIT, MAX_DAYS_LIMIT, MIN_PAGE_LIMIT, MAX_PAGE_LIMIT, MAX_CALL_IDS_PER_REQUEST, MAX_BULK_LINK_IDS, MAX_SEARCH_QUERY_LENGTH, MAX_STATS_DAYS, MAX_SUGGESTION_TAG_IDS
+from src.utils.search import tokenize_search_query
 
 
 def validate_days_limit(days: int) -> None:
     if days < MIN_DAYS_LIMIT or days > MAX_DAYS_LIMIT:
         raise InvalidDaysLimitError(f'Days parameter must be between 1 and 30, got {days}')
+
+
+def validate_page_limit(limit: int) -> None:
+    if limit < MIN_PAGE_LIMIT or limit > MAX_PAGE_LIMIT:
+        raise InvalidPageLimitError(f'Limit parameter must be between {MIN_PAGE_LIMIT} and {MAX_PAGE_LIMIT}, got {limit}')
+
+
+def validate_date_range(start: datetime | None, end: datetime | None) -> None:
+    if start is not None and end is not None and start > end:
+        raise InvalidDateRangeError(f'Start date {start.isoformat()} must not be after end date {end.isoformat()}')
+
+
+def validate_stats_range(start: date, end: date) -> None:
+    validate_date_range(start, end)
+    if (end - start).days >= MAX_STATS_DAYS:
+        raise InvalidDateRangeError(f'Stats range must span at most {MAX_STATS_DAYS} days, got {(end - start).days + 1}')
+
+
+def validate_call_ids(call_ids: List[int]) -> None:
+    if not call_ids or len(call_ids) > MAX_CALL_IDS_PER_REQUEST:
+        raise InvalidCallIdsError(f'Between 1 and {MAX_CALL_IDS_PER_REQUEST} call ids are required, got {len(call_ids)}')
+
+
+def validate_link_ids(ids: List[int]) -> None:
+    if len(ids) > MAX_BULK_LINK_IDS:
+        raise BulkLimitExceededError(f'Bulk links are limited to {MAX_BULK_LINK_IDS} ids, got {len(ids)}')
+
+
+def validate_tag_ids(tag_ids: List[int]) -> None:
+    if not tag_ids or len(tag_ids) > MAX_SUGGESTION_TAG_IDS:
+        raise InvalidTagIdsError(f'Between 1 and {MAX_SUGGESTION_TAG_IDS} tag ids are required, got {len(tag_ids)}')
+
+
+def validate_search_query(query: str) -> None:
+    if len(query) > MAX_SEARCH_QUERY_LENGTH:
+        raise InvalidSearchQueryError(f'Search query must be at most {MAX_SEARCH_QUERY_LENGTH} characters, got {len(query)}')
+    if not tokenize_search_query(query):
+        raise InvalidSearchQueryError('Search query must contain at least one word')
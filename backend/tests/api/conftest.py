@@ -0,0 +1,47 @@
+import os
+from typing import AsyncGenerator, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app import app
+from src.core.db import get_async_db, run_migrations
+from src.dal.suggestion_index import suggestion_index
+from src.dal.tag_catalog import tag_catalog
+from src.utils.query_counter import QueryCounter
+from src.utils.rate_limit import rate_limiter
+
+
+@pytest.fixture
+def client(temp_dir: str) -> Iterator[TestClient]:
+    path: str = os.path.join(temp_dir, 'api.sqlite3')
+    engine: Engine = create_engine(f'sqlite:///{path}')
+    with engine.begin() as connection:
+        run_migrations(connection)
+    engine.dispose()
+
+    async_engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{path}', poolclass=NullPool)
+    session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    async def get_test_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = get_test_db
+    app.dependency_overrides[rate_limiter] = lambda: None
+    tag_catalog.invalidate()
+    suggestion_index.invalidate()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    tag_catalog.invalidate()
+    suggestion_index.invalidate()
+
+
+@pytest.fixture
+def queries() -> Iterator[QueryCounter]:
+    with QueryCounter() as counter:
+        yield counter
@@ -0,0 +1,18 @@
+from fastapi.testclient import TestClient
+
+from src.constants.limits import MAX_BULK_BODY_BYTES
+
+
+class TestBulkCreateCalls:
+    def test_creates_valid_items_and_reports_invalid_ones(self, client: TestClient) -> None:
+        response = client.post('/api/v1/calls/bulk', content=b'{"name": "a"}\n{"tag_ids": [1]}\n', headers={'Content-Type': 'application/x-ndjson'})
+
+        assert response.status_code == 200
+        assert (response.json()['created'], response.json()['failed']) == (1, 1)
+
+    def test_rejects_oversized_body(self, client: TestClient) -> None:
+        body: bytes = b'[' + b' ' * MAX_BULK_BODY_BYTES + b']'
+        response = client.post('/api/v1/calls/bulk', content=body, headers={'Content-Type': 'application/json'})
+
+        assert response.status_code == 413
+        assert client.get('/api/v1/calls').json()['items'] == []
@@ -0,0 +1,98 @@
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import orjson
+from fastapi.testclient import TestClient
+
+from app import app
+from src.core.events import call_events
+from src.utils.query_counter import QueryCounter
+
+
+class EventStream:
+    def __init__(self):
+        self.messages: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        self.disconnected: asyncio.Event = asyncio.Event()
+        self.requested: bool = False
+        self.task: asyncio.Task | None = None
+
+    async def receive(self) -> Dict[str, Any]:
+        if not self.requested:
+            self.requested = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await self.disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        await self.messages.put(message)
+
+    async def open(self) -> Dict[str, Any]:
+        scope: Dict[str, Any] = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': '/api/v1/calls/stream',
+            'raw_path': b'/api/v1/calls/stream',
+            'root_path': '',
+            'query_string': b'',
+            'headers': [(b'host', b'testserver'), (b'accept', b'text/event-stream')],
+            'client': ('testclient', 50000),
+            'server': ('testserver', 80),
+        }
+        self.task = asyncio.create_task(app(scope, self.receive, self.send))
+        start: Dict[str, Any] = await asyncio.wait_for(self.messages.get(), 5)
+        assert (await asyncio.wait_for(self.messages.get(), 5))['body'] == b'retry: 3000\n\n'
+        return start
+
+    async def read_events(self, count: int) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        while len(events) < count:
+            body: bytes = (await asyncio.wait_for(self.messages.get(), 5))['body']
+            event_line, data_line = body.decode().strip().split('\n')
+            events.append(orjson.loads(data_line.removeprefix('data: ')))
+            assert event_line == f'event: {events[-1]["type"]}'
+        return events
+
+    async def close(self) -> None:
+        self.disconnected.set()
+        await asyncio.wait_for(self.task, 5)
+
+
+class TestCallEventStream:
+    def test_streams_committed_changes(self, client: TestClient) -> None:
+        async def run() -> List[Dict[str, Any]]:
+            stream: EventStream = EventStream()
+            with QueryCounter() as stream_queries:
+                start: Dict[str, Any] = await stream.open()
+            assert stream_queries.count == 0
+            assert start['status'] == 200
+            assert (b'content-type', b'text/event-stream; charset=utf-8') in start['headers']
+            assert len(call_events) == 1
+
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://testserver/api') as http:
+                tag_id: int = (await http.post('/v1/tags', json={'name': 'fire'})).json()['id']
+                template_id: int = (await http.post('/v1/tasks/template', json={'name': 'evacuate', 'type': 'template', 'tag_ids': [tag_id]})).json()['id']
+                call_id: int = (await http.post('/v1/calls', json={'name': 'call'})).json()['id']
+                (await http.patch(f'/v1/calls/{call_id}', json={'name': 'renamed', 'tag_ids': [tag_id]})).raise_for_status()
+                (await http.post(f'/v1/calls/{call_id}/suggested-tasks/apply')).raise_for_status()
+                (await http.patch(f'/v1/tasks/{template_id}', json={'call_id': call_id, 'status': 'completed'})).raise_for_status()
+                (await http.post(f'/v1/calls/{call_id}/tasks/unlink', json={'task_ids': [template_id]})).raise_for_status()
+                assert (await http.patch('/v1/calls/999', json={'name': 'missing'})).status_code == 404
+
+            events: List[Dict[str, Any]] = await stream.read_events(6)
+            assert stream.messages.empty()
+            await stream.close()
+            assert len(call_events) == 0
+            return [{key: value for key, value in event.items() if key != 'call_id'} | {'call': event['call_id'] == call_id} for event in events]
+
+        assert asyncio.run(run()) == [
+            {'type': 'call.created', 'tag_ids': [], 'call': True},
+            {'type': 'call.tags_changed', 'tag_ids': [1], 'call': True},
+            {'type': 'call.updated', 'call': True},
+            {'type': 'task.linked', 'task_id': 1, 'status': 'open', 'call': True},
+            {'type': 'task.status_changed', 'task_id': 1, 'status': 'completed', 'call': True},
+            {'type': 'task.unlinked', 'task_id': 1, 'call': True},
+        ]
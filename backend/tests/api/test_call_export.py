@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+EXPORT_PATH: str = '/api/v1/calls/export'
+
+
+@pytest.fixture
+def calls(client: TestClient) -> List[Dict[str, Any]]:
+    tag_id: int = client.post('/api/v1/tags', json={'name': 'fire'}).json()['id']
+    created: List[Dict[str, Any]] = [
+        client.post('/api/v1/calls', json={'name': 'Kitchen fire', 'description': 'Smoke in the kitchen', 'tag_ids': [tag_id]}).json(),
+        client.post('/api/v1/calls', json={'name': 'Noise complaint'}).json(),
+    ]
+    client.post('/api/v1/tasks', json={'name': 'Call back', 'type': 'ad_hoc', 'call_id': created[0]['id'], 'status': 'open'}).raise_for_status()
+    return created
+
+
+def export(client: TestClient, **params: Any) -> str:
+    response = client.get(EXPORT_PATH, params=params)
+    assert response.status_code == 200, response.text
+    return response.text
+
+
+def ndjson_ids(body: str) -> List[int]:
+    return [json.loads(line)['id'] for line in body.splitlines()]
+
+
+class TestCallExport:
+    def test_streams_ndjson_records(self, client: TestClient, calls: List[Dict[str, Any]]) -> None:
+        response = client.get(EXPORT_PATH)
+
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+        assert response.headers['content-disposition'] == 'attachment; filename="calls-export.ndjson"'
+        records: List[Dict[str, Any]] = [json.loads(line) for line in response.text.splitlines()]
+        assert [record['id'] for record in records] == [call['id'] for call in calls]
+        assert records[0]['tags'] == [{'id': calls[0]['tags'][0]['id'], 'name': 'fire'}]
+        assert [(task['name'], task['status']) for task in records[0]['tasks']] == [('Call back', 'open')]
+        assert (records[1]['tags'], records[1]['tasks']) == ([], [])
+
+    def test_streams_csv_rows(self, client: TestClient, calls: List[Dict[str, Any]]) -> None:
+        rows: List[Dict[str, str]] = list(csv.DictReader(io.StringIO(export(client, format='csv'))))
+
+        assert [int(row['id']) for row in rows] == [call['id'] for call in calls]
+        assert (rows[0]['tags'], rows[0]['tasks']) == ('fire', 'Call back:open')
+        assert rows[1]['description'] == ''
+
+    @pytest.mark.parametrize(
+        'offsets',
+        [(timezone.utc, None), (None, timezone.utc), (timezone(timedelta(hours=-5)), timezone(timedelta(hours=3)))],
+        ids=['aware_start_naive_end', 'naive_start_aware_end', 'different_offsets'],
+    )
+    def test_accepts_mixed_timezone_bounds(self, client: TestClient, calls: List[Dict[str, Any]], offsets: tuple) -> None:
+        now: datetime = datetime.now(timezone.utc)
+        start, end = now - timedelta(hours=1), now + timedelta(hours=1)
+        bounds: List[datetime] = [bound.astimezone(offset) if offset else bound.replace(tzinfo=None) for bound, offset in zip((start, end), offsets)]
+
+        assert ndjson_ids(export(client, start=bounds[0].isoformat(), end=bounds[1].isoformat())) == [call['id'] for call in calls]
+
+    def test_compares_offset_bounds_in_utc(self, client: TestClient, calls: List[Dict[str, Any]]) -> None:
+        end: datetime = (datetime.now(timezone.utc) + timedelta(minutes=1)).astimezone(timezone(timedelta(hours=-5)))
+        assert ndjson_ids(export(client, end=end.isoformat())) == [call['id'] for call in calls]
+        assert export(client, start=end.isoformat()) == ''
+
+    @pytest.mark.parametrize(
+        'params',
+        [
+            {'start': '2024-01-03T00:00:00', 'end': '2024-01-02T00:00:00'},
+            {'start': '2024-01-03T00:00:00Z', 'end': '2024-01-02T18:00:00-05:00'},
+        ],
+        ids=['naive', 'mixed'],
+    )
+    def test_rejects_start_after_end(self, client: TestClient, params: Dict[str, str]) -> None:
+        assert client.get(EXPORT_PATH, params=params).status_code == 400
+
+    def test_rejects_unknown_format(self, client: TestClient) -> None:
+        assert client.get(EXPORT_PATH, params={'format': 'xml'}).status_code == 422
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+SEARCH_PATH: str = '/api/v1/calls/search'
+
+
+@pytest.fixture
+def call_ids(client: TestClient) -> Dict[str, int]:
+    tag_id: int = client.post('/api/v1/tags', json={'name': 'fire'}).json()['id']
+    calls: Dict[str, Dict[str, Any]] = {
+        'name_match': {'name': 'Kitchen fire on Elm Street', 'tag_ids': [tag_id]},
+        'description_match': {'name': 'Smoke report', 'description': 'Neighbour saw a small fire near the garage'},
+        'stemmed_match': {'name': 'Fires reported downtown'},
+        'unrelated': {'name': 'Noise complaint', 'description': 'Loud music after midnight'},
+    }
+    return {key: client.post('/api/v1/calls', json=payload).json()['id'] for key, payload in calls.items()} | {'tag_id': tag_id}
+
+
+def search(client: TestClient, **params: Any) -> Dict[str, Any]:
+    response = client.get(SEARCH_PATH, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def result_ids(page: Dict[str, Any]) -> List[int]:
+    return [item['id'] for item in page['items']]
+
+
+class TestCallSearch:
+    def test_ranks_name_matches_above_description_matches(self, client: TestClient, call_ids: Dict[str, int]) -> None:
+        page = search(client, q='fire')
+
+        ids: List[int] = result_ids(page)
+        assert set(ids) == {call_ids['name_match'], call_ids['description_match'], call_ids['stemmed_match']}
+        assert ids.index(call_ids['name_match']) < ids.index(call_ids['description_match'])
+        assert [item['score'] for item in page['items']] == sorted((item['score'] for item in page['items']), reverse=True)
+        assert page['next_cursor'] is None
+
+    def test_matches_all_words(self, client: TestClient, call_ids: Dict[str, int]) -> None:
+        assert result_ids(search(client, q='fire elm')) == [call_ids['name_match']]
+
+    def test_ignores_search_syntax(self, client: TestClient, call_ids: Dict[str, int]) -> None:
+        assert result_ids(search(client, q='"noise" -(complaint*')) == [call_ids['unrelated']]
+
+    def test_paginates_without_gaps_or_duplicates(self, client: TestClient, call_ids: Dict[str, int]) -> None:
+        expected: List[int] = result_ids(search(client, q='fire'))
+
+        seen: List[int] = []
+        page = search(client, q='fire', limit=1)
+        while True:
+            seen.extend(result_ids(page))
+            if page['next_cursor'] is None:
+                break
+            page = search(client, q='fire', limit=1, cursor=page['next_cursor'])
+
+        assert seen == expected
+
+    def test_filters_by_tag(self, client: TestClient, call_ids: Dict[str, int]) -> None:
+        assert result_ids(search(client, q='fire', tag_ids=[call_ids['tag_id']])) == [call_ids['name_match']]
+
+    def test_filters_by_date_range(self, client: TestClient, call_ids: Dict[str, int]) -> None:
+        now: datetime = datetime.now(timezone.utc)
+        assert len(search(client, q='fire', start=(now - timedelta(days=1)).isoformat())['items']) == 3
+        assert search(client, q='fire', start=(now + timedelta(days=1)).isoformat())['items'] == []
+
+    def test_accepts_mixed_naive_and_offset_bounds(self, client: TestClient, call_ids: Dict[str, int]) -> None:
+        now: datetime = datetime.now(timezone.utc)
+        page = search(client, q='fire', start=(now - timedelta(days=1)).isoformat(), end=(now + timedelta(days=1)).replace(tzinfo=None).isoformat())
+        assert len(page['items']) == 3
+
+    def test_reflects_updates(self, client: TestClient, call_ids: Dict[str, int]) -> None:
+        client.patch(f'/api/v1/calls/{call_ids["unrelated"]}', json={'name': 'Brush fire', 'description': 'Dry grass'}).raise_for_status()
+
+        assert call_ids['unrelated'] in result_ids(search(client, q='fire'))
+        assert search(client, q='midnight')['items'] == []
+
+    @pytest.mark.parametrize('params', [
+        {'q': ''},
+        {'q': '?!'},
+        {'q': 'x' * 201},
+        {'q': 'fire', 'limit': 0},
+        {'q': 'fire', 'cursor': 'not-a-cursor'},
+        {'q': 'fire', 'start': '2025-02-01T00:00:00', 'end': '2025-01-01T00:00:00'},
+    ], ids=['empty', 'no_words', 'too_long', 'invalid_limit', 'invalid_cursor', 'invalid_date_range'])
+    def test_rejects_invalid_requests(self, params: Dict[str, Any], client: TestClient, call_ids: Dict[str, int]) -> None:
+        assert client.get(SEARCH_PATH, params=params).status_code == 400
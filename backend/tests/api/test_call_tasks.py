@@ -0,0 +1,72 @@
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.constants.limits import MAX_CALL_IDS_PER_REQUEST
+
+CALL_TASKS_PATH: str = '/api/v1/calls/tasks'
+
+
+def create(client: TestClient, path: str, payload: Dict[str, Any]) -> int:
+    response = client.post(path, json=payload)
+    response.raise_for_status()
+    return response.json()['id']
+
+
+@pytest.fixture
+def ids(client: TestClient) -> Dict[str, int]:
+    fire: int = create(client, '/api/v1/tags', {'name': 'fire'})
+    evacuate: int = create(client, '/api/v1/tasks/template', {'name': 'evacuate', 'type': 'template', 'tag_ids': [fire]})
+    sandbags: int = create(client, '/api/v1/tasks/template', {'name': 'sandbags', 'type': 'template', 'tag_ids': [fire]})
+    house_fire: int = create(client, '/api/v1/calls', {'name': 'house fire', 'tag_ids': [fire]})
+    river_flood: int = create(client, '/api/v1/calls', {'name': 'river flood', 'tag_ids': [fire]})
+    noise_complaint: int = create(client, '/api/v1/calls', {'name': 'noise complaint'})
+    for task_id, call_id in ((evacuate, house_fire), (sandbags, house_fire), (sandbags, river_flood)):
+        client.post(f'/api/v1/tasks/template/{task_id}/link', params={'call_id': call_id}).raise_for_status()
+    follow_up: int = create(client, '/api/v1/tasks', {'name': 'follow up', 'type': 'ad_hoc', 'call_id': river_flood, 'status': 'open'})
+    return {
+        'evacuate': evacuate,
+        'sandbags': sandbags,
+        'follow_up': follow_up,
+        'house_fire': house_fire,
+        'river_flood': river_flood,
+        'noise_complaint': noise_complaint,
+    }
+
+
+def grouped_task_ids(client: TestClient, call_ids: List[int]) -> Dict[str, List[int]]:
+    response = client.get(CALL_TASKS_PATH, params={'call_ids': call_ids})
+    assert response.status_code == 200, response.text
+    return {call_id: [task['id'] for task in tasks] for call_id, tasks in response.json().items()}
+
+
+class TestTasksForCalls:
+    def test_groups_tasks_by_call(self, client: TestClient, ids: Dict[str, int]) -> None:
+        assert grouped_task_ids(client, [ids['river_flood'], ids['house_fire']]) == {
+            str(ids['river_flood']): [ids['sandbags'], ids['follow_up']],
+            str(ids['house_fire']): [ids['evacuate'], ids['sandbags']],
+        }
+
+    def test_matches_the_single_call_route(self, client: TestClient, ids: Dict[str, int]) -> None:
+        call_ids: List[int] = [ids['house_fire'], ids['river_flood'], ids['noise_complaint']]
+        grouped: Dict[str, Any] = client.get(CALL_TASKS_PATH, params={'call_ids': call_ids}).json()
+        for call_id in call_ids:
+            assert grouped[str(call_id)] == client.get(f'/api/v1/calls/{call_id}/tasks').json()
+
+    def test_calls_without_tasks_get_empty_lists(self, client: TestClient, ids: Dict[str, int]) -> None:
+        assert grouped_task_ids(client, [ids['noise_complaint'], 999]) == {str(ids['noise_complaint']): [], '999': []}
+
+    def test_skips_inactive_tasks(self, client: TestClient, ids: Dict[str, int]) -> None:
+        client.delete(f'/api/v1/tasks/template/{ids["sandbags"]}').raise_for_status()
+        assert grouped_task_ids(client, [ids['house_fire']]) == {str(ids['house_fire']): [ids['evacuate']]}
+
+    def test_accepts_the_maximum_number_of_ids(self, client: TestClient) -> None:
+        assert len(grouped_task_ids(client, list(range(1, MAX_CALL_IDS_PER_REQUEST + 1)))) == MAX_CALL_IDS_PER_REQUEST
+
+    @pytest.mark.parametrize('call_count, expected_status', [
+        (0, 422),
+        (MAX_CALL_IDS_PER_REQUEST + 1, 400),
+    ], ids=['missing', 'too_many'])
+    def test_rejects_invalid_call_ids(self, client: TestClient, call_count: int, expected_status: int) -> None:
+        assert client.get(CALL_TASKS_PATH, params={'call_ids': list(range(1, call_count + 1))}).status_code == expected_status
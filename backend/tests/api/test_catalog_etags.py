@@ -0,0 +1,112 @@
+import os
+from typing import Callable, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import Engine
+
+from src.constants.db import TEMPLATE_TASKS_CATALOG_NAME
+from src.models.catalog_version import CatalogVersion
+from src.utils.query_counter import QueryCounter
+
+CATALOG_PATHS: Dict[str, str] = {
+    'tags': '/api/v1/tags',
+    'template_tasks': '/api/v1/tasks/template',
+    'suggested_tasks': '/api/v1/tags/{tag_id}/suggested-tasks',
+}
+
+
+@pytest.fixture
+def tag_id(client: TestClient) -> int:
+    tag_id: int = client.post('/api/v1/tags', json={'name': 'fire'}).json()['id']
+    client.post('/api/v1/tasks/template', json={'name': 'Dispatch unit', 'type': 'template', 'tag_ids': [tag_id]}).raise_for_status()
+    return tag_id
+
+
+def create_template(client: TestClient, tag_id: int) -> None:
+    client.post('/api/v1/tasks/template', json={'name': 'Notify residents', 'type': 'template', 'tag_ids': [tag_id]}).raise_for_status()
+
+
+def rename_tag(client: TestClient, tag_id: int) -> None:
+    client.patch(f'/api/v1/tags/{tag_id}', json={'name': 'wildfire'}).raise_for_status()
+
+
+def deactivate_template(client: TestClient, tag_id: int) -> None:
+    task_id: int = client.get('/api/v1/tasks/template').json()[0]['id']
+    assert client.delete(f'/api/v1/tasks/template/{task_id}').status_code == 204
+
+
+def link_template(client: TestClient, tag_id: int) -> None:
+    call_id: int = client.post('/api/v1/calls', json={'name': 'call'}).json()['id']
+    task_id: int = client.get('/api/v1/tasks/template').json()[0]['id']
+    client.post(f'/api/v1/tasks/template/{task_id}/link', params={'call_id': call_id}).raise_for_status()
+
+
+def update_template_status(client: TestClient, tag_id: int, name: str | None = None) -> None:
+    call_id: int = client.post('/api/v1/calls', json={'name': 'call'}).json()['id']
+    task_id: int = client.get('/api/v1/tasks/template').json()[0]['id']
+    client.post(f'/api/v1/tasks/template/{task_id}/link', params={'call_id': call_id}).raise_for_status()
+    client.patch(f'/api/v1/tasks/{task_id}', json={'name': name, 'call_id': call_id, 'status': 'completed'}).raise_for_status()
+
+
+def rename_template_unchanged(client: TestClient, tag_id: int) -> None:
+    update_template_status(client, tag_id, name='Dispatch unit')
+
+
+def template_tasks_version(temp_dir: str) -> int | None:
+    engine: Engine = create_engine(f'sqlite:///{os.path.join(temp_dir, "api.sqlite3")}')
+    with engine.connect() as connection:
+        version: int | None = connection.scalar(select(CatalogVersion.version).where(CatalogVersion.name == TEMPLATE_TASKS_CATALOG_NAME))
+    engine.dispose()
+    return version
+
+
+class TestCatalogETags:
+    @pytest.mark.parametrize('path', list(CATALOG_PATHS.values()), ids=list(CATALOG_PATHS))
+    def test_returns_304_without_loading_rows(self, client: TestClient, tag_id: int, path: str) -> None:
+        path = path.format(tag_id=tag_id)
+        response = client.get(path)
+        etag: str = response.headers['ETag']
+        assert response.headers['Cache-Control'] == 'private, no-cache'
+
+        with QueryCounter() as queries:
+            cached = client.get(path, headers={'If-None-Match': etag})
+
+        assert cached.status_code == 304
+        assert cached.content == b''
+        assert cached.headers['ETag'] == etag
+        assert cached.headers.get('Vary') == response.headers.get('Vary')
+        assert queries.count == 1
+
+    @pytest.mark.parametrize('if_none_match', ['W/"other"', '"tags-0"', ''], ids=['different', 'stale', 'empty'])
+    def test_returns_full_response_when_etag_differs(self, client: TestClient, tag_id: int, if_none_match: str) -> None:
+        response = client.get('/api/v1/tags', headers={'If-None-Match': if_none_match})
+        assert response.status_code == 200
+        assert [tag['id'] for tag in response.json()] == [tag_id]
+
+    @pytest.mark.parametrize(
+        'change, changed_paths',
+        [
+            (create_template, ['template_tasks', 'suggested_tasks']),
+            (deactivate_template, ['template_tasks', 'suggested_tasks']),
+            (rename_tag, ['tags', 'template_tasks', 'suggested_tasks']),
+            (link_template, []),
+            (update_template_status, []),
+            (rename_template_unchanged, []),
+        ],
+        ids=['create_template', 'deactivate_template', 'rename_tag', 'link_template', 'update_template_status', 'rename_template_unchanged'],
+    )
+    def test_etag_changes_with_catalog_content(
+        self, client: TestClient, tag_id: int, change: Callable[[TestClient, int], None], changed_paths: List[str],
+    ) -> None:
+        paths: Dict[str, str] = {name: path.format(tag_id=tag_id) for name, path in CATALOG_PATHS.items()}
+        before: Dict[str, str] = {name: client.get(path).headers['ETag'] for name, path in paths.items()}
+        change(client, tag_id)
+        after: Dict[str, str] = {name: client.get(path).headers['ETag'] for name, path in paths.items()}
+        assert sorted(name for name in paths if before[name] != after[name]) == sorted(changed_paths)
+
+    def test_status_update_keeps_the_template_tasks_version(self, client: TestClient, tag_id: int, temp_dir: str) -> None:
+        before: int | None = template_tasks_version(temp_dir)
+        update_template_status(client, tag_id)
+        assert template_tasks_version(temp_dir) == before
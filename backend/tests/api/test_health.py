@@ -0,0 +1,34 @@
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.constants.health import LIVENESS_PATH, READINESS_PATH
+from src.core.health import readiness
+
+
+@pytest.fixture(autouse=True)
+def reset_readiness() -> Iterator[None]:
+    readiness.reset()
+    yield
+    readiness.reset()
+
+
+class TestHealth:
+    def test_liveness_does_not_wait_for_startup(self, client: TestClient) -> None:
+        response = client.get(LIVENESS_PATH)
+        assert (response.status_code, response.json()) == (200, {'status': 'alive'})
+
+    def test_ready_only_between_startup_and_shutdown(self, client: TestClient) -> None:
+        response = client.get(READINESS_PATH)
+        assert (response.status_code, response.json()['status']) == (503, 'starting')
+
+        readiness.mark_ready({'primary': 5})
+        response = client.get(READINESS_PATH)
+        assert response.status_code == 200
+        assert response.json() == {'status': 'ready', 'pools': {'primary': 5}, 'replicas': {}}
+
+        readiness.mark_stopping()
+        response = client.get(READINESS_PATH)
+        assert (response.status_code, response.json()['status']) == (503, 'stopping')
+
@@ -0,0 +1,32 @@
+from typing import Dict
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.constants.metrics import METRICS_PATH
+from src.core.config import settings
+
+
+class TestMetricsEndpoint:
+    @pytest.mark.parametrize('enabled, token, headers, expected_status', [
+        (False, None, {}, 404),
+        (False, 'secret', {'Authorization': 'Bearer secret'}, 404),
+        (True, None, {}, 200),
+        (True, 'secret', {'Authorization': 'Bearer secret'}, 200),
+        (True, 'secret', {}, 401),
+        (True, 'secret', {'Authorization': 'Bearer wrong'}, 401),
+        (True, 'secret', {'Authorization': 'secret'}, 401),
+    ], ids=['disabled', 'disabled_with_token', 'enabled', 'valid_token', 'missing_token', 'wrong_token', 'wrong_scheme'])
+    def test_access(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch, enabled: bool, token: str | None, headers: Dict[str, str], expected_status: int
+    ) -> None:
+        monkeypatch.setattr(settings, 'metrics_enabled', enabled)
+        monkeypatch.setattr(settings, 'metrics_token', token)
+
+        response = client.get(METRICS_PATH, headers=headers)
+
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            assert '# TYPE http_request_duration_seconds histogram' in response.text
+        if expected_status == 401:
+            assert response.headers['WWW-Authenticate'] == 'Bearer'
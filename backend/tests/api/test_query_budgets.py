@@ -0,0 +1,191 @@
+from typing import Any, Dict, List, Set, Tuple
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.utils.query_counter import QueryCounter
+
+QUERY_BUDGETS: Dict[str, int] = {
+    'GET /api/v1/calls': 2,
+    'POST /api/v1/calls': 4,
+    'POST /api/v1/calls/bulk': 4,
+    'GET /api/v1/calls/export': 3,
+    'GET /api/v1/calls/search': 2,
+    'GET /api/v1/calls/tasks': 1,
+    'GET /api/v1/calls/{call_id}': 3,
+    'PATCH /api/v1/calls/{call_id}': 8,
+    'GET /api/v1/calls/{call_id}/tasks': 1,
+    'GET /api/v1/calls/{call_id}/suggested-tasks': 4,
+    'POST /api/v1/calls/{call_id}/tasks/link': 3,
+    'POST /api/v1/calls/{call_id}/tasks/unlink': 3,
+    'POST /api/v1/calls/{call_id}/suggested-tasks/apply': 3,
+    'GET /api/v1/tags': 1,
+    'POST /api/v1/tags': 3,
+    'GET /api/v1/tags/suggested-tasks': 3,
+    'GET /api/v1/tags/{tag_id}': 1,
+    'PATCH /api/v1/tags/{tag_id}': 3,
+    'DELETE /api/v1/tags/{tag_id}': 2,
+    'GET /api/v1/tags/{tag_id}/suggested-tasks': 3,
+    'GET /api/v1/stats': 2,
+    'GET /api/v1/tasks': 1,
+    'POST /api/v1/tasks': 3,
+    'PATCH /api/v1/tasks/{task_id}': 4,
+    'DELETE /api/v1/tasks/{task_id}': 4,
+    'GET /api/v1/tasks/template': 3,
+    'POST /api/v1/tasks/template': 4,
+    'PATCH /api/v1/tasks/template/{task_id}': 6,
+    'POST /api/v1/tasks/template/{task_id}/link': 3,
+    'POST /api/v1/tasks/template/{task_id}/unlink': 3,
+    'POST /api/v1/tasks/template/{task_id}/calls/link': 3,
+    'POST /api/v1/tasks/template/{task_id}/calls/unlink': 3,
+    'DELETE /api/v1/tasks/template/{task_id}': 5,
+}
+STREAMING_ROUTES: Set[str] = {'GET /api/v1/calls/stream'}
+WRITE_ROUTES: List[str] = [route for route in QUERY_BUDGETS if not route.startswith('GET ')]
+
+SEED_SIZE: int = 4
+
+Request = Tuple[str, str, Dict[str, Any]]
+
+
+@pytest.fixture
+def ids(client: TestClient) -> Dict[str, List[int]]:
+    tag_ids: List[int] = [client.post('/api/v1/tags', json={'name': f'tag {i}', 'color_id': i}).json()['id'] for i in range(SEED_SIZE)]
+    template_ids: List[int] = [
+        client.post('/api/v1/tasks/template', json={'name': f'template {i}', 'type': 'template', 'tag_ids': tag_ids}).json()['id']
+        for i in range(SEED_SIZE)
+    ]
+    call_ids: List[int] = [client.post('/api/v1/calls', json={'name': f'call {i}', 'tag_ids': tag_ids}).json()['id'] for i in range(SEED_SIZE)]
+    ad_hoc_ids: List[int] = []
+    for call_id in call_ids:
+        for template_id in template_ids[1:]:
+            client.post(f'/api/v1/tasks/template/{template_id}/link', params={'call_id': call_id}).raise_for_status()
+        ad_hoc_ids.append(client.post('/api/v1/tasks', json={'name': f'follow up {call_id}', 'type': 'ad_hoc', 'call_id': call_id, 'status': 'open'}).json()['id'])
+    return {'tag_ids': tag_ids, 'template_ids': template_ids, 'call_ids': call_ids, 'ad_hoc_ids': ad_hoc_ids}
+
+
+def build_request(route: str, ids: Dict[str, List[int]]) -> Request:
+    method, path = route.split(' ')
+    call_id: int = ids['call_ids'][0]
+    tag_id: int = ids['tag_ids'][0]
+    task_id: int = ids['template_ids'][0] if '/template/' in path else ids['ad_hoc_ids'][0]
+    kwargs: Dict[str, Any] = {
+        'GET /api/v1/calls': {'params': {'days': 1}},
+        'POST /api/v1/calls': {'json': {'name': 'new call', 'tag_ids': ids['tag_ids']}},
+        'POST /api/v1/calls/bulk': {'json': [{'name': f'bulk call {i}', 'tag_ids': ids['tag_ids'][:i]} for i in range(SEED_SIZE)]},
+        'GET /api/v1/calls/search': {'params': {'q': 'call'}},
+        'GET /api/v1/calls/tasks': {'params': {'call_ids': ids['call_ids']}},
+        'PATCH /api/v1/calls/{call_id}': {'json': {'name': 'renamed', 'description': 'updated', 'tag_ids': ids['tag_ids'][:2]}},
+        'GET /api/v1/tags/suggested-tasks': {'params': {'tag_ids': ids['tag_ids']}},
+        'POST /api/v1/calls/{call_id}/tasks/link': {'json': {'task_ids': ids['template_ids']}},
+        'POST /api/v1/calls/{call_id}/tasks/unlink': {'json': {'task_ids': ids['template_ids']}},
+        'POST /api/v1/tags': {'json': {'name': 'new tag', 'color_id': 1}},
+        'PATCH /api/v1/tags/{tag_id}': {'json': {'name': 'renamed tag', 'color_id': 2}},
+        'POST /api/v1/tasks': {'json': {'name': 'new ad hoc', 'type': 'ad_hoc', 'call_id': call_id, 'status': 'open'}},
+        'PATCH /api/v1/tasks/{task_id}': {'json': {'name': 'renamed task', 'call_id': call_id, 'status': 'completed'}},
+        'POST /api/v1/tasks/template': {'json': {'name': 'new template', 'type': 'template', 'tag_ids': ids['tag_ids']}},
+        'PATCH /api/v1/tasks/template/{task_id}': {'json': {'name': 'renamed template', 'tag_ids': ids['tag_ids'][:2]}},
+        'POST /api/v1/tasks/template/{task_id}/link': {'params': {'call_id': call_id}},
+        'POST /api/v1/tasks/template/{task_id}/unlink': {'params': {'call_id': ids['call_ids'][1]}},
+        'POST /api/v1/tasks/template/{task_id}/calls/link': {'json': {'call_ids': ids['call_ids']}},
+        'POST /api/v1/tasks/template/{task_id}/calls/unlink': {'json': {'call_ids': ids['call_ids']}},
+    }.get(route, {})
+    return method, path.format(call_id=call_id, tag_id=tag_id, task_id=task_id), kwargs
+
+
+class TestQueryBudgets:
+    def test_every_route_has_a_budget(self, client: TestClient) -> None:
+        routes = {f'{method} {route.path}' for route in client.app.routes if route.path.startswith('/api/') for method in route.methods}
+        assert routes - set(QUERY_BUDGETS) - STREAMING_ROUTES == set()
+
+    @pytest.mark.parametrize('route', list(QUERY_BUDGETS), ids=list(QUERY_BUDGETS))
+    def test_route_stays_within_budget(self, route: str, client: TestClient, ids: Dict[str, List[int]], queries: QueryCounter) -> None:
+        method, path, kwargs = build_request(route, ids)
+        client.get('/api/v1/tags')
+        queries.reset()
+
+        response = client.request(method, path, **kwargs)
+
+        assert response.status_code < 400, response.text
+        assert queries.find_n_plus_one() == [], queries.report()
+        assert queries.count <= QUERY_BUDGETS[route], queries.report()
+
+
+class TestUpdateResponses:
+    def test_call_update_returns_the_persisted_state(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        call_id: int = ids['call_ids'][0]
+        updated = client.patch(f'/api/v1/calls/{call_id}', json={'name': 'renamed', 'description': 'updated', 'tag_ids': ids['tag_ids'][:2]}).json()
+
+        assert [tag['id'] for tag in updated['tags']] == ids['tag_ids'][:2]
+        assert (updated['name'], updated['description']) == ('renamed', 'updated')
+        assert updated == client.get(f'/api/v1/calls/{call_id}').json()
+
+    def test_template_update_returns_the_persisted_state(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        task_id: int = ids['template_ids'][0]
+        updated = client.patch(f'/api/v1/tasks/template/{task_id}', json={'name': 'renamed', 'tag_ids': ids['tag_ids'][1:]}).json()
+
+        assert sorted(tag['id'] for tag in updated['tags']) == ids['tag_ids'][1:]
+        assert updated['name'] == 'renamed'
+        assert updated in client.get('/api/v1/tasks/template').json()
+
+    def test_tag_writes_return_the_persisted_state(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        created = client.post('/api/v1/tags', json={'name': 'flood', 'color_id': 2}).json()
+        assert created == client.get(f'/api/v1/tags/{created["id"]}').json()
+
+        updated = client.patch(f'/api/v1/tags/{created["id"]}', json={'name': 'flash flood', 'color_id': 3}).json()
+        assert (updated['name'], updated['color_id']) == ('flash flood', 3)
+        assert updated['updated_at'] > created['updated_at']
+        assert updated == client.get(f'/api/v1/tags/{created["id"]}').json()
+        assert client.patch('/api/v1/tags/999', json={'name': 'missing'}).status_code == 404
+
+    def test_task_writes_return_the_persisted_state(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        created = client.post('/api/v1/tasks/template', json={'name': 'evacuate', 'type': 'template', 'tag_ids': ids['tag_ids'][:1]}).json()
+        assert created in client.get('/api/v1/tasks/template').json()
+
+        task_id: int = ids['ad_hoc_ids'][0]
+        call_id: int = ids['call_ids'][0]
+        updated = client.patch(f'/api/v1/tasks/{task_id}', json={'call_id': call_id, 'status': 'completed', 'name': 'called back'}).json()
+        assert updated['name'] == 'called back'
+        assert updated | {'call_id': call_id, 'status': 'completed'} in client.get(f'/api/v1/calls/{call_id}/tasks').json()
+
+    def test_deactivated_task_is_unlinked(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        task_id: int = ids['ad_hoc_ids'][0]
+        assert client.delete(f'/api/v1/tasks/{task_id}').status_code == 204
+        assert task_id not in [task['id'] for task in client.get('/api/v1/tasks').json()]
+        assert task_id not in [task['id'] for task in client.get(f'/api/v1/calls/{ids["call_ids"][0]}/tasks').json()]
+
+
+class TransactionCounter:
+    def __init__(self):
+        self.begins: int = 0
+        self.commits: int = 0
+
+    def _begin(self, conn) -> None:
+        self.begins += 1
+
+    def _commit(self, conn) -> None:
+        self.commits += 1
+
+    def __enter__(self) -> 'TransactionCounter':
+        event.listen(Engine, 'begin', self._begin)
+        event.listen(Engine, 'commit', self._commit)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(Engine, 'begin', self._begin)
+        event.remove(Engine, 'commit', self._commit)
+
+
+class TestTransactions:
+    @pytest.mark.parametrize('route', WRITE_ROUTES, ids=WRITE_ROUTES)
+    def test_write_runs_in_one_transaction(self, route: str, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        method, path, kwargs = build_request(route, ids)
+        client.get('/api/v1/tags')
+
+        with TransactionCounter() as transactions:
+            response = client.request(method, path, **kwargs)
+
+        assert response.status_code < 400, response.text
+        assert (transactions.begins, transactions.commits) == (1, 1)
@@ -0,0 +1,72 @@
+import os
+import shutil
+from typing import Dict, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app import app
+from src.core.db import create_session_factory, get_session_factory, run_migrations
+from src.core.replicas import ReplicaSet
+from src.dal.suggestion_index import suggestion_index
+from src.dal.tag_catalog import tag_catalog
+from src.utils.rate_limit import rate_limiter
+
+
+@pytest.fixture
+def paths(temp_dir: str) -> Dict[str, str]:
+    return {name: os.path.join(temp_dir, f'{name}.sqlite3') for name in ('primary', 'replica')}
+
+
+@pytest.fixture
+def client(paths: Dict[str, str]) -> Iterator[TestClient]:
+    engine: Engine = create_engine(f'sqlite:///{paths["primary"]}')
+    with engine.begin() as connection:
+        run_migrations(connection)
+    engine.dispose()
+    shutil.copy(paths['primary'], paths['replica'])
+
+    replicas: ReplicaSet = ReplicaSet([create_async_engine(f'sqlite+aiosqlite:///{paths["replica"]}', poolclass=NullPool)], retry_seconds=60)
+    session_factory = create_session_factory(create_async_engine(f'sqlite+aiosqlite:///{paths["primary"]}', poolclass=NullPool), replicas)
+
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    app.dependency_overrides[rate_limiter] = lambda: None
+    tag_catalog.invalidate()
+    suggestion_index.invalidate()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    tag_catalog.invalidate()
+    suggestion_index.invalidate()
+
+
+@pytest.fixture
+def ids(client: TestClient, paths: Dict[str, str]) -> Dict[str, int]:
+    tag_id: int = client.post('/api/v1/tags', json={'name': 'replicated tag'}).json()['id']
+    client.post('/api/v1/tasks/template', json={'name': 'replicated template', 'type': 'template', 'tag_ids': [tag_id]}).raise_for_status()
+    replicated_call_id: int = client.post('/api/v1/calls', json={'name': 'replicated call', 'tag_ids': [tag_id]}).json()['id']
+    shutil.copy(paths['primary'], paths['replica'])
+
+    client.post('/api/v1/tags', json={'name': 'lagging tag'}).raise_for_status()
+    lagging_call_id: int = client.post('/api/v1/calls', json={'name': 'lagging call'}).json()['id']
+    tag_catalog.invalidate()
+    suggestion_index.invalidate()
+    return {'tag_id': tag_id, 'replicated_call_id': replicated_call_id, 'lagging_call_id': lagging_call_id}
+
+
+class TestReadReplicas:
+    def test_get_routes_read_from_the_replica(self, client: TestClient, ids: Dict[str, int]) -> None:
+        assert [tag['name'] for tag in client.get('/api/v1/tags').json()] == ['replicated tag']
+        assert [task['name'] for task in client.get('/api/v1/tasks/template').json()] == ['replicated template']
+        assert [call['name'] for call in client.get('/api/v1/calls').json()['items']] == ['replicated call']
+        assert client.get(f'/api/v1/calls/{ids["replicated_call_id"]}').status_code == 200
+        assert client.get(f'/api/v1/calls/{ids["lagging_call_id"]}').status_code == 404
+
+    def test_writes_go_to_the_primary(self, client: TestClient, ids: Dict[str, int]) -> None:
+        updated = client.patch(f'/api/v1/calls/{ids["lagging_call_id"]}', json={'name': 'renamed', 'tag_ids': [ids['tag_id']]})
+
+        assert updated.status_code == 200
+        assert updated.json()['name'] == 'renamed'
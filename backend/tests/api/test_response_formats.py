@@ -0,0 +1,100 @@
+import gzip
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+import brotli
+import msgpack
+import pytest
+from fastapi.testclient import TestClient
+
+CALL_COUNT: int = 20
+
+
+@pytest.fixture
+def tag_ids(client: TestClient) -> List[int]:
+    tag_ids: List[int] = [client.post('/api/v1/tags', json={'name': f'tag {i}', 'color_id': i}).json()['id'] for i in range(3)]
+    for i in range(CALL_COUNT):
+        client.post('/api/v1/calls', json={'name': f'call {i}', 'tag_ids': tag_ids[: i % 3 + 1]}).raise_for_status()
+    client.post('/api/v1/tasks/template', json={'name': 'evacuate', 'type': 'template', 'tag_ids': tag_ids[:2]}).raise_for_status()
+    client.post('/api/v1/tasks/template', json={'name': 'notify', 'type': 'template', 'tag_ids': tag_ids[1:]}).raise_for_status()
+    return tag_ids
+
+
+def raw_body(client: TestClient, path: str, headers: Dict[str, str]) -> Tuple[Dict[str, str], bytes]:
+    with client.stream('GET', path, headers=headers) as response:
+        return dict(response.headers), b''.join(response.iter_raw())
+
+
+class TestCompression:
+    @pytest.mark.parametrize(
+        ('accept_encoding', 'encoding', 'decompress'),
+        [
+            ('gzip, deflate, br', 'br', brotli.decompress),
+            ('gzip', 'gzip', gzip.decompress),
+            ('br;q=0.5, gzip', 'gzip', gzip.decompress),
+            ('*', 'br', brotli.decompress),
+        ],
+        ids=['brotli_preferred', 'gzip_only', 'gzip_preferred', 'wildcard'],
+    )
+    def test_compresses_large_responses(self, client: TestClient, tag_ids: List[int], accept_encoding: str, encoding: str, decompress: Any) -> None:
+        headers, body = raw_body(client, '/api/v1/calls', {'Accept-Encoding': accept_encoding})
+
+        assert headers['content-encoding'] == encoding
+        assert 'Accept-Encoding' in headers['vary']
+        assert decompress(body) == raw_body(client, '/api/v1/calls', {'Accept-Encoding': 'identity'})[1]
+
+    def test_skips_small_responses(self, client: TestClient, tag_ids: List[int]) -> None:
+        headers, body = raw_body(client, f'/api/v1/tags/{tag_ids[0]}', {'Accept-Encoding': 'br, gzip'})
+        assert 'content-encoding' not in headers
+        assert body.startswith(b'{')
+
+
+class TestMsgPack:
+    @pytest.mark.parametrize('path', ['/api/v1/calls', '/api/v1/calls/search?q=call', '/api/v1/tags', '/api/v1/tasks/template'], ids=['calls', 'search', 'tags', 'template_tasks'])
+    def test_matches_json(self, client: TestClient, tag_ids: List[int], path: str) -> None:
+        json_response = client.get(path, headers={'Accept': 'application/json'})
+        msgpack_response = client.get(path, headers={'Accept': 'application/msgpack'})
+
+        assert json_response.headers['content-type'] == 'application/json'
+        assert msgpack_response.headers['content-type'] == 'application/msgpack'
+        assert 'Accept' in msgpack_response.headers['vary']
+        assert with_iso_timestamps(msgpack.unpackb(msgpack_response.content, timestamp=3)) == json_response.json()
+        assert len(msgpack_response.content) < len(json_response.content)
+        assert msgpack_response.headers.get('etag') != json_response.headers.get('etag') or 'etag' not in json_response.headers
+
+
+class TestNormalizedLayout:
+    @pytest.mark.parametrize(
+        ('path', 'items'),
+        [('/api/v1/calls', lambda body: body['items']), ('/api/v1/tasks/template', lambda body: body)],
+        ids=['calls', 'template_tasks'],
+    )
+    def test_references_each_tag_once(self, client: TestClient, tag_ids: List[int], path: str, items: Any) -> None:
+        nested: List[Dict[str, Any]] = items(client.get(path).json())
+        normalized: Dict[str, Any] = client.get(path, params={'layout': 'normalized'}).json()
+
+        assert sorted(tag['id'] for tag in normalized['tags']) == sorted({tag['id'] for item in nested for tag in item['tags']})
+        tags_by_id: Dict[int, Dict[str, Any]] = {tag['id']: tag for tag in normalized['tags']}
+        assert [
+            {key: value for key, value in item.items() if key != 'tag_ids'} | {'tags': [tags_by_id[tag_id] for tag_id in item['tag_ids']]}
+            for item in normalized['items']
+        ] == nested
+
+    def test_is_smaller_in_every_format(self, client: TestClient, tag_ids: List[int]) -> None:
+        for accept in ['application/json', 'application/msgpack']:
+            nested: bytes = client.get('/api/v1/calls', headers={'Accept': accept}).content
+            normalized: bytes = client.get('/api/v1/calls', params={'layout': 'normalized'}, headers={'Accept': accept}).content
+            assert len(normalized) < len(nested)
+
+    def test_rejects_unknown_layout(self, client: TestClient, tag_ids: List[int]) -> None:
+        assert client.get('/api/v1/calls', params={'layout': 'flat'}).status_code == 422
+
+
+def with_iso_timestamps(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: with_iso_timestamps(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [with_iso_timestamps(item) for item in value]
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None).isoformat()
+    return value
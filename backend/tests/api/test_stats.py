@@ -0,0 +1,91 @@
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from src.core.rollups import rebuild_rollups
+
+STATS_PATH: str = '/api/v1/stats'
+
+
+@pytest.fixture
+def ids(client: TestClient) -> Dict[str, List[int]]:
+    tag_ids: List[int] = [client.post('/api/v1/tags', json={'name': f'tag {i}'}).json()['id'] for i in range(3)]
+    template_id: int = client.post('/api/v1/tasks/template', json={'name': 'template', 'type': 'template'}).json()['id']
+    call_ids: List[int] = [
+        client.post('/api/v1/calls', json={'name': 'call 0', 'tag_ids': tag_ids}).json()['id'],
+        client.post('/api/v1/calls', json={'name': 'call 1', 'tag_ids': tag_ids[:1]}).json()['id'],
+    ]
+    return {'tag_ids': tag_ids, 'template_ids': [template_id], 'call_ids': call_ids}
+
+
+def get_stats(client: TestClient, **params: Any) -> Dict[str, Any]:
+    response = client.get(STATS_PATH, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def tag_calls(client: TestClient) -> Dict[int, int]:
+    return {row['tag_id']: row['call_count'] for row in get_stats(client)['tag_calls']}
+
+
+def task_statuses(client: TestClient) -> Dict[str, int]:
+    return {row['status']: row['task_count'] for row in get_stats(client)['task_statuses']}
+
+
+class TestStats:
+    def test_counts_calls_per_tag(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        tag_ids: List[int] = ids['tag_ids']
+        assert tag_calls(client) == {tag_ids[0]: 2, tag_ids[1]: 1, tag_ids[2]: 1}
+
+        client.patch(f'/api/v1/calls/{ids["call_ids"][0]}', json={'name': 'call 0', 'tag_ids': tag_ids[1:]}).raise_for_status()
+        client.post('/api/v1/calls/bulk', json=[{'name': 'bulk', 'tag_ids': tag_ids[2:]}]).raise_for_status()
+
+        assert tag_calls(client) == {tag_ids[0]: 1, tag_ids[1]: 1, tag_ids[2]: 2}
+
+    def test_counts_task_statuses(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        call_id, other_call_id = ids['call_ids']
+        template_id: int = ids['template_ids'][0]
+        task_id: int = client.post('/api/v1/tasks', json={'name': 'ad hoc', 'type': 'ad_hoc', 'call_id': call_id, 'status': 'open'}).json()['id']
+        for linked_call_id in ids['call_ids']:
+            client.post(f'/api/v1/tasks/template/{template_id}/link', params={'call_id': linked_call_id}).raise_for_status()
+        assert task_statuses(client) == {'open': 3}
+
+        client.patch(f'/api/v1/tasks/{task_id}', json={'call_id': call_id, 'status': 'completed'}).raise_for_status()
+        client.post(f'/api/v1/tasks/template/{template_id}/unlink', params={'call_id': other_call_id}).raise_for_status()
+        assert task_statuses(client) == {'open': 1, 'completed': 1}
+
+        assert client.delete(f'/api/v1/tasks/template/{template_id}').status_code == 204
+        assert task_statuses(client) == {'completed': 1}
+
+    def test_rollups_match_a_rebuild(self, client: TestClient, ids: Dict[str, List[int]], temp_dir: str) -> None:
+        call_id: int = ids['call_ids'][1]
+        client.post('/api/v1/tasks', json={'name': 'ad hoc', 'type': 'ad_hoc', 'call_id': call_id, 'status': 'in_progress'}).raise_for_status()
+        client.patch(f'/api/v1/calls/{call_id}', json={'name': 'call 1', 'tag_ids': ids['tag_ids'][1:]}).raise_for_status()
+        maintained: Dict[str, Any] = get_stats(client)
+
+        engine: Engine = create_engine(f'sqlite:///{os.path.join(temp_dir, "api.sqlite3")}')
+        with engine.begin() as connection:
+            rebuild_rollups(connection)
+        engine.dispose()
+
+        assert get_stats(client) == maintained
+
+    def test_filters_by_range_and_tag(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        today: date = datetime.now(timezone.utc).date()
+        stats: Dict[str, Any] = get_stats(client, start=(today - timedelta(days=1)).isoformat(), end=(today + timedelta(days=1)).isoformat(), tag_ids=ids['tag_ids'][1:])
+        assert {row['tag_id'] for row in stats['tag_calls']} == set(ids['tag_ids'][1:])
+
+        stats = get_stats(client, start=(today + timedelta(days=1)).isoformat(), end=(today + timedelta(days=2)).isoformat())
+        assert (stats['tag_calls'], stats['task_statuses']) == ([], [])
+
+    @pytest.mark.parametrize('params', [
+        {'start': '2025-02-01', 'end': '2025-01-01'},
+        {'start': '2024-01-01', 'end': '2025-01-01'},
+    ], ids=['start_after_end', 'range_too_long'])
+    def test_rejects_invalid_ranges(self, params: Dict[str, str], client: TestClient) -> None:
+        assert client.get(STATS_PATH, params=params).status_code == 400
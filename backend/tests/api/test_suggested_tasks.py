@@ -0,0 +1,83 @@
+from typing import Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.utils.query_counter import QueryCounter
+
+
+@pytest.fixture
+def ids(client: TestClient) -> Dict[str, List[int]]:
+    tag_ids: List[int] = [client.post('/api/v1/tags', json={'name': name}).json()['id'] for name in ('fire', 'flood', 'storm')]
+    template_ids: List[int] = [
+        client.post('/api/v1/tasks/template', json={'name': name, 'type': 'template', 'tag_ids': [tag_ids[i] for i in tag_indexes]}).json()['id']
+        for name, tag_indexes in (('evacuate', [0, 1, 2]), ('sandbags', [1]), ('shelter', [1, 2]), ('untagged', []))
+    ]
+    call_id: int = client.post('/api/v1/calls', json={'name': 'river overflow', 'tag_ids': tag_ids[1:]}).json()['id']
+    return {'tag_ids': tag_ids, 'template_ids': template_ids, 'call_ids': [call_id]}
+
+
+def suggested(client: TestClient, path: str, **params) -> List[List[int]]:
+    response = client.get(path, params=params)
+    assert response.status_code == 200, response.text
+    return [[task['id'], task['matched_tag_ids']] for task in response.json()]
+
+
+class TestCallSuggestedTasks:
+    def test_ranks_by_tag_overlap(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        evacuate, sandbags, shelter, _ = ids['template_ids']
+        _, flood, storm = ids['tag_ids']
+
+        assert suggested(client, f'/api/v1/calls/{ids["call_ids"][0]}/suggested-tasks') == [
+            [evacuate, [flood, storm]], [shelter, [flood, storm]], [sandbags, [flood]],
+        ]
+
+    def test_excludes_linked_tasks(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        call_id: int = ids['call_ids'][0]
+        client.post(f'/api/v1/tasks/template/{ids["template_ids"][0]}/link', params={'call_id': call_id}).raise_for_status()
+
+        assert [task_id for task_id, _ in suggested(client, f'/api/v1/calls/{call_id}/suggested-tasks')] == [ids['template_ids'][2], ids['template_ids'][1]]
+
+    def test_ignores_inactive_tags(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        client.delete(f'/api/v1/tags/{ids["tag_ids"][2]}').raise_for_status()
+        assert [task_id for task_id, _ in suggested(client, f'/api/v1/calls/{ids["call_ids"][0]}/suggested-tasks')] == ids['template_ids'][:3]
+
+    def test_missing_call(self, client: TestClient) -> None:
+        assert client.get('/api/v1/calls/999/suggested-tasks').status_code == 404
+
+
+class TestTagsSuggestedTasks:
+    def test_ranks_by_tag_overlap(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        fire, flood, _ = ids['tag_ids']
+        evacuate, sandbags, shelter, _ = ids['template_ids']
+
+        assert suggested(client, '/api/v1/tags/suggested-tasks', tag_ids=[fire, flood]) == [
+            [evacuate, [fire, flood]], [sandbags, [flood]], [shelter, [flood]],
+        ]
+
+    @pytest.mark.parametrize('tag_count, expected_status', [
+        (0, 422),
+        (101, 400),
+    ], ids=['missing', 'too_many'])
+    def test_rejects_invalid_tag_ids(self, client: TestClient, tag_count: int, expected_status: int) -> None:
+        assert client.get('/api/v1/tags/suggested-tasks', params={'tag_ids': list(range(1, tag_count + 1))}).status_code == expected_status
+
+    def test_conditional_get(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        response = client.get('/api/v1/tags/suggested-tasks', params={'tag_ids': ids['tag_ids']})
+        cached = client.get('/api/v1/tags/suggested-tasks', params={'tag_ids': ids['tag_ids']}, headers={'If-None-Match': response.headers['ETag']})
+        assert cached.status_code == 304
+
+    def test_template_changes_update_the_index_in_place(self, client: TestClient, ids: Dict[str, List[int]], queries: QueryCounter) -> None:
+        fire, flood, storm = ids['tag_ids']
+        evacuate, sandbags, shelter, _ = ids['template_ids']
+        suggested(client, '/api/v1/tags/suggested-tasks', tag_ids=[fire])
+
+        created: int = client.post('/api/v1/tasks/template', json={'name': 'pumps', 'type': 'template', 'tag_ids': [fire, flood]}).json()['id']
+        client.patch(f'/api/v1/tasks/template/{sandbags}', json={'tag_ids': [storm]}).raise_for_status()
+        client.delete(f'/api/v1/tasks/template/{shelter}').raise_for_status()
+        queries.reset()
+
+        assert suggested(client, '/api/v1/tags/suggested-tasks', tag_ids=[fire, flood, storm]) == [
+            [evacuate, [fire, flood, storm]], [created, [fire, flood]], [sandbags, [storm]],
+        ]
+        assert queries.count == 2, queries.report()
@@ -0,0 +1,105 @@
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.constants.limits import MAX_BULK_LINK_IDS
+
+
+@pytest.fixture
+def ids(client: TestClient) -> Dict[str, List[int]]:
+    tag_ids: List[int] = [client.post('/api/v1/tags', json={'name': name}).json()['id'] for name in ('fire', 'flood')]
+    template_ids: List[int] = [
+        client.post('/api/v1/tasks/template', json={'name': f'template {i}', 'type': 'template', 'tag_ids': tag_ids[i:i + 1]}).json()['id']
+        for i in range(3)
+    ]
+    call_ids: List[int] = [client.post('/api/v1/calls', json={'name': f'call {i}', 'tag_ids': tag_ids}).json()['id'] for i in range(3)]
+    ad_hoc_id: int = client.post('/api/v1/tasks', json={'name': 'ad hoc', 'type': 'ad_hoc', 'call_id': call_ids[0], 'status': 'open'}).json()['id']
+    return {'tag_ids': tag_ids, 'template_ids': template_ids, 'call_ids': call_ids, 'ad_hoc_ids': [ad_hoc_id]}
+
+
+def links(response: Any) -> List[List[int]]:
+    assert response.status_code == 200, response.text
+    return [[link['call_id'], link['task_id']] for link in response.json()['links']]
+
+
+def linked_task_ids(client: TestClient, call_id: int) -> List[int]:
+    return [task['id'] for task in client.get(f'/api/v1/calls/{call_id}/tasks').json()]
+
+
+def open_tasks(client: TestClient) -> int:
+    return sum(row['task_count'] for row in client.get('/api/v1/stats').json()['task_statuses'] if row['status'] == 'open')
+
+
+class TestCallTaskLinks:
+    def test_links_many_tasks_and_skips_existing_links(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        call_id: int = ids['call_ids'][0]
+        first, second, third = ids['template_ids']
+        client.post(f'/api/v1/tasks/template/{first}/link', params={'call_id': call_id}).raise_for_status()
+
+        response = client.post(f'/api/v1/calls/{call_id}/tasks/link', json={'task_ids': [third, first, second, 999, *ids['ad_hoc_ids']]})
+
+        assert links(response) == [[call_id, second], [call_id, third]]
+        assert sorted(linked_task_ids(client, call_id)) == sorted([*ids['ad_hoc_ids'], first, second, third])
+        assert open_tasks(client) == 4
+
+    def test_unlinks_only_template_tasks(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        call_id: int = ids['call_ids'][0]
+        client.post(f'/api/v1/calls/{call_id}/tasks/link', json={'task_ids': ids['template_ids']}).raise_for_status()
+
+        response = client.post(f'/api/v1/calls/{call_id}/tasks/unlink', json={'task_ids': [*ids['template_ids'][:2], *ids['ad_hoc_ids']]})
+
+        assert links(response) == [[call_id, task_id] for task_id in ids['template_ids'][:2]]
+        assert sorted(linked_task_ids(client, call_id)) == sorted([*ids['ad_hoc_ids'], ids['template_ids'][2]])
+        assert open_tasks(client) == 2
+
+    def test_applies_suggested_tasks(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        call_id: int = ids['call_ids'][0]
+        client.post(f'/api/v1/tasks/template/{ids["template_ids"][0]}/link', params={'call_id': call_id}).raise_for_status()
+
+        response = client.post(f'/api/v1/calls/{call_id}/suggested-tasks/apply')
+
+        assert links(response) == [[call_id, ids['template_ids'][1]]]
+        assert client.get(f'/api/v1/calls/{call_id}/suggested-tasks').json() == []
+        assert links(client.post(f'/api/v1/calls/{call_id}/suggested-tasks/apply')) == []
+
+    @pytest.mark.parametrize('path', ['tasks/link', 'tasks/unlink', 'suggested-tasks/apply'], ids=['link', 'unlink', 'apply'])
+    def test_missing_call(self, client: TestClient, path: str) -> None:
+        assert client.post(f'/api/v1/calls/999/{path}', json={'task_ids': [1]}).status_code == 404
+
+    def test_rejects_too_many_ids(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        response = client.post(f'/api/v1/calls/{ids["call_ids"][0]}/tasks/link', json={'task_ids': list(range(MAX_BULK_LINK_IDS + 1))})
+        assert response.status_code == 413
+
+
+class TestTemplateTaskCallLinks:
+    def test_links_and_unlinks_many_calls(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        task_id: int = ids['template_ids'][0]
+        first, second, third = ids['call_ids']
+
+        assert links(client.post(f'/api/v1/tasks/template/{task_id}/calls/link', json={'call_ids': [third, first, 999]})) == [[first, task_id], [third, task_id]]
+        assert links(client.post(f'/api/v1/tasks/template/{task_id}/calls/link', json={'call_ids': [first, second]})) == [[second, task_id]]
+        assert open_tasks(client) == 4
+
+        assert links(client.post(f'/api/v1/tasks/template/{task_id}/calls/unlink', json={'call_ids': [first, third]})) == [[first, task_id], [third, task_id]]
+        assert [task_id in linked_task_ids(client, call_id) for call_id in ids['call_ids']] == [False, True, False]
+        assert open_tasks(client) == 2
+
+    @pytest.mark.parametrize('task_key, expected_status', [
+        ('missing', 404),
+        ('ad_hoc_ids', 400),
+    ], ids=['missing_task', 'ad_hoc_task'])
+    def test_rejects_non_template_tasks(self, client: TestClient, ids: Dict[str, List[int]], task_key: str, expected_status: int) -> None:
+        task_id: int = ids[task_key][0] if task_key in ids else 999
+        assert client.post(f'/api/v1/tasks/template/{task_id}/calls/link', json={'call_ids': ids['call_ids']}).status_code == expected_status
+
+    def test_single_link_is_idempotent(self, client: TestClient, ids: Dict[str, List[int]]) -> None:
+        task_id, call_id = ids['template_ids'][0], ids['call_ids'][0]
+        client.post(f'/api/v1/tasks/template/{task_id}/link', params={'call_id': call_id}).raise_for_status()
+
+        response = client.post(f'/api/v1/tasks/template/{task_id}/link', params={'call_id': call_id})
+
+        assert response.status_code == 200
+        assert response.json()['status'] == 'open'
+        assert open_tasks(client) == 2
+        assert client.post(f'/api/v1/tasks/template/{task_id}/link', params={'call_id': 999}).status_code == 404
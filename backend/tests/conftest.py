@@ -0,0 +1,18 @@
+import os
+from typing import Iterator
+
+import pytest
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+
+@pytest.fixture(scope='session', autouse=True)
+def flush_logs() -> Iterator[None]:
+    yield
+    from src.utils.logger import logger
+    logger.flush()
+
+
+@pytest.fixture
+def temp_dir(tmp_path) -> str:
+    return str(tmp_path)
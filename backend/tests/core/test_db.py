@@ -0,0 +1,183 @@
+import asyncio
+import os
+from typing import Iterator, Set, Tuple
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.constants.db import ALEMBIC_CONFIG_PATH, MIGRATIONS_BASELINE_REVISION, MIGRATIONS_HEAD_REVISION
+from src.core.config import Settings
+from src.core.db import (
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    create_instrumented_async_engine,
+    driver_url,
+    engine_options,
+    include_in_autogenerate,
+    init_db,
+    run_migrations,
+    warm_pool,
+)
+from src.models import call, catalog_version, rollups, tag, task  # noqa: F401
+from src.models.base import Base
+from src.utils.metrics import metrics
+from src.utils.query_counter import QueryCounter
+
+
+@pytest.fixture
+def connection(temp_dir: str) -> Iterator[Connection]:
+    engine: Engine = create_engine(f'sqlite:///{os.path.join(temp_dir, "migrations.sqlite3")}')
+    with engine.begin() as connection:
+        yield connection
+    engine.dispose()
+
+
+def alembic_config(connection: Connection) -> Config:
+    config: Config = Config(ALEMBIC_CONFIG_PATH)
+    config.attributes['connection'] = connection
+    config.attributes['configure_logger'] = False
+    return config
+
+
+def current_revision(connection: Connection) -> str | None:
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+def index_names(connection: Connection) -> Set[str]:
+    inspector = inspect(connection)
+    return {index['name'] for table in inspector.get_table_names() for index in inspector.get_indexes(table)}
+
+
+class TestRunMigrations:
+    def test_upgrades_empty_database_to_head(self, connection: Connection) -> None:
+        run_migrations(connection)
+        assert current_revision(connection) == ScriptDirectory.from_config(alembic_config(connection)).get_current_head()
+        assert compare_metadata(MigrationContext.configure(connection, opts={'include_name': include_in_autogenerate}), Base.metadata) == []
+
+    def test_stamps_schema_created_without_migrations(self, connection: Connection) -> None:
+        command.upgrade(alembic_config(connection), MIGRATIONS_BASELINE_REVISION)
+        connection.exec_driver_sql('DROP TABLE alembic_version')
+
+        run_migrations(connection)
+        assert {'ix_calls_created_at_id', 'ix_calls_tags_tag_id', 'ix_tasks_tags_tag_id', 'ix_calls_tasks_task_id'} <= index_names(connection)
+
+    def test_downgrades_to_empty_database(self, connection: Connection) -> None:
+        run_migrations(connection)
+        command.downgrade(alembic_config(connection), 'base')
+        assert inspect(connection).get_table_names() == ['alembic_version']
+
+
+class TestInitDb:
+    def test_head_revision_matches_the_migration_scripts(self) -> None:
+        assert MIGRATIONS_HEAD_REVISION == ScriptDirectory.from_config(Config(ALEMBIC_CONFIG_PATH)).get_current_head()
+
+    @pytest.mark.parametrize('mode, migrated_before, expected_migrated, expected_revision', [
+        ('auto', False, True, MIGRATIONS_HEAD_REVISION),
+        ('auto', True, False, MIGRATIONS_HEAD_REVISION),
+        ('always', True, True, MIGRATIONS_HEAD_REVISION),
+        ('never', False, False, None),
+    ], ids=['auto_empty', 'auto_current', 'always', 'never'])
+    def test_startup_modes(
+        self, temp_dir: str, mode: str, migrated_before: bool, expected_migrated: bool, expected_revision: str | None
+    ) -> None:
+        path: str = os.path.join(temp_dir, 'startup.sqlite3')
+        engine: Engine = create_engine(f'sqlite:///{path}')
+        if migrated_before:
+            with engine.begin() as connection:
+                run_migrations(connection)
+        async_engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{path}', poolclass=NullPool)
+
+        async def run() -> bool:
+            try:
+                return await init_db(async_engine, mode)
+            finally:
+                await async_engine.dispose()
+
+        with QueryCounter() as queries:
+            migrated: bool = asyncio.run(run())
+
+        with engine.connect() as connection:
+            assert (migrated, current_revision(connection)) == (expected_migrated, expected_revision)
+        engine.dispose()
+        if migrated_before and not expected_migrated:
+            assert queries.count == 1
+
+
+def pool_settings(**overrides) -> Settings:
+    return Settings(database_url='sqlite://', **overrides)
+
+
+class TestEngineOptions:
+    @pytest.mark.parametrize('url, is_async, expected', [
+        ('sqlite://', True, 'sqlite+aiosqlite://'),
+        ('sqlite+aiosqlite:///app.sqlite3', False, 'sqlite+pysqlite:///app.sqlite3'),
+        ('sqlite+aiosqlite:///app.sqlite3', True, 'sqlite+aiosqlite:///app.sqlite3'),
+        ('postgresql://user:secret@db/app', True, 'postgresql+psycopg://user:secret@db/app'),
+        ('postgresql+psycopg://user:secret@db/app', False, 'postgresql+psycopg://user:secret@db/app'),
+        ('postgresql+asyncpg://db/app', False, 'postgresql+psycopg://db/app'),
+    ], ids=['sqlite_to_async', 'aiosqlite_to_sync', 'aiosqlite_kept', 'postgres_to_async', 'psycopg_kept', 'asyncpg_to_sync'])
+    def test_driver_url_matches_the_engine_kind(self, url: str, is_async: bool, expected: str) -> None:
+        assert driver_url(url, is_async) == expected
+
+    def test_applies_pool_settings(self) -> None:
+        options = engine_options('sqlite+aiosqlite:///app.sqlite3', is_async=True, config=pool_settings(
+            database_pool_size=20, database_max_overflow=0, database_pool_timeout_seconds=2.5,
+            database_pool_recycle_seconds=300, database_pool_pre_ping=False, database_pool_use_lifo=True,
+        ))
+
+        assert options['poolclass'] is TimedAsyncAdaptedQueuePool
+        assert (options['pool_size'], options['max_overflow'], options['pool_timeout']) == (20, 0, 2.5)
+        assert (options['pool_recycle'], options['pool_pre_ping'], options['pool_use_lifo']) == (300, False, True)
+        assert options['connect_args'] == {}
+
+    def test_in_memory_sqlite_keeps_the_default_pool(self) -> None:
+        options = engine_options('sqlite://', is_async=False, config=pool_settings())
+        assert options['poolclass'] is None
+        assert 'pool_size' not in options
+        assert options['pool_recycle'] == -1
+
+    @pytest.mark.parametrize('url, overrides, expected', [
+        ('postgresql+psycopg://db/app', {}, {'sslmode': 'require', 'prepare_threshold': 5}),
+        ('postgresql+psycopg://db/app', {'database_prepare_threshold': None, 'database_sslmode': 'disable'}, {'sslmode': 'disable', 'prepare_threshold': None}),
+        ('postgresql+psycopg://db/app', {'database_statement_timeout_ms': 1500}, {'sslmode': 'require', 'prepare_threshold': 5, 'options': '-c statement_timeout=1500'}),
+        ('postgresql+psycopg2://db/app', {}, {'sslmode': 'require'}),
+    ], ids=['defaults', 'prepared_statements_disabled', 'statement_timeout', 'psycopg2'])
+    def test_postgres_connect_args(self, url: str, overrides: dict, expected: dict) -> None:
+        assert engine_options(url, is_async=False, config=pool_settings(**overrides))['connect_args'] == expected
+
+    def test_counts_checkout_timeouts(self, temp_dir: str) -> None:
+        options = engine_options(f'sqlite:///{os.path.join(temp_dir, "pool.sqlite3")}', is_async=False, config=pool_settings(
+            database_pool_size=1, database_max_overflow=0, database_pool_timeout_seconds=0.01,
+        ))
+        engine: Engine = create_engine(f'sqlite:///{os.path.join(temp_dir, "pool.sqlite3")}', **options)
+        assert isinstance(engine.pool, TimedQueuePool)
+        timeouts: float = metrics.db_pool_timeouts_total.value()
+
+        with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+        engine.dispose()
+
+        assert metrics.db_pool_timeouts_total.value() == timeouts + 1
+
+    def test_warms_every_pooled_connection(self, temp_dir: str) -> None:
+        engine: AsyncEngine = create_instrumented_async_engine(
+            f'sqlite+aiosqlite:///{os.path.join(temp_dir, "warm.sqlite3")}', pool_settings(database_pool_size=3)
+        )
+
+        async def run() -> Tuple[int, int, int]:
+            warmed: int = await warm_pool(engine)
+            counts: Tuple[int, int, int] = (warmed, engine.pool.checkedin(), engine.pool.checkedout())
+            await engine.dispose()
+            return counts
+
+        assert asyncio.run(run()) == (3, 3, 0)
@@ -0,0 +1,143 @@
+import asyncio
+import os
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.constants.events import EVENT_NOTIFY_PAYLOAD_LIMIT, CallEventType
+from src.core.events import EventHub, Subscription, _notify_payloads, call_event, call_events, stage_events
+from src.utils.sse import format_event, stream_events
+
+
+def drain(subscription: Subscription) -> List[Dict[str, Any] | None]:
+    events: List[Dict[str, Any] | None] = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+async def collect(hub: EventHub, subscription: Subscription) -> List[bytes]:
+    return [chunk async for chunk in stream_events(hub, subscription, keepalive_seconds=5, reconnect_ms=1000)]
+
+
+class TestEventHub:
+    def test_fans_out_to_every_subscriber(self) -> None:
+        hub: EventHub = EventHub(queue_size=4)
+        subscriptions: List[Subscription] = [hub.subscribe(), hub.subscribe()]
+        events: List[Dict[str, Any]] = [call_event(CallEventType.CALL_CREATED, 1, tag_ids=[]), call_event(CallEventType.CALL_UPDATED, 1)]
+
+        hub.publish(events)
+
+        assert [drain(subscription) for subscription in subscriptions] == [events, events]
+
+    def test_drops_slow_subscribers(self) -> None:
+        hub: EventHub = EventHub(queue_size=2)
+        slow: Subscription = hub.subscribe()
+        hub.publish([call_event(CallEventType.CALL_UPDATED, 1)])
+        fast: Subscription = hub.subscribe()
+
+        hub.publish([call_event(CallEventType.CALL_UPDATED, 2), call_event(CallEventType.CALL_UPDATED, 3)])
+
+        assert (slow.dropped, drain(slow)) == (True, [None])
+        assert [event['call_id'] for event in drain(fast)] == [2, 3]
+        assert len(hub) == 1
+
+    def test_stream_reports_overflow_and_ends(self) -> None:
+        hub: EventHub = EventHub(queue_size=1)
+        subscription: Subscription = hub.subscribe()
+        hub.publish([call_event(CallEventType.CALL_UPDATED, 1), call_event(CallEventType.CALL_UPDATED, 2)])
+
+        assert asyncio.run(collect(hub, subscription)) == [b'retry: 1000\n\n', format_event({'type': 'stream.overflow'})]
+
+    def test_close_ends_streams(self) -> None:
+        hub: EventHub = EventHub()
+        subscription: Subscription = hub.subscribe()
+        hub.publish([call_event(CallEventType.CALL_UPDATED, 1)])
+        hub.close()
+
+        assert asyncio.run(collect(hub, subscription)) == [b'retry: 1000\n\n']
+        assert len(hub) == 0
+
+    def test_format_event(self) -> None:
+        assert format_event(call_event(CallEventType.TASK_LINKED, 3, task_id=4, status='open')) == (
+            b'event: task.linked\ndata: {"type":"task.linked","call_id":3,"task_id":4,"status":"open"}\n\n'
+        )
+
+
+class TestNotifyPayloads:
+    @pytest.mark.parametrize('count, expected_payloads', [
+        (1, 1),
+        (100, 1),
+        (1000, 7),
+    ], ids=['single', 'fits', 'split'])
+    def test_chunks_under_the_notify_limit(self, count: int, expected_payloads: int) -> None:
+        events: List[Dict[str, Any]] = [call_event(CallEventType.TASK_UNLINKED, i, task_id=i) for i in range(count)]
+        payloads: List[str] = _notify_payloads(events)
+
+        assert len(payloads) == expected_payloads
+        assert all(len(payload.encode()) <= EVENT_NOTIFY_PAYLOAD_LIMIT for payload in payloads)
+        assert [event for payload in payloads for event in orjson.loads(payload)] == events
+
+
+class TestStagedEvents:
+    @pytest.mark.parametrize('commit, expected', [
+        (True, [1]),
+        (False, []),
+    ], ids=['commit', 'rollback'])
+    def test_publishes_only_after_commit(self, temp_dir: str, commit: bool, expected: List[int]) -> None:
+        factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            create_async_engine(f'sqlite+aiosqlite:///{os.path.join(temp_dir, "events.sqlite3")}', poolclass=NullPool)
+        )
+        subscription: Subscription = call_events.subscribe()
+
+        async def run() -> List[Dict[str, Any] | None]:
+            async with factory() as db:
+                await db.execute(select(1))
+                stage_events(db, call_event(CallEventType.CALL_UPDATED, 1))
+                assert drain(subscription) == []
+                await (db.commit() if commit else db.rollback())
+                await db.commit()
+            return drain(subscription)
+
+        try:
+            assert [event['call_id'] for event in asyncio.run(run())] == expected
+        finally:
+            call_events.unsubscribe(subscription)
+
+    @pytest.mark.parametrize('commit, expected', [
+        (True, [[1]]),
+        (False, []),
+    ], ids=['commit', 'rollback'])
+    def test_relay_notifies_inside_the_transaction(self, temp_dir: str, commit: bool, expected: List[List[int]]) -> None:
+        factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            create_async_engine(f'sqlite+aiosqlite:///{os.path.join(temp_dir, "events.sqlite3")}', poolclass=NullPool)
+        )
+        notified: List[List[int]] = []
+
+        class RecordingRelay:
+            def notify(self, session: Session, events: List[Dict[str, Any]]) -> None:
+                assert session.in_transaction()
+                notified.append([event['call_id'] for event in events])
+
+        subscription: Subscription = call_events.subscribe()
+        call_events.relay = RecordingRelay()
+
+        async def run() -> None:
+            async with factory() as db:
+                await db.execute(select(1))
+                stage_events(db, call_event(CallEventType.CALL_UPDATED, 1))
+                await (db.commit() if commit else db.rollback())
+                await db.commit()
+
+        try:
+            asyncio.run(run())
+            assert notified == expected
+            assert drain(subscription) == []
+        finally:
+            call_events.relay = None
+            call_events.unsubscribe(subscription)
@@ -0,0 +1,121 @@
+import asyncio
+import os
+from typing import Dict, List
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.constants.db import READ_ONLY_SESSION_KEY
+from src.core.db import create_session_factory, run_migrations
+from src.core.replicas import ReplicaSet
+from src.models.tag import Tag
+
+
+def create_database(path: str, tag_name: str) -> None:
+    engine: Engine = create_engine(f'sqlite:///{path}')
+    with engine.begin() as connection:
+        run_migrations(connection)
+        connection.execute(insert(Tag).values(name=tag_name))
+    engine.dispose()
+
+
+def async_engine(path: str) -> AsyncEngine:
+    return create_async_engine(f'sqlite+aiosqlite:///{path}', poolclass=NullPool)
+
+
+@pytest.fixture
+def paths(temp_dir: str) -> Dict[str, str]:
+    paths: Dict[str, str] = {name: os.path.join(temp_dir, f'{name}.sqlite3') for name in ('primary', 'replica')}
+    for name, path in paths.items():
+        create_database(path, f'{name} tag')
+    return paths
+
+
+async def tag_names(db: AsyncSession) -> List[str]:
+    return list(await db.scalars(select(Tag.name).order_by(Tag.id)))
+
+
+class TestReplicaSet:
+    def test_round_robins_over_available_replicas(self, paths: Dict[str, str]) -> None:
+        engines: List[AsyncEngine] = [async_engine(paths['replica']), async_engine(paths['replica'])]
+        replicas: ReplicaSet = ReplicaSet(engines, retry_seconds=60)
+
+        assert [replicas.choose() for _ in range(4)] == [engine.sync_engine for engine in engines] * 2
+
+    def test_skips_unavailable_replicas_until_retry(self, paths: Dict[str, str]) -> None:
+        replicas: ReplicaSet = ReplicaSet([async_engine(paths['replica'])], retry_seconds=0)
+        replicas.mark_unavailable(next(iter(replicas)))
+        assert replicas.choose() is not None
+
+        replicas.retry_seconds = 60
+        replicas.mark_unavailable(next(iter(replicas)))
+        assert replicas.choose() is None
+        assert replicas.status() == {'replica-0': False}
+
+    def test_health_check_marks_unreachable_replicas(self, paths: Dict[str, str], temp_dir: str) -> None:
+        missing: str = os.path.join(temp_dir, 'missing', 'replica.sqlite3')
+        replicas: ReplicaSet = ReplicaSet([async_engine(paths['replica']), async_engine(missing)], retry_seconds=60)
+
+        assert asyncio.run(replicas.check()) == {'replica-0': True, 'replica-1': False}
+
+
+class TestRoutingSession:
+    @pytest.mark.parametrize('read_only, expected', [
+        (True, ['replica tag']),
+        (False, ['primary tag']),
+    ], ids=['read_only', 'read_write'])
+    def test_routes_reads_by_session_kind(self, read_only: bool, expected: List[str], paths: Dict[str, str]) -> None:
+        factory: async_sessionmaker[AsyncSession] = create_session_factory(
+            async_engine(paths['primary']), ReplicaSet([async_engine(paths['replica'])], retry_seconds=60),
+        )
+
+        async def run() -> List[str]:
+            async with factory(info={READ_ONLY_SESSION_KEY: read_only}) as db:
+                return await tag_names(db)
+
+        assert asyncio.run(run()) == expected
+
+    def test_reads_after_a_write_stay_on_the_primary(self, paths: Dict[str, str]) -> None:
+        factory: async_sessionmaker[AsyncSession] = create_session_factory(
+            async_engine(paths['primary']), ReplicaSet([async_engine(paths['replica'])], retry_seconds=60),
+        )
+
+        async def run() -> List[List[str]]:
+            async with factory(info={READ_ONLY_SESSION_KEY: True}) as db:
+                before: List[str] = await tag_names(db)
+                db.add(Tag(name='new tag'))
+                await db.flush()
+                return [before, await tag_names(db)]
+
+        assert asyncio.run(run()) == [['replica tag'], ['primary tag', 'new tag']]
+
+    def test_pins_one_replica_per_session(self, paths: Dict[str, str], temp_dir: str) -> None:
+        other: str = os.path.join(temp_dir, 'other.sqlite3')
+        create_database(other, 'other tag')
+        factory: async_sessionmaker[AsyncSession] = create_session_factory(
+            async_engine(paths['primary']),
+            ReplicaSet([async_engine(paths['replica']), async_engine(other)], retry_seconds=60),
+        )
+
+        async def run() -> List[List[List[str]]]:
+            sessions: List[List[List[str]]] = []
+            for _ in range(2):
+                async with factory(info={READ_ONLY_SESSION_KEY: True}) as db:
+                    sessions.append([await tag_names(db) for _ in range(3)])
+            return sessions
+
+        assert asyncio.run(run()) == [[['replica tag']] * 3, [['other tag']] * 3]
+
+    def test_retries_reads_on_the_primary_when_the_replica_fails(self, paths: Dict[str, str], temp_dir: str) -> None:
+        replicas: ReplicaSet = ReplicaSet([async_engine(os.path.join(temp_dir, 'missing', 'replica.sqlite3'))], retry_seconds=60)
+        factory: async_sessionmaker[AsyncSession] = create_session_factory(async_engine(paths['primary']), replicas)
+
+        async def run() -> List[List[str]]:
+            async with factory(info={READ_ONLY_SESSION_KEY: True}) as db:
+                return [await tag_names(db), await tag_names(db)]
+
+        assert asyncio.run(run()) == [['primary tag'], ['primary tag']]
+        assert replicas.status() == {'replica-0': False}
@@ -0,0 +1,39 @@
+import os
+from typing import Dict, Iterator
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Connection, Engine
+
+from src.core.db import run_migrations
+from src.core.rollups import rebuild_rollups
+from src.core.seed import seed_database
+from src.models.rollups import tag_call_daily_counts, task_status_daily_counts
+
+
+@pytest.fixture
+def connection(temp_dir: str) -> Iterator[Connection]:
+    engine: Engine = create_engine(f'sqlite:///{os.path.join(temp_dir, "rollups.sqlite3")}')
+    with engine.begin() as connection:
+        run_migrations(connection)
+        yield connection
+    engine.dispose()
+
+
+class TestRebuildRollups:
+    def test_totals_match_raw_rows(self, connection: Connection) -> None:
+        counts: Dict[str, int] = seed_database(connection, calls=300, tags=10, template_tasks=10, days=5, seed=1)
+        connection.execute(tag_call_daily_counts.delete())
+
+        rebuild_rollups(connection)
+
+        assert connection.scalar(select(func.sum(tag_call_daily_counts.c.call_count))) == counts['calls_tags']
+        assert connection.scalar(select(func.sum(task_status_daily_counts.c.task_count))) == counts['calls_tasks']
+
+    def test_is_idempotent(self, connection: Connection) -> None:
+        seed_database(connection, calls=100, tags=5, template_tasks=5, seed=2)
+        first: Dict[str, int] = rebuild_rollups(connection)
+        rows = connection.execute(select(tag_call_daily_counts).order_by(*tag_call_daily_counts.primary_key.columns)).all()
+
+        assert rebuild_rollups(connection) == first
+        assert connection.execute(select(tag_call_daily_counts).order_by(*tag_call_daily_counts.primary_key.columns)).all() == rows
@@ -0,0 +1,54 @@
+import os
+from typing import Dict, Iterator
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Connection, Engine
+
+from src.core.db import run_migrations
+from src.constants.db import TAGS_CATALOG_NAME, TEMPLATE_TASKS_CATALOG_NAME
+from src.core.seed import seed_database
+from src.models.associations import calls_tags, calls_tasks
+from src.models.call import Call
+from src.models.catalog_version import CatalogVersion
+from src.models.tag import Tag
+from src.models.task import Task, TaskType
+
+
+@pytest.fixture
+def connection(temp_dir: str) -> Iterator[Connection]:
+    engine: Engine = create_engine(f'sqlite:///{os.path.join(temp_dir, "seed.sqlite3")}')
+    with engine.begin() as connection:
+        run_migrations(connection)
+        yield connection
+    engine.dispose()
+
+
+def count(connection: Connection, table) -> int:
+    return connection.scalar(select(func.count()).select_from(table))
+
+
+class TestSeedDatabase:
+    def test_inserts_requested_rows(self, connection: Connection) -> None:
+        counts: Dict[str, int] = seed_database(connection, calls=250, tags=20, template_tasks=30, batch_size=100, seed=1)
+
+        assert count(connection, Call.__table__) == 250
+        assert count(connection, Tag.__table__) == 20
+        assert connection.scalar(select(func.count()).where(Task.type == TaskType.TEMPLATE)) == 30
+        assert count(connection, calls_tags) == counts['calls_tags']
+        assert count(connection, calls_tasks) == counts['calls_tasks']
+        assert dict(connection.execute(select(CatalogVersion.name, CatalogVersion.version)).all()) == {TAGS_CATALOG_NAME: 1, TEMPLATE_TASKS_CATALOG_NAME: 1}
+
+    def test_only_links_active_tags(self, connection: Connection) -> None:
+        seed_database(connection, calls=200, tags=40, template_tasks=10, seed=2)
+        linked_inactive: int = connection.scalar(
+            select(func.count()).select_from(calls_tags.join(Tag.__table__)).where(Tag.is_active.is_(False))
+        )
+        assert linked_inactive == 0
+
+    def test_appends_to_existing_rows(self, connection: Connection) -> None:
+        seed_database(connection, calls=50, tags=5, template_tasks=5, seed=3)
+        seed_database(connection, calls=50, tags=5, template_tasks=5, seed=3)
+        assert count(connection, Call.__table__) == 100
+        assert count(connection, Tag.__table__) == 10
+        assert dict(connection.execute(select(CatalogVersion.name, CatalogVersion.version)).all()) == {TAGS_CATALOG_NAME: 2, TEMPLATE_TASKS_CATALOG_NAME: 2}
@@ -0,0 +1,39 @@
+import asyncio
+import os
+from typing import List
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.constants.db import TAGS_CATALOG_NAME, TEMPLATE_TASKS_CATALOG_NAME
+from src.core.db import run_migrations
+from src.dal.catalog_version_dal import CatalogVersionDAL
+
+
+def run_bumps(temp_dir: str, names_per_session: List[List[str]]) -> List[List[int]]:
+    path: str = os.path.join(temp_dir, 'versions.sqlite3')
+    engine: Engine = create_engine(f'sqlite:///{path}')
+    with engine.begin() as connection:
+        run_migrations(connection)
+    engine.dispose()
+
+    async def main() -> List[List[int]]:
+        async_engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{path}', poolclass=NullPool)
+        factory: async_sessionmaker[AsyncSession] = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+        results: List[List[int]] = []
+        for names in names_per_session:
+            async with factory() as db:
+                versions: CatalogVersionDAL = CatalogVersionDAL(db)
+                results.append([await versions.bump(name) for name in names])
+                await db.commit()
+        await async_engine.dispose()
+        return results
+
+    return asyncio.run(main())
+
+
+class TestCatalogVersionBump:
+    def test_first_bump_creates_the_row_and_later_bumps_increment(self, temp_dir: str) -> None:
+        assert run_bumps(temp_dir, [[TAGS_CATALOG_NAME, TAGS_CATALOG_NAME], [TAGS_CATALOG_NAME, TEMPLATE_TASKS_CATALOG_NAME]]) == [[1, 2], [3, 1]]
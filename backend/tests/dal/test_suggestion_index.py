@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+import pytest
+
+from src.dal.suggestion_index import SuggestionIndex
+from src.models.custom_types import TaskType
+from src.schemas.task import TaskRead
+
+NOW: datetime = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def template(task_id: int, is_active: bool = True) -> TaskRead:
+    return TaskRead.construct_trusted(id=task_id, name=f'template {task_id}', created_at=NOW, updated_at=NOW, is_active=is_active, type=TaskType.TEMPLATE)
+
+
+def ranked(index: SuggestionIndex, tag_ids: List[int], exclude_task_ids: Tuple[int, ...] = ()) -> List[Tuple[int, List[int]]]:
+    return [(task.id, task.matched_tag_ids) for task in index.suggest(tag_ids, exclude_task_ids)]
+
+
+@pytest.fixture
+def index() -> SuggestionIndex:
+    index: SuggestionIndex = SuggestionIndex()
+    index.load(3, [
+        (template(10), [1, 2, 3]),
+        (template(11), [1]),
+        (template(12), [2, 3]),
+        (template(13), []),
+    ])
+    return index
+
+
+class TestSuggestionIndex:
+    @pytest.mark.parametrize('tag_ids, exclude_task_ids, expected', [
+        ([1, 2, 3], (), [(10, [1, 2, 3]), (12, [2, 3]), (11, [1])]),
+        ([3, 1], (), [(10, [3, 1]), (11, [1]), (12, [3])]),
+        ([2, 2], (), [(10, [2]), (12, [2])]),
+        ([1, 2, 3], (10, 99), [(12, [2, 3]), (11, [1])]),
+        ([99], (), []),
+        ([], (), []),
+    ], ids=['ranks_by_overlap', 'keeps_tag_order', 'dedupes_tags', 'excludes_tasks', 'unknown_tag', 'no_tags'])
+    def test_suggest(self, index: SuggestionIndex, tag_ids: List[int], exclude_task_ids: Tuple[int, ...], expected: List[Tuple[int, List[int]]]) -> None:
+        assert ranked(index, tag_ids, exclude_task_ids) == expected
+
+    @pytest.mark.parametrize('tag_id, expected_ids', [
+        (2, [10, 12]),
+        (99, []),
+    ], ids=['known', 'unknown'])
+    def test_tasks_for_tag(self, index: SuggestionIndex, tag_id: int, expected_ids: List[int]) -> None:
+        assert [task.id for task in index.tasks_for_tag(tag_id)] == expected_ids
+
+    def test_apply_adds_updates_and_removes_tasks(self, index: SuggestionIndex) -> None:
+        index.apply(4, template(14), [3])
+        index.apply(5, template(11), [2, 3])
+        index.apply(6, template(10, is_active=False))
+
+        assert index.is_current(6)
+        assert ranked(index, [1, 2, 3]) == [(11, [2, 3]), (12, [2, 3]), (14, [3])]
+
+    def test_apply_keeps_tags_when_none_are_given(self, index: SuggestionIndex) -> None:
+        index.apply(4, template(12))
+        assert ranked(index, [3]) == [(10, [3]), (12, [3])]
+
+    def test_apply_reuses_freed_slots(self, index: SuggestionIndex) -> None:
+        index.apply(4, template(11, is_active=False))
+        index.apply(5, template(15), [1])
+
+        assert ranked(index, [1]) == [(10, [1]), (15, [1])]
+        assert len(index._tasks) == 4
+
+    @pytest.mark.parametrize('version', [3, 5], ids=['same_version', 'skipped_version'])
+    def test_apply_out_of_order_invalidates(self, index: SuggestionIndex, version: int) -> None:
+        index.apply(version, template(14), [1])
+        assert index.version is None
@@ -0,0 +1,51 @@
+import pytest
+from typing import List
+
+from src.dal.tag_catalog import TagCatalog
+from src.models.call import Call  # noqa: F401
+from src.models.tag import Tag
+from src.models.task import Task  # noqa: F401
+
+
+@pytest.fixture
+def catalog() -> TagCatalog:
+    catalog: TagCatalog = TagCatalog()
+    catalog.load(3, [
+        Tag(id=2, name='flood', is_active=True, color_id=1),
+        Tag(id=1, name='fire', is_active=True, color_id=0),
+        Tag(id=3, name='storm', is_active=False, color_id=2),
+    ])
+    return catalog
+
+
+class TestTagCatalog:
+    def test_version(self, catalog: TagCatalog) -> None:
+        assert catalog.is_current(3)
+        assert not catalog.is_current(4)
+        catalog.invalidate()
+        assert not catalog.is_current(3)
+
+    def test_list_active(self, catalog: TagCatalog) -> None:
+        assert [tag.id for tag in catalog.list_active()] == [1, 2]
+
+    @pytest.mark.parametrize('tag_id, expected_name', [
+        (1, 'fire'),
+        (3, None),
+        (99, None),
+    ], ids=['active', 'inactive', 'missing'])
+    def test_get_active(self, catalog: TagCatalog, tag_id: int, expected_name: str | None) -> None:
+        tag: Tag | None = catalog.get_active(tag_id)
+        assert (tag.name if tag else None) == expected_name
+
+    @pytest.mark.parametrize('tag_ids, expected_ids', [
+        ([2, 1], [2, 1]),
+        ([1, 1, 2], [1, 2]),
+        ([3, 99, 1], [1]),
+        ([], []),
+    ], ids=['keeps_order', 'dedupes', 'skips_inactive_and_missing', 'empty'])
+    def test_get_active_by_ids(self, catalog: TagCatalog, tag_ids: List[int], expected_ids: List[int]) -> None:
+        assert [tag.id for tag in catalog.get_active_by_ids(tag_ids)] == expected_ids
+
+    def test_get_by_name_includes_inactive(self, catalog: TagCatalog) -> None:
+        assert catalog.get_by_name('storm').id == 3
+        assert catalog.get_by_name('missing') is None
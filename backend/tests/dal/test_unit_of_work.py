@@ -0,0 +1,68 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, List
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.core.db import run_migrations
+from src.dal.tag_catalog import TagCatalog
+from src.dal.tag_dal import TagDAL
+from src.models.call import Call  # noqa: F401
+from src.models.tag import Tag
+from src.models.task import Task  # noqa: F401
+
+
+@pytest.fixture
+def run_with_dal(temp_dir: str) -> Callable[[Callable[[TagDAL, List[str]], Awaitable[Any]]], List[Any]]:
+    path: str = os.path.join(temp_dir, 'uow.sqlite3')
+    engine: Engine = create_engine(f'sqlite:///{path}')
+    with engine.begin() as connection:
+        run_migrations(connection)
+    engine.dispose()
+
+    def run(work: Callable[[TagDAL, List[str]], Awaitable[Any]]) -> List[Any]:
+        async_engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{path}', poolclass=NullPool)
+        factory: async_sessionmaker[AsyncSession] = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+        log: List[str] = []
+        commit_listener: Callable[..., None] = lambda conn: log.append('commit')
+        event.listen(async_engine.sync_engine, 'commit', commit_listener)
+
+        async def main() -> List[str]:
+            async with factory() as db:
+                try:
+                    await work(TagDAL(db, TagCatalog()), log)
+                except RuntimeError:
+                    log.append('raised')
+            async with factory() as db:
+                log.extend(await db.scalars(select(Tag.name).order_by(Tag.id)))
+            await async_engine.dispose()
+            return log
+
+        return asyncio.run(main())
+
+    return run
+
+
+class TestUnitOfWork:
+    def test_nested_units_commit_once(self, run_with_dal) -> None:
+        async def work(tag_dal: TagDAL, log: List[str]) -> None:
+            async with tag_dal.unit_of_work():
+                await tag_dal.create_tag('fire')
+                await tag_dal.create_tag('flood')
+                tag_dal.on_commit(log.append, 'after commit')
+                log.append('before commit')
+
+        assert run_with_dal(work) == ['before commit', 'commit', 'after commit', 'fire', 'flood']
+
+    def test_failure_rolls_back_every_step(self, run_with_dal) -> None:
+        async def work(tag_dal: TagDAL, log: List[str]) -> None:
+            async with tag_dal.unit_of_work():
+                await tag_dal.create_tag('fire')
+                tag_dal.on_commit(log.append, 'after commit')
+                raise RuntimeError('second step failed')
+
+        assert run_with_dal(work) == ['raised']
@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from typing import Any, Dict, List, Tuple
+
+from starlette.requests import Request
+
+from src.constants.limits import MAX_BULK_ITEMS
+from src.core.exceptions import BulkLimitExceededError, InvalidBulkPayloadError
+from src.schemas.call import CallCreate
+from src.utils.bulk import parse_bulk_items, read_bulk_body
+
+
+class TestParseBulkItems:
+    @pytest.mark.parametrize('body, content_type, expected_names, expected_error_indexes', [
+        (b'[{"name": "a"}, {"name": "b", "tag_ids": [1]}]', 'application/json', ['a', 'b'], []),
+        (b'[{"name": "a"}, {"tag_ids": [1]}, {"name": "c"}]', 'application/json', ['a', 'c'], [1]),
+        (b'{"name": "a"}\n{"name": "b"}\n', 'application/x-ndjson', ['a', 'b'], []),
+        (b'{"name": "a"}\n\n{"name": 1}\n{"name": "c"}', 'application/x-ndjson; charset=utf-8', ['a', 'c'], [1]),
+        (b'{"name": "a"}\nnot json', 'application/x-ndjson', ['a'], [1]),
+        (b'[]', 'application/json', [], []),
+    ], ids=['json', 'json_invalid_item', 'ndjson', 'ndjson_blank_lines_and_invalid_item', 'ndjson_malformed_line', 'empty'])
+    def test_parse(self, body: bytes, content_type: str, expected_names: List[str], expected_error_indexes: List[int]) -> None:
+        items, errors = parse_bulk_items(body, content_type, CallCreate)
+        assert [item.name for _, item in items] == expected_names
+        assert [index for index, _ in errors] == expected_error_indexes
+
+    def test_keeps_item_indexes(self) -> None:
+        items, errors = parse_bulk_items(b'[{"name": "a"}, {}, {"name": "c"}]', 'application/json', CallCreate)
+        indexes: List[Tuple[int, str]] = [(index, item.name) for index, item in items]
+        assert indexes == [(0, 'a'), (2, 'c')]
+        assert errors[0][1] == 'name: Field required'
+
+    @pytest.mark.parametrize('body', [b'{"name": "a"}', b'[', b''], ids=['object', 'malformed', 'empty_body'])
+    def test_invalid_payload(self, body: bytes) -> None:
+        with pytest.raises(InvalidBulkPayloadError):
+            parse_bulk_items(body, 'application/json', CallCreate)
+
+    def test_limit(self) -> None:
+        body: bytes = b'\n'.join([b'{"name": "a"}'] * (MAX_BULK_ITEMS + 1))
+        with pytest.raises(BulkLimitExceededError):
+            parse_bulk_items(body, 'application/x-ndjson', CallCreate)
+
+
+def make_request(chunks: List[bytes], headers: List[Tuple[bytes, bytes]]) -> Request:
+    messages: List[Dict[str, Any]] = [{'type': 'http.request', 'body': chunk, 'more_body': i < len(chunks) - 1} for i, chunk in enumerate(chunks)]
+
+    async def receive() -> Dict[str, Any]:
+        if not messages:
+            raise AssertionError('body read after the size check should have rejected it')
+        return messages.pop(0)
+
+    return Request({'type': 'http', 'method': 'POST', 'headers': headers}, receive)
+
+
+class TestReadBulkBody:
+    def test_reads_body_within_limit(self) -> None:
+        request: Request = make_request([b'[{"name": ', b'"a"}]'], [(b'content-length', b'15')])
+        assert asyncio.run(read_bulk_body(request, max_bytes=15)) == b'[{"name": "a"}]'
+
+    def test_rejects_declared_length_before_reading(self) -> None:
+        request: Request = make_request([], [(b'content-length', b'16')])
+        with pytest.raises(BulkLimitExceededError):
+            asyncio.run(read_bulk_body(request, max_bytes=15))
+
+    def test_rejects_streamed_body_over_limit(self) -> None:
+        request: Request = make_request([b'x' * 10, b'x' * 10], [])
+        with pytest.raises(BulkLimitExceededError):
+            asyncio.run(read_bulk_body(request, max_bytes=15))
@@ -0,0 +1,76 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List
+
+from src.models.custom_types import TaskStatus
+from src.utils.export import CSV_COLUMNS, to_csv, to_ndjson
+
+RECORDS: List[Dict[str, Any]] = [
+    {
+        'id': 1,
+        'name': 'Fire, downtown',
+        'description': 'Line 1\nLine 2',
+        'created_at': datetime(2025, 1, 1, 8, 0),
+        'updated_at': datetime(2025, 1, 1, 9, 0),
+        'tags': [{'id': 1, 'name': 'fire'}, {'id': 2, 'name': 'urgent'}],
+        'tasks': [{'id': 7, 'name': 'Dispatch', 'status': 'open'}],
+    },
+    {
+        'id': 2,
+        'name': 'Quiet call',
+        'description': None,
+        'created_at': datetime(2025, 1, 2, 8, 0),
+        'updated_at': datetime(2025, 1, 2, 8, 0),
+        'tags': [],
+        'tasks': [],
+    },
+]
+
+
+async def _batches(batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    for start in range(0, len(RECORDS), batch_size):
+        yield RECORDS[start:start + batch_size]
+
+
+async def _collect(chunks: AsyncIterator[str]) -> str:
+    return ''.join([chunk async for chunk in chunks])
+
+
+async def _collect_bytes(chunks: AsyncIterator[bytes]) -> bytes:
+    return b''.join([chunk async for chunk in chunks])
+
+
+class TestToNdjson:
+    def test_one_line_per_record(self) -> None:
+        output: bytes = asyncio.run(_collect_bytes(to_ndjson(_batches(1))))
+        lines: List[Dict[str, Any]] = [json.loads(line) for line in output.splitlines()]
+        assert [line['id'] for line in lines] == [1, 2]
+        assert lines[0]['created_at'] == '2025-01-01T08:00:00'
+        assert lines[0]['tasks'] == [{'id': 7, 'name': 'Dispatch', 'status': 'open'}]
+
+    def test_matches_json_response_encoding(self) -> None:
+        async def batches() -> AsyncIterator[List[Dict[str, Any]]]:
+            yield [{'id': 3, 'created_at': datetime(2025, 1, 1, 8, 0, tzinfo=timezone.utc), 'status': TaskStatus.OPEN}]
+
+        output: bytes = asyncio.run(_collect_bytes(to_ndjson(batches())))
+        assert output == b'{"id":3,"created_at":"2025-01-01T08:00:00Z","status":"open"}\n'
+
+
+class TestToCsv:
+    def test_header_and_rows(self) -> None:
+        output: str = asyncio.run(_collect(to_csv(_batches(2))))
+        rows: List[List[str]] = list(csv.reader(io.StringIO(output)))
+        assert rows[0] == CSV_COLUMNS
+        assert rows[1] == ['1', 'Fire, downtown', 'Line 1\nLine 2', '2025-01-01T08:00:00', '2025-01-01T09:00:00', 'fire|urgent', 'Dispatch:open']
+        assert rows[2] == ['2', 'Quiet call', '', '2025-01-02T08:00:00', '2025-01-02T08:00:00', '', '']
+
+    def test_header_only_when_empty(self) -> None:
+        async def empty() -> AsyncIterator[List[Dict[str, Any]]]:
+            return
+            yield
+
+        output: str = asyncio.run(_collect(to_csv(empty())))
+        assert list(csv.reader(io.StringIO(output))) == [CSV_COLUMNS]
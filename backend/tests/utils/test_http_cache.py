@@ -0,0 +1,33 @@
+import pytest
+
+from src.utils.http_cache import etag_matches, make_etag, not_modified
+
+
+class TestETags:
+    def test_make_etag_is_weak_and_versioned(self) -> None:
+        assert make_etag('template-tasks', 3, 7) == 'W/"template-tasks-3-7"'
+
+    def test_make_etag_names_non_json_media_types(self) -> None:
+        assert make_etag('tags', 4, media_type='application/msgpack') == 'W/"tags-msgpack-4"'
+
+    @pytest.mark.parametrize(
+        'if_none_match, expected',
+        [
+            ('W/"tags-3"', True),
+            ('"tags-3"', True),
+            ('W/"tags-2", W/"tags-3"', True),
+            ('*', True),
+            ('W/"tags-2"', False),
+            ('', False),
+            (None, False),
+        ],
+        ids=['weak', 'strong', 'list', 'wildcard', 'stale', 'empty', 'missing'],
+    )
+    def test_etag_matches(self, if_none_match: str | None, expected: bool) -> None:
+        assert etag_matches(if_none_match, make_etag('tags', 3)) is expected
+
+    @pytest.mark.parametrize('vary_accept, expected', [(True, 'Accept'), (False, None)], ids=['negotiated', 'json_only'])
+    def test_not_modified_repeats_vary(self, vary_accept: bool, expected: str | None) -> None:
+        response = not_modified(make_etag('tags', 3), vary_accept=vary_accept)
+        assert response.status_code == 304
+        assert response.headers.get('Vary') == expected
@@ -0,0 +1,103 @@
+import io
+from datetime import date
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from src.utils.logger import Logger, LogLevel, LogWriter
+
+
+class CountingArg:
+    def __init__(self):
+        self.calls: int = 0
+
+    def __str__(self) -> str:
+        self.calls += 1
+        return 'formatted'
+
+
+class BrokenStream(io.StringIO):
+    def write(self, text: str) -> int:
+        raise OSError('disk full')
+
+
+@pytest.fixture
+def writer(temp_dir: str) -> Iterator[LogWriter]:
+    writer: LogWriter = LogWriter(Path(temp_dir), flush_interval_seconds=60, batch_size=1000, stream=io.StringIO())
+    yield writer
+    writer.close()
+
+
+def read_lines(path: Path) -> List[str]:
+    return path.read_text(encoding='utf-8').splitlines()
+
+
+class TestLogWriter:
+    def test_flush_writes_batched_lines(self, writer: LogWriter, temp_dir: str) -> None:
+        for i in range(3):
+            writer.write(date(2024, 1, 1), f'line {i}')
+        writer.flush()
+        assert read_lines(Path(temp_dir) / '2024-01-01.log') == ['line 0', 'line 1', 'line 2']
+
+    def test_rotates_on_date_change(self, writer: LogWriter, temp_dir: str) -> None:
+        writer.write(date(2024, 1, 1), 'before midnight')
+        writer.write(date(2024, 1, 2), 'after midnight')
+        writer.flush()
+        assert read_lines(Path(temp_dir) / '2024-01-01.log') == ['before midnight']
+        assert read_lines(Path(temp_dir) / '2024-01-02.log') == ['after midnight']
+
+    def test_flushes_when_batch_is_full(self, temp_dir: str) -> None:
+        writer: LogWriter = LogWriter(Path(temp_dir), flush_interval_seconds=60, batch_size=2, stream=None)
+        writer.write(date(2024, 1, 1), 'a')
+        writer.write(date(2024, 1, 1), 'b')
+        writer.close()
+        assert read_lines(Path(temp_dir) / '2024-01-01.log') == ['a', 'b']
+
+    def test_reports_write_errors_to_stderr(self, temp_dir: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        stderr: io.StringIO = io.StringIO()
+        monkeypatch.setattr('sys.__stderr__', stderr)
+        writer: LogWriter = LogWriter(Path(temp_dir), flush_interval_seconds=60, batch_size=1000, stream=BrokenStream())
+        writer.write(date(2024, 1, 1), 'a')
+        writer.write(date(2024, 1, 1), 'b')
+        writer.close()
+        assert stderr.getvalue().startswith('--- Logging error: failed to write 2 log lines ---')
+        assert 'OSError: disk full' in stderr.getvalue()
+
+
+class TestLogger:
+    @pytest.mark.parametrize(
+        'min_level, expected',
+        [
+            (LogLevel.DEBUG, ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']),
+            (LogLevel.INFO, ['INFO', 'WARNING', 'ERROR', 'CRITICAL']),
+            (LogLevel.ERROR, ['ERROR', 'CRITICAL']),
+        ],
+        ids=['debug', 'info', 'error'],
+    )
+    def test_filters_below_min_level(self, writer: LogWriter, temp_dir: str, min_level: LogLevel, expected: List[str]) -> None:
+        logger: Logger = Logger('test', min_level=min_level, writer=writer)
+        logger.debug('message')
+        logger.info('message')
+        logger.warning('message')
+        logger.error('message')
+        logger.critical('message')
+        logger.flush()
+        lines: List[str] = read_lines(next(Path(temp_dir).glob('*.log')))
+        assert [line.split('] [')[1] for line in lines] == expected
+
+    def test_formats_args_lazily(self, writer: LogWriter, temp_dir: str) -> None:
+        logger: Logger = Logger('test', min_level=LogLevel.INFO, writer=writer)
+        arg: CountingArg = CountingArg()
+        logger.debug('value=%s', arg)
+        assert arg.calls == 0
+        logger.info('value=%s', arg)
+        logger.flush()
+        assert arg.calls == 1
+        assert read_lines(next(Path(temp_dir).glob('*.log')))[0].endswith('[test] value=formatted')
+
+    def test_appends_exception(self, writer: LogWriter, temp_dir: str) -> None:
+        logger: Logger = Logger('test', writer=writer)
+        logger.error('failed', exception=ValueError('boom'))
+        logger.flush()
+        assert read_lines(next(Path(temp_dir).glob('*.log')))[0].endswith('failed | Exception: ValueError: boom')
@@ -0,0 +1,102 @@
+from typing import List
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.utils.metrics import AppMetrics, Counter, Gauge, Histogram, MetricsMiddleware
+
+
+@pytest.fixture
+def app_metrics() -> AppMetrics:
+    return AppMetrics()
+
+
+@pytest.fixture
+def client(app_metrics: AppMetrics) -> TestClient:
+    app: FastAPI = FastAPI()
+    app.add_middleware(MetricsMiddleware, app_metrics=app_metrics)
+
+    @app.get('/items/{item_id}')
+    async def get_item(item_id: int) -> dict:
+        if item_id == 0:
+            raise HTTPException(status_code=404)
+        for _ in range(item_id):
+            app_metrics.record_query(0.002)
+        return {'id': item_id}
+
+    return TestClient(app)
+
+
+class TestHistogram:
+    @pytest.mark.parametrize(
+        'value, expected_buckets',
+        [(0.5, [1, 1, 1, 1]), (1.0, [1, 1, 1, 1]), (1.5, [0, 1, 1, 1]), (10.0, [0, 0, 0, 1])],
+        ids=['below_first', 'on_boundary', 'between', 'overflow'],
+    )
+    def test_buckets_are_cumulative_and_inclusive(self, value: float, expected_buckets: List[int]) -> None:
+        histogram: Histogram = Histogram('latency', 'Latency.', [1.0, 2.0, 5.0])
+        histogram.observe(value)
+        lines: List[str] = histogram.render()
+        assert [int(line.rsplit(' ', 1)[1]) for line in lines if line.startswith('latency_bucket')] == expected_buckets
+        assert f'latency_sum {value:g}' in lines
+        assert 'latency_count 1' in lines
+
+    def test_renders_labels_in_declared_order(self) -> None:
+        histogram: Histogram = Histogram('latency', 'Latency.', [1.0], ('method', 'route'))
+        histogram.observe(0.2, ('GET', '/a'))
+        assert 'latency_bucket{method="GET",route="/a",le="1"} 1' in histogram.render()
+        assert 'latency_bucket{method="GET",route="/a",le="+Inf"} 1' in histogram.render()
+
+
+class TestCounter:
+    def test_escapes_label_values(self) -> None:
+        counter: Counter = Counter('hits', 'Hits.', ('route',))
+        counter.inc(('a"b\\c\n',), amount=2)
+        assert counter.render() == ['# HELP hits Hits.', '# TYPE hits counter', 'hits{route="a\\"b\\\\c\\n"} 2']
+
+
+class TestGauge:
+    def test_keeps_the_last_value(self) -> None:
+        gauge: Gauge = Gauge('up', 'Up.', ('engine',))
+        gauge.set(1, ('primary',))
+        gauge.set(0, ('primary',))
+        assert gauge.render() == ['# HELP up Up.', '# TYPE up gauge', 'up{engine="primary"} 0']
+
+    def test_collectors_run_before_render(self, app_metrics: AppMetrics) -> None:
+        app_metrics.add_collector(lambda: app_metrics.db_engine_up.set(1, ('replica-0',)))
+        assert 'db_engine_up{engine="replica-0"} 1' in app_metrics.render()
+
+
+class TestMetricsMiddleware:
+    def test_records_route_template_status_and_queries(self, client: TestClient, app_metrics: AppMetrics) -> None:
+        assert client.get('/items/3').status_code == 200
+        assert client.get('/items/0').status_code == 404
+
+        labels = ('GET', '/items/{item_id}')
+        assert app_metrics.requests_total.value(('GET', '/items/{item_id}', '200')) == 1
+        assert app_metrics.requests_total.value(('GET', '/items/{item_id}', '404')) == 1
+        assert app_metrics.request_duration.count(labels) == 2
+        assert app_metrics.request_db_queries.sum(labels) == 3
+        assert app_metrics.request_db_duration.sum(labels) == pytest.approx(0.006)
+        assert app_metrics.db_queries_total.value() == 3
+
+    def test_unmatched_routes_share_one_series(self, client: TestClient, app_metrics: AppMetrics) -> None:
+        client.get('/missing/1')
+        client.get('/missing/2')
+        assert app_metrics.requests_total.value(('GET', '<unmatched>', '404')) == 2
+
+    def test_queries_outside_requests_are_not_attributed(self, client: TestClient, app_metrics: AppMetrics) -> None:
+        app_metrics.record_query(0.5)
+        client.get('/items/1')
+        assert app_metrics.request_db_duration.sum(('GET', '/items/{item_id}')) == pytest.approx(0.002)
+        assert app_metrics.db_queries_total.value() == 2
+
+    def test_render_is_prometheus_text(self, client: TestClient, app_metrics: AppMetrics) -> None:
+        client.get('/items/1')
+        app_metrics.record_rate_limit_rejection('GET /items/{item_id}')
+        body: str = app_metrics.render()
+        assert body.endswith('\n')
+        assert '# TYPE http_request_duration_seconds histogram' in body
+        assert 'http_request_db_queries_bucket{method="GET",route="/items/{item_id}",le="1"} 1' in body
+        assert 'rate_limit_rejections_total{route="GET /items/{item_id}"} 1' in body
@@ -0,0 +1,45 @@
+import pytest
+from datetime import datetime, timezone
+
+from src.core.exceptions import InvalidCursorError
+from src.utils.pagination import decode_cursor, decode_score_cursor, encode_cursor, encode_score_cursor
+
+
+class TestCursor:
+    @pytest.mark.parametrize('created_at, id', [
+        (datetime(2025, 1, 1, 12, 30, 15, 123456), 1),
+        (datetime(2025, 1, 1, 12, 30, 15, tzinfo=timezone.utc), 42),
+        (datetime(1999, 12, 31), 10 ** 12),
+    ], ids=['naive', 'aware', 'large_id'])
+    def test_round_trip(self, created_at: datetime, id: int) -> None:
+        cursor: str = encode_cursor(created_at, id)
+        assert '=' not in cursor
+        assert decode_cursor(cursor) == (created_at, id)
+
+    @pytest.mark.parametrize('cursor', [
+        '',
+        'not-a-cursor',
+        '!!!',
+        encode_cursor(datetime(2025, 1, 1), 1)[:-4],
+    ], ids=['empty', 'garbage', 'invalid_base64', 'truncated'])
+    def test_invalid_cursor(self, cursor: str) -> None:
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+
+class TestScoreCursor:
+    @pytest.mark.parametrize('score, id', [
+        (0.1 + 0.2, 1),
+        (-12.345678901234567, 42),
+        (0.0, 10 ** 12),
+    ], ids=['inexact_float', 'negative', 'zero'])
+    def test_round_trip_is_exact(self, score: float, id: int) -> None:
+        assert decode_score_cursor(encode_score_cursor(score, id)) == (score, id)
+
+    @pytest.mark.parametrize('cursor', [
+        'not-a-cursor',
+        encode_cursor(datetime(2025, 1, 1), 1),
+    ], ids=['garbage', 'date_cursor'])
+    def test_invalid_cursor(self, cursor: str) -> None:
+        with pytest.raises(InvalidCursorError):
+            decode_score_cursor(cursor)
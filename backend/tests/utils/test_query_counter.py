@@ -0,0 +1,65 @@
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from src.utils.query_counter import QueryCounter, normalize_statement
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine: Engine = create_engine('sqlite://')
+    with engine.begin() as connection:
+        connection.execute(text('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)'))
+        connection.execute(text('INSERT INTO items (id, name) VALUES (:id, :name)'), [{'id': i, 'name': f'item {i}'} for i in range(5)])
+    yield engine
+    engine.dispose()
+
+
+class TestNormalizeStatement:
+    @pytest.mark.parametrize(
+        'statement, expected',
+        [
+            ('SELECT *\n  FROM items WHERE id IN (?, ?, ?)', 'SELECT * FROM items WHERE id IN (?)'),
+            ('SELECT * FROM items WHERE id IN (%(id_1_1)s, %(id_1_2)s)', 'SELECT * FROM items WHERE id IN (?)'),
+            ('SELECT * FROM items WHERE id IN ($1, $2)', 'SELECT * FROM items WHERE id IN (?)'),
+            ('INSERT INTO items (id, name) VALUES (?, ?)', 'INSERT INTO items (id, name) VALUES (?)'),
+            ('SELECT count(*) FROM items', 'SELECT count(*) FROM items'),
+        ],
+        ids=['qmark_in_list', 'pyformat_in_list', 'numeric_in_list', 'values', 'no_parameters'],
+    )
+    def test_collapses_whitespace_and_parameter_lists(self, statement: str, expected: str) -> None:
+        assert normalize_statement(statement) == expected
+
+
+class TestQueryCounter:
+    def test_counts_statements_inside_the_block_only(self, engine: Engine) -> None:
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+            with QueryCounter() as queries:
+                connection.execute(text('SELECT 2'))
+                connection.execute(text('SELECT 3'))
+            connection.execute(text('SELECT 4'))
+        assert queries.count == 2
+
+    def test_flags_statements_repeated_with_different_parameters(self, engine: Engine) -> None:
+        with engine.connect() as connection, QueryCounter() as queries:
+            for item_id in range(3):
+                connection.execute(text('SELECT name FROM items WHERE id = :id'), {'id': item_id})
+            connection.execute(text('SELECT name FROM items WHERE id IN (:a, :b, :c)'), {'a': 0, 'b': 1, 'c': 2})
+        assert queries.find_n_plus_one() == ['SELECT name FROM items WHERE id = ?']
+
+    @pytest.mark.parametrize('repeats, threshold', [(2, 3), (5, 6)], ids=['below_default', 'below_custom'])
+    def test_ignores_repeats_below_threshold(self, engine: Engine, repeats: int, threshold: int) -> None:
+        with engine.connect() as connection, QueryCounter() as queries:
+            for item_id in range(repeats):
+                connection.execute(text('SELECT name FROM items WHERE id = :id'), {'id': item_id})
+        assert queries.find_n_plus_one(threshold) == []
+
+    def test_identical_repeats_are_not_n_plus_one(self, engine: Engine) -> None:
+        with engine.connect() as connection, QueryCounter() as queries:
+            for _ in range(5):
+                connection.execute(text('SELECT name FROM items WHERE id = :id'), {'id': 1})
+        assert queries.count == 5
+        assert queries.find_n_plus_one() == []
@@ -0,0 +1,51 @@
+import os
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection, Engine
+
+from src.core.db import run_migrations
+from src.utils.query_plans import find_unindexed_scans, is_explainable
+
+
+@pytest.fixture
+def connection(temp_dir: str) -> Iterator[Connection]:
+    engine: Engine = create_engine(f'sqlite:///{os.path.join(temp_dir, "plans.sqlite3")}')
+    with engine.begin() as connection:
+        run_migrations(connection)
+        yield connection
+    engine.dispose()
+
+
+class TestFindUnindexedScans:
+    @pytest.mark.parametrize(
+        'statement, expected',
+        [
+            ('SELECT call_id FROM calls_tags WHERE tag_id = 1', []),
+            ('DELETE FROM calls_tasks WHERE task_id = 1', []),
+            ("SELECT id FROM tasks WHERE is_active IS 1 AND type = 'TEMPLATE'", []),
+            ("SELECT id FROM calls WHERE created_at >= '2024-01-01' ORDER BY created_at DESC, id DESC", []),
+            ('SELECT id FROM tags', []),
+            ("SELECT id FROM calls WHERE name = 'call'", ['SCAN calls']),
+        ],
+        ids=['calls_tags_by_tag', 'calls_tasks_by_task', 'active_templates', 'calls_by_created_at', 'full_read', 'unindexed_filter'],
+    )
+    def test_sqlite(self, connection: Connection, statement: str, expected: List[str]) -> None:
+        assert find_unindexed_scans(connection, statement) == expected
+
+
+class TestIsExplainable:
+    @pytest.mark.parametrize(
+        'statement, expected',
+        [
+            ('SELECT 1', True),
+            ('  update calls SET name = 1', True),
+            ('DELETE FROM calls', True),
+            ('INSERT INTO calls DEFAULT VALUES', False),
+            ('SAVEPOINT sa_1', False),
+        ],
+        ids=['select', 'update', 'delete', 'insert', 'savepoint'],
+    )
+    def test_statement_types(self, statement: str, expected: bool) -> None:
+        assert is_explainable(statement) == expected
@@ -0,0 +1,103 @@
+import asyncio
+import os
+import threading
+from typing import List
+import pytest
+
+from src.utils.rate_limit import InMemoryRateLimitStore, RateLimit, RateLimiter, RateLimitStore, SQLiteRateLimitStore
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, temp_dir: str) -> RateLimitStore:
+    if request.param == 'sqlite':
+        return SQLiteRateLimitStore(os.path.join(temp_dir, 'rate_limits.sqlite3'))
+    return InMemoryRateLimitStore()
+
+
+class TestRateLimitStore:
+    def test_allows_burst_up_to_limit(self, store: RateLimitStore) -> None:
+        limit: RateLimit = RateLimit(5, 10)
+        assert [store.acquire('k', limit, 100.0) for _ in range(5)] == [0.0] * 5
+        assert store.acquire('k', limit, 100.0) == pytest.approx(2.0)
+
+    def test_replenishes_over_time(self, store: RateLimitStore) -> None:
+        limit: RateLimit = RateLimit(5, 10)
+        for _ in range(5):
+            store.acquire('k', limit, 100.0)
+        assert store.acquire('k', limit, 101.0) > 0
+        assert store.acquire('k', limit, 102.0) == 0.0
+        assert store.acquire('k', limit, 102.0) > 0
+
+    def test_keys_are_independent(self, store: RateLimitStore) -> None:
+        limit: RateLimit = RateLimit(1, 10)
+        assert store.acquire('a', limit, 100.0) == 0.0
+        assert store.acquire('a', limit, 100.0) > 0
+        assert store.acquire('b', limit, 100.0) == 0.0
+
+    def test_rejections_do_not_consume_quota(self, store: RateLimitStore) -> None:
+        limit: RateLimit = RateLimit(1, 10)
+        store.acquire('k', limit, 100.0)
+        for _ in range(10):
+            store.acquire('k', limit, 105.0)
+        assert store.acquire('k', limit, 110.0) == 0.0
+
+
+class TestInMemoryRateLimitStore:
+    def test_evicts_idle_keys(self) -> None:
+        store: InMemoryRateLimitStore = InMemoryRateLimitStore(sweep_interval_seconds=5)
+        limit: RateLimit = RateLimit(10, 10)
+        for i in range(100):
+            store.acquire(f'/v1/calls/{i}', limit, 100.0)
+        assert len(store) == 100
+        store.acquire('other', limit, 106.0)
+        assert len(store) == 1
+
+    def test_caps_number_of_keys(self) -> None:
+        store: InMemoryRateLimitStore = InMemoryRateLimitStore(max_keys=10)
+        limit: RateLimit = RateLimit(10, 10)
+        for i in range(100):
+            store.acquire(str(i), limit, 100.0)
+        assert len(store) == 10
+
+    def test_evicts_least_recently_used_key(self) -> None:
+        store: InMemoryRateLimitStore = InMemoryRateLimitStore(max_keys=3)
+        limit: RateLimit = RateLimit(1, 10)
+        store.acquire('throttled', limit, 100.0)
+        for i in range(10):
+            store.acquire(str(i), limit, 100.0)
+            assert store.acquire('throttled', limit, 100.0) > 0
+
+
+class TestSQLiteRateLimitStore:
+    def test_state_is_shared_between_workers(self, temp_dir: str) -> None:
+        path: str = os.path.join(temp_dir, 'rate_limits.sqlite3')
+        first_worker: SQLiteRateLimitStore = SQLiteRateLimitStore(path)
+        second_worker: SQLiteRateLimitStore = SQLiteRateLimitStore(path)
+        limit: RateLimit = RateLimit(2, 10)
+        assert first_worker.acquire('k', limit, 100.0) == 0.0
+        assert second_worker.acquire('k', limit, 100.0) == 0.0
+        assert first_worker.acquire('k', limit, 100.0) > 0
+
+    def test_limiter_runs_sqlite_store_off_the_event_loop(self, temp_dir: str) -> None:
+        threads: List[threading.Thread] = []
+
+        class RecordingStore(SQLiteRateLimitStore):
+            def acquire(self, key: str, limit: RateLimit, now: float) -> float:
+                threads.append(threading.current_thread())
+                return super().acquire(key, limit, now)
+
+        limiter: RateLimiter = RateLimiter(RecordingStore(os.path.join(temp_dir, 'rate_limits.sqlite3')), RateLimit(1, 60))
+        assert asyncio.run(limiter.acquire_async('1.2.3.4', 'GET /api/v1/calls')) == 0.0
+        assert threads and threads[0] is not threading.main_thread()
+
+
+class TestRateLimiter:
+    def test_route_limits_override_default(self) -> None:
+        limiter: RateLimiter = RateLimiter(
+            store=InMemoryRateLimitStore(),
+            default_limit=RateLimit(100, 60),
+            route_limits={'POST /api/v1/calls/bulk': RateLimit(1, 60)},
+        )
+        assert limiter.acquire('1.2.3.4', 'POST /api/v1/calls/bulk', now=100.0) == 0.0
+        assert limiter.acquire('1.2.3.4', 'POST /api/v1/calls/bulk', now=100.0) > 0
+        assert limiter.acquire('1.2.3.4', 'GET /api/v1/calls', now=100.0) == 0.0
@@ -0,0 +1,85 @@
+import json
+from datetime import datetime, timezone
+from typing import Any
+
+import msgpack
+import pytest
+
+from src.models.custom_types import TaskStatus, TaskType
+from src.schemas.call import CallListItem, CallListPage
+from src.schemas.tag import TagRead
+from src.schemas.task import CallTaskRead
+from src.utils.responses import FastJSONResponse, MsgPackResponse, negotiate_response_class
+
+CREATED_AT: datetime = datetime(2024, 1, 1, 12, 30, 0, 123456)
+
+
+def make_tag(tag_id: int) -> TagRead:
+    return TagRead.construct_trusted(id=tag_id, name=f'tag {tag_id}', created_at=CREATED_AT, updated_at=CREATED_AT, is_active=True, color_id=tag_id)
+
+
+class TestFastJSONResponse:
+    @pytest.mark.parametrize(
+        'content',
+        [
+            CallListPage(
+                items=[
+                    CallListItem.construct_trusted(id=1, name='call', created_at=CREATED_AT, updated_at=CREATED_AT, description=None, tags=[make_tag(1), make_tag(2)]),
+                ],
+                next_cursor='abc',
+            ),
+            [make_tag(1)],
+            {1: [CallTaskRead.construct_trusted(id=1, name='task', created_at=CREATED_AT, updated_at=CREATED_AT, is_active=True, type=TaskType.AD_HOC, call_id=1, status=TaskStatus.OPEN)], 2: []},
+            make_tag(1).model_copy(update={'created_at': CREATED_AT.replace(tzinfo=timezone.utc, microsecond=0)}),
+        ],
+        ids=['call_list_page', 'tag_list', 'grouped_call_tasks', 'utc_datetime'],
+    )
+    def test_matches_pydantic_serialization(self, content: Any) -> None:
+        if isinstance(content, list):
+            expected: Any = [item.model_dump(mode='json') for item in content]
+        elif isinstance(content, dict):
+            expected = {str(key): [item.model_dump(mode='json') for item in items] for key, items in content.items()}
+        else:
+            expected = content.model_dump(mode='json')
+        assert json.loads(FastJSONResponse(content).body) == expected
+
+    def test_rejects_unknown_types(self) -> None:
+        with pytest.raises(TypeError):
+            FastJSONResponse({'value': object()})
+
+
+class TestMsgPackResponse:
+    def test_matches_json_content(self) -> None:
+        page: CallListPage = CallListPage(
+            items=[CallListItem.construct_trusted(id=1, name='call', created_at=CREATED_AT, updated_at=CREATED_AT, description=None, tags=[make_tag(1)])],
+            next_cursor=None,
+        )
+        decoded: Any = msgpack.unpackb(MsgPackResponse(page).body, timestamp=3)
+
+        assert decoded['items'][0]['created_at'] == CREATED_AT.replace(tzinfo=timezone.utc)
+        assert decoded['items'][0]['tags'][0]['updated_at'] == CREATED_AT.replace(tzinfo=timezone.utc)
+        assert decoded['items'][0]['tags'][0]['name'] == 'tag 1'
+        assert len(MsgPackResponse(page).body) < len(FastJSONResponse(page).body)
+
+    def test_rejects_unknown_types(self) -> None:
+        with pytest.raises(TypeError):
+            MsgPackResponse({'value': object()})
+
+
+class TestNegotiateResponseClass:
+    @pytest.mark.parametrize(
+        ('accept', 'expected'),
+        [
+            (None, FastJSONResponse),
+            ('*/*', FastJSONResponse),
+            ('application/json', FastJSONResponse),
+            ('text/html', FastJSONResponse),
+            ('application/msgpack', MsgPackResponse),
+            ('application/json;q=0.5, application/msgpack', MsgPackResponse),
+            ('application/msgpack;q=0.5, application/json', FastJSONResponse),
+            ('application/msgpack;q=0, */*', FastJSONResponse),
+        ],
+        ids=['missing', 'any', 'json', 'unsupported', 'msgpack', 'msgpack_preferred', 'json_preferred', 'msgpack_refused'],
+    )
+    def test_picks_highest_quality(self, accept: str | None, expected: type) -> None:
+        assert negotiate_response_class(accept) is expected
@@ -0,0 +1,15 @@
+import pytest
+
+from src.utils.search import to_fts5_match_query
+
+
+class TestFts5MatchQuery:
+    @pytest.mark.parametrize('query, expected', [
+        ('fire', '"fire"'),
+        ('kitchen  fire', '"kitchen" "fire"'),
+        ('"fire" OR -smoke*', '"fire" "OR" "smoke"'),
+        ('Café 42', '"Café" "42"'),
+        ('?!', ''),
+    ], ids=['single_word', 'many_words', 'operators', 'unicode', 'punctuation_only'])
+    def test_quotes_every_word(self, query: str, expected: str) -> None:
+        assert to_fts5_match_query(query) == expected
@@ -1,6 +1,20 @@
 import { api } from './client'
+import { MAX_CALL_IDS_PER_REQUEST } from '../constants/api'
 import type { CallTask, TaskStatus } from '../types/task'
 
+export const fetchTasksForCalls = async (callIds: number[]): Promise<Record<number, CallTask[]>> => {
+  const tasks: Record<number, CallTask[]> = {}
+  for (let start = 0; start < callIds.length; start += MAX_CALL_IDS_PER_REQUEST) {
+    const params: string = callIds
+      .slice(start, start + MAX_CALL_IDS_PER_REQUEST)
+      .map((callId) => `call_ids=${callId}`)
+      .join('&')
+    const res = await api.get<Record<number, CallTask[]>>(`/calls/tasks?${params}`)
+    Object.assign(tasks, res.data)
+  }
+  return tasks
+}
+
 export const fetchCallTasks = async (callId: number): Promise<CallTask[]> => {
   const res = await api.get<CallTask[]>(`/calls/${callId}/tasks`)
   return res.data
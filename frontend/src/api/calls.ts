@@ -1,9 +1,16 @@
 import { api } from './client'
-import type { CallListItem, CallDetail } from '../types/call'
+import type { CallListItem, CallListPage, CallDetail } from '../types/call'
 
 export const fetchCalls = async (days: number = 7): Promise<CallListItem[]> => {
-  const res = await api.get<CallListItem[]>(`/calls?days=${days}`)
-  return res.data
+  const calls: CallListItem[] = []
+  let cursor: string | null = null
+  do {
+    const cursorParam: string = cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''
+    const res: { data: CallListPage } = await api.get<CallListPage>(`/calls?days=${days}${cursorParam}`)
+    calls.push(...res.data.items)
+    cursor = res.data.next_cursor
+  } while (cursor)
+  return calls
 }
 
 export const fetchCall = async (id: number): Promise<CallDetail> => {
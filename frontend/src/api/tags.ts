@@ -1,5 +1,6 @@
 import { api } from './client'
 import type { Tag, TagWithSuggestedTasks } from '../types/tag'
+import type { SuggestedTask } from '../types/task'
 
 export const fetchTags = async (): Promise<Tag[]> => {
   const res = await api.get<Tag[]>('/tags')
@@ -37,3 +38,12 @@ export const fetchTagSuggestedTasks = async (
   )
   return res.data
 }
+
+export const fetchCallSuggestedTasks = async (
+  callId: number,
+): Promise<SuggestedTask[]> => {
+  const res = await api.get<SuggestedTask[]>(
+    `/calls/${callId}/suggested-tasks`,
+  )
+  return res.data
+}
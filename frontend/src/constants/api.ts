@@ -1,4 +1,5 @@
 const API_BASE_URL: string = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000'
 const API_PREFIX: string = '/api/v1'
+const MAX_CALL_IDS_PER_REQUEST: number = 500
 
-export { API_BASE_URL, API_PREFIX }
+export { API_BASE_URL, API_PREFIX, MAX_CALL_IDS_PER_REQUEST }
@@ -7,9 +7,9 @@ import CallTaskForm from '../components/forms/CallTaskForm'
 import ConfirmDialog from '../components/common/ConfirmDialog'
 import { useSnackbar } from '../components/layout/SnackbarContext'
 import { fetchCalls, fetchCall, createCall, updateCall } from '../api/calls'
-import { fetchCallTasks, createAdHocTask, updateCallTask, deleteCallTask } from '../api/call_tasks'
-import { fetchTemplateTasks, linkTemplateTaskToCall, unlinkTemplateTaskFromCall } from '../api/template_tasks'
-import { fetchTags, fetchTagSuggestedTasks } from '../api/tags'
+import { fetchCallTasks, fetchTasksForCalls, createAdHocTask, updateCallTask, deleteCallTask } from '../api/call_tasks'
+import { linkTemplateTaskToCall, unlinkTemplateTaskFromCall } from '../api/template_tasks'
+import { fetchTags, fetchCallSuggestedTasks } from '../api/tags'
 import type { TaskStatus } from '../types/task'
 import type { CallListItem, CallDetail } from '../types/call'
 import type { CallTask, TemplateTask } from '../types/task'
@@ -20,7 +20,7 @@ const UserPage: React.FC = () => {
   const { showAlert } = useSnackbar()
   const [calls, setCalls] = useState<CallListItem[]>([])
   const [selectedCall, setSelectedCall] = useState<CallDetail | null>(null)
-  const [callTasks, setCallTasks] = useState<CallTask[]>([])
+  const [tasksByCall, setTasksByCall] = useState<Record<number, CallTask[]>>({})
   const [suggestedTasks, setSuggestedTasks] = useState<TemplateTask[]>([])
   const [tags, setTags] = useState<Tag[]>([])
   const [days, setDays] = useState<number>(7)
@@ -45,34 +45,52 @@ const UserPage: React.FC = () => {
       .finally(() => setIsLoadingCalls(false))
   }, [days])
 
+  const callTasks: CallTask[] = selectedCall ? tasksByCall[selectedCall.id] ?? [] : []
+
   useEffect(() => {
-    if (selectedCall) {
-      setIsLoadingCallTasks(true)
-      fetchCallTasks(selectedCall.id)
-        .then(setCallTasks)
-        .finally(() => setIsLoadingCallTasks(false))
-    } else {
-      setCallTasks([])
+    if (calls.length === 0) {
+      setTasksByCall({})
+      return
     }
-  }, [selectedCall])
+    let cancelled = false
+    setIsLoadingCallTasks(true)
+    fetchTasksForCalls(calls.map((call) => call.id))
+      .then((tasks) => {
+        if (!cancelled) setTasksByCall(tasks)
+      })
+      .finally(() => {
+        if (!cancelled) setIsLoadingCallTasks(false)
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [calls])
+
+  useEffect(() => {
+    if (!selectedCall || isLoadingCallTasks || selectedCall.id in tasksByCall) return
+    const callId = selectedCall.id
+    setIsLoadingCallTasks(true)
+    fetchCallTasks(callId)
+      .catch(() => {
+        showAlert('error', 'Failed to fetch call tasks.')
+        return []
+      })
+      .then((tasks) => setTasksByCall((prev) => ({ ...prev, [callId]: tasks })))
+      .finally(() => setIsLoadingCallTasks(false))
+  }, [selectedCall, tasksByCall, isLoadingCallTasks, showAlert])
+
+  const refreshSuggestedTasks = async (call: CallDetail) => {
+    const tasks = await fetchCallSuggestedTasks(call.id)
+    setSuggestedTasks(tasks.map((task) => ({
+      ...task,
+      tags: call.tags.filter((tag) => task.matched_tag_ids.includes(tag.id)),
+    })))
+  }
 
   useEffect(() => {
     if (selectedCall && selectedCall.tags && selectedCall.tags.length > 0) {
       setIsLoadingSuggestedTasks(true)
-      Promise.all(selectedCall.tags.map((tag) => fetchTagSuggestedTasks(tag.id)))
-        .then((tagWithTasks) => {
-          const taskIds = new Set<number>()
-          tagWithTasks.forEach((tagData) => {
-            tagData.suggested_tasks.forEach((task) => {
-              taskIds.add(task.id)
-            })
-          })
-          
-          return fetchTemplateTasks().then((allTemplateTasks) => {
-            const suggestedTemplateTasks = allTemplateTasks.filter((task) => taskIds.has(task.id))
-            setSuggestedTasks(suggestedTemplateTasks)
-          })
-        })
+      refreshSuggestedTasks(selectedCall)
         .finally(() => setIsLoadingSuggestedTasks(false))
     } else {
       setSuggestedTasks([])
@@ -110,7 +128,7 @@ const UserPage: React.FC = () => {
     if (!selectedCall) return
     try {
       await linkTemplateTaskToCall(task.id, selectedCall.id)
-      await refreshCallTasks()
+      await Promise.all([refreshCallTasks(), refreshSuggestedTasks(selectedCall)])
       showAlert('success', `Task '${task.name}' added to call successfully!`)
     } catch (error) {
       showAlert('error', 'Failed to add task to call.')
@@ -131,8 +149,9 @@ const UserPage: React.FC = () => {
 
   const refreshCallTasks = async () => {
     if (!selectedCall) return
-    const updatedCallTasks = await fetchCallTasks(selectedCall.id)
-    setCallTasks(updatedCallTasks)
+    const callId = selectedCall.id
+    const updatedCallTasks = await fetchCallTasks(callId)
+    setTasksByCall((prev) => ({ ...prev, [callId]: updatedCallTasks }))
   }
 
   const handleCallSubmit = async (name: string, description: string | null, tagIds: number[]) => {
@@ -173,6 +192,7 @@ const UserPage: React.FC = () => {
         try {
           if (task.type === 'template') {
             await unlinkTemplateTaskFromCall(task.id, selectedCall.id)
+            await refreshSuggestedTasks(selectedCall)
             showAlert('success', `Task '${task.name}' removed from call successfully!`)
           } else {
             await deleteCallTask(task.id)
@@ -13,6 +13,11 @@ export interface CallListItem extends BaseCall {
   tags: Tag[]
 }
 
+export interface CallListPage {
+  items: CallListItem[]
+  next_cursor: string | null
+}
+
 export interface CallDetail extends BaseCall {
   tags: Tag[]
   tasks: Task[]
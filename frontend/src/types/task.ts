@@ -19,6 +19,10 @@ export interface TemplateTask extends BaseTask {
   tags: Tag[]
 }
 
+export interface SuggestedTask extends BaseTask {
+  matched_tag_ids: number[]
+}
+
 export interface CallTask extends BaseTask {
   call_id: number
   status: TaskStatus